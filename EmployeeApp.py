@@ -11,33 +11,147 @@ Controller responsibilities:
 - Process user input and update views accordingly
 """
 
-from employee import Employee, Manager
-from EmployeeData import load_employees_from_csv, save_employees_to_csv
+from employee import Employee, Manager, sanitize_phone
+from EmployeeData import employee_to_row, iter_employees_from_csv
+from EmployeeRoster import EmployeeRoster
+from EmployeeStats import instrumented, timed_method
+from EmployeeStorage import open_storage
+from EmployeeWriter import FULL_SAVE, JOURNAL_APPEND, MAX_PENDING_SAVES, BackgroundWriter, SaveJob
 from EmployeeView import (
-    display_menu, get_menu_choice, get_employee_data, display_employees,
-    display_employee_details, show_message, confirm_action, get_employee_index,
-    pause_for_user
+    PAGE_SIZE, display_menu, get_menu_choice, get_employee_data,
+    browse_employees, display_employee_details, show_message, confirm_action,
+    get_employee_index, get_query_options, pause_for_user
 )
 
 
+# Fields that update_employee may change
+EMPLOYEE_FIELDS = ('fname', 'lname', 'department', 'ph_number')
+MANAGER_FIELDS = EMPLOYEE_FIELDS + ('team_size', 'office_number')
+
+# Operations accepted by apply_batch
+BATCH_OPERATIONS = ('create', 'edit', 'delete')
+
+
+@instrumented
 class EmployeeController:
     """
     Main controller class that manages the Employee Management System.
 
+    The controller may be shared between threads: changes are serialized,
+    while lookups and listings never wait for them (see EmployeeRoster).
+
     Attributes:
         employees (list): List of Employee and Manager objects
-        filename (str): Current CSV filename being used
+        filename (str): Current data file; names ending in '.snap' use the
+            binary snapshot format and '.db', '.sqlite' or '.sqlite3' an
+            SQLite database instead of CSV (see EmployeeStorage)
     """
 
-    def __init__(self, filename="employee_data.csv"):
+    def __init__(self, filename="employee_data.csv", sync_every=1, sync_interval=None, unique_phones=False,
+                 page_size=PAGE_SIZE, async_saves=False, max_pending_saves=MAX_PENDING_SAVES, storage=None,
+                 lazy=False, cache_size=None):
         """
         Initialize the controller with an empty employee list.
 
         Args:
             filename (str): Default CSV filename to use
+            sync_every (int): Journal entries per fsync (group commit); 1 syncs every save
+            sync_interval (float, optional): Maximum seconds between journal fsyncs
+            unique_phones (bool): Reject creates and edits that reuse another employee's phone number
+            page_size (int): Employees per page when displaying the roster
+            async_saves (bool): Write saves on a background thread; call flush()
+                to wait for them
+            max_pending_saves (int): Queued background saves after which
+                save_employees waits for the writer
+            storage (str, optional): 'csv', 'snapshot' or 'sqlite' to choose the
+                storage back end regardless of the file extension
+            lazy (bool): Load a CSV file lazily (see load_employees)
+            cache_size (int, optional): Employees kept built during a lazy load;
+                None for EmployeeLazy.LAZY_CACHE_SIZE
+
+        Raises:
+            ValueError: If storage or sync_every is invalid
         """
-        self.employees = []
+        # ID -> Employee/Manager in insertion order, so listings are stable, plus secondary indexes
+        self._employee_roster = EmployeeRoster(unique_phones)
         self.filename = filename
+        self.page_size = page_size
+        self.lazy = lazy
+        self.cache_size = cache_size
+        # LazyEmployees while a lazy load has not been completed
+        self._lazy = None
+
+        # Changes since the last save: new employees, and ID -> employee
+        # (None for deleted) for records already on disk
+        self._pending_appends = {}
+        self._pending_changes = {}
+        self._storage = open_storage(filename, storage, sync_every, sync_interval)
+        # Changes saved since the main file was last rewritten (journal entries for CSV and snapshots)
+        self._journal_entries = 0
+        # Until a load succeeds the file contents are unknown, so the first save rewrites it
+        self._needs_full_save = True
+        self._writer = BackgroundWriter(self._write_job, max_pending_saves) if async_saves else None
+
+    @property
+    def _roster(self):
+        """EmployeeRoster: All employees, first completing a lazy load."""
+        if self._lazy is not None:
+            self._load_all()
+        return self._employee_roster
+
+    @property
+    def employees(self):
+        """Get employees as a list in insertion order."""
+        return self._roster.slice()
+
+    @employees.setter
+    def employees(self, employees):
+        """
+        Replace all employees and rebuild the ID index.
+
+        Args:
+            employees (list): Employee and Manager objects
+
+        Raises:
+            ValueError: If two employees share the same ID, or the same phone
+                number when phone numbers must be unique
+        """
+        with self._employee_roster.lock:
+            self._employee_roster.reset(employees)
+            if self._lazy is not None:
+                self._lazy.close()
+                self._lazy = None
+
+            # The file no longer matches memory; the next save rewrites it
+            self._pending_appends = {}
+            self._pending_changes = {}
+            self._needs_full_save = True
+
+    def iter_employees(self):
+        """
+        Iterate over a snapshot of the employees in insertion order without
+        copying the list.
+
+        Returns:
+            iterator: Employee/Manager objects; later changes are not seen
+        """
+        return iter(self._roster.snapshot())
+
+    def list_employees(self, offset=0, limit=None):
+        """
+        Get a page of employees in insertion order.
+
+        Unlike iter_employees, this takes no snapshot, so the next change
+        does not have to copy the roster.
+
+        Args:
+            offset (int): Number of employees to skip
+            limit (int, optional): Maximum number to return; None for all
+
+        Returns:
+            list: Employee/Manager objects
+        """
+        return self._roster.slice(offset, None if limit is None else offset + limit)
 
     def run(self):
         """
@@ -88,7 +202,7 @@ class EmployeeController:
                 return
 
             # Check for duplicate ID
-            if self.find_employee_by_id(data['id']):
+            if self.find_employee_by_id(data['id']) is not None:
                 show_message(f"Employee with ID '{data['id']}' already exists!", "error")
                 return
 
@@ -105,8 +219,8 @@ class EmployeeController:
                     data['department'], data['ph_number']
                 )
 
-            # Add to list
-            self.employees.append(new_employee)
+            # Add to collection
+            self.add_employee(new_employee)
 
             # Auto-save
             self.save_employees()
@@ -125,60 +239,64 @@ class EmployeeController:
         """
         Handle editing an existing employee.
         """
-        if not self.employees:
+        if not self._roster:
             show_message("No employees found. Please create an employee first.", "info")
             pause_for_user()
             return
 
         try:
-            # Display current employees
-            display_employees(self.employees, "Select Employee to Edit")
+            # Page through current employees
+            employees = self.employees
+            browse_employees(employees, "Select Employee to Edit", self.page_size)
 
             # Get employee selection
-            index = get_employee_index(len(self.employees))
+            index = get_employee_index(len(employees))
             if index is None:
                 show_message("Edit cancelled.", "info")
                 pause_for_user()
                 return
 
-            employee = self.employees[index]
+            employee = employees[index]
             is_manager = isinstance(employee, Manager)
 
-            show_message(f"Editing {'Manager' if is_manager else 'Employee'}: {employee.fname} {employee.lname}", "info")
+            show_message(f"Editing {'Manager' if is_manager else 'Employee'}: {employee.display_name}", "info")
             display_employee_details(employee, index)
 
             # Get new data (allow empty values to keep current)
             print("\nEnter new values (press Enter to keep current value):")
+            changes = {}
 
             # Get new first name
             new_fname = input(f"First Name ({employee.fname}): ").strip()
             if new_fname:
-                employee.fname = new_fname
+                changes['fname'] = new_fname
 
             # Get new last name
             new_lname = input(f"Last Name ({employee.lname}): ").strip()
             if new_lname:
-                employee.lname = new_lname
+                changes['lname'] = new_lname
 
             # Get new department
             new_dept = input(f"Department ({employee.department}): ").strip()
             if new_dept:
-                employee.department = new_dept
+                changes['department'] = new_dept
 
             # Get new phone number
             new_phone = input(f"Phone Number ({employee.ph_number}): ").strip()
             if new_phone:
-                employee.ph_number = new_phone
+                changes['ph_number'] = new_phone
 
             # Manager-specific fields
             if is_manager:
                 new_team_size = input(f"Team Size ({employee.team_size}): ").strip()
                 if new_team_size:
-                    employee.team_size = int(new_team_size)
+                    changes['team_size'] = int(new_team_size)
 
                 new_office = input(f"Office Number ({employee.office_number}): ").strip()
                 if new_office:
-                    employee.office_number = new_office
+                    changes['office_number'] = new_office
+
+            employee = self.update_employee(employee.id, **changes)
 
             # Auto-save
             self.save_employees()
@@ -197,32 +315,33 @@ class EmployeeController:
         """
         Handle deleting an existing employee.
         """
-        if not self.employees:
+        if not self._roster:
             show_message("No employees found.", "info")
             pause_for_user()
             return
 
         try:
-            # Display current employees
-            display_employees(self.employees, "Select Employee to Delete")
+            # Page through current employees
+            employees = self.employees
+            browse_employees(employees, "Select Employee to Delete", self.page_size)
 
             # Get employee selection
-            index = get_employee_index(len(self.employees))
+            index = get_employee_index(len(employees))
             if index is None:
                 show_message("Delete cancelled.", "info")
                 pause_for_user()
                 return
 
-            employee = self.employees[index]
+            employee = employees[index]
 
             # Confirm deletion
-            if confirm_action(f"delete {employee.fname} {employee.lname} (ID: {employee.id})"):
-                deleted_employee = self.employees.pop(index)
+            if confirm_action(f"delete {employee.display_name} (ID: {employee.id})"):
+                deleted_employee = self.remove_employee(employee.id)
 
                 # Auto-save
                 self.save_employees()
 
-                show_message(f"Employee '{deleted_employee.fname} {deleted_employee.lname}' deleted successfully!", "success")
+                show_message(f"Employee '{deleted_employee.display_name}' deleted successfully!", "success")
             else:
                 show_message("Delete cancelled.", "info")
 
@@ -233,47 +352,201 @@ class EmployeeController:
 
     def display_employees(self):
         """
-        Handle displaying all employees.
+        Handle displaying all employees, or those matching a query.
         """
-        if not self.employees:
+        if not self._roster:
             show_message("No employees found.", "info")
-        else:
-            display_employees(self.employees, f"All Employees ({len(self.employees)} total)")
+            pause_for_user()
+            return
 
-            # Offer to show details for specific employee
-            if len(self.employees) > 0:
-                show_details = input("\nShow details for specific employee? (y/n): ").strip().lower()
-                if show_details in ['y', 'yes']:
-                    index = get_employee_index(len(self.employees))
-                    if index is not None:
-                        display_employee_details(self.employees[index], index)
+        criteria = get_query_options()
+        if criteria is None:
+            return
+        if criteria:
+            try:
+                # Read as the pages are viewed, so it needs a snapshot
+                employees = self._roster.snapshot().query(**criteria)
+            except ValueError as e:
+                show_message(f"Invalid query: {e}", "error")
+                pause_for_user()
+                return
+            title = "Matching Employees"
+        else:
+            # A list needs no snapshot, so the next change does not copy the roster
+            employees = self.employees
+            title = f"All Employees ({len(employees)} total)"
+        pages = browse_employees(employees, title, self.page_size)
+
+        # Offer to show details for specific employee
+        if pages.loaded:
+            show_details = input("\nShow details for specific employee? (y/n): ").strip().lower()
+            if show_details in ['y', 'yes']:
+                index = get_employee_index(pages.loaded)
+                if index is not None:
+                    display_employee_details(pages.employee(index), index)
 
         pause_for_user()
 
+    @timed_method('controller.load')
     def load_employees(self):
         """
-        Load employees from CSV file.
+        Load employees from the data file (replaying the journal of a CSV or snapshot file).
+
+        With lazy=True a CSV file is only indexed by ID: find_employee_by_id
+        builds and validates employees as they are asked for, keeping up to
+        cache_size of them. Anything else that needs the whole roster
+        (listings, queries, changes) loads it in full the first time; an
+        invalid row is reported then, and the roster is left empty.
+
+        Returns:
+            bool: False if the file exists but could not be loaded
         """
         try:
-            self.employees = load_employees_from_csv(self.filename)
-            if self.employees:
-                show_message(f"Loaded {len(self.employees)} employees from '{self.filename}'", "success")
+            # Queued background saves must be on disk before the file is read
+            self.flush()
+            lazy = self._storage.open_lazy(self.cache_size) if self.lazy else None
+            if lazy is not None:
+                employees, journal_entries = [], lazy.journal_entries
+            else:
+                employees, journal_entries = self._storage.load()
+            with self._employee_roster.lock:
+                self.employees = employees
+                self._lazy = lazy
+                self._journal_entries = journal_entries
+                self._needs_full_save = False
+            if lazy is not None:
+                show_message(f"Indexed {len(lazy)} employees in '{self.filename}'", "success")
+            elif self._roster:
+                show_message(f"Loaded {len(self._roster)} employees from '{self.filename}'", "success")
             else:
                 show_message(f"No existing data found in '{self.filename}'. Starting fresh.", "info")
         except FileNotFoundError:
             show_message(f"No existing file '{self.filename}' found. Starting with empty database.", "info")
         except Exception as e:
             show_message(f"Error loading employees: {e}", "error")
+            return False
+        return True
+
+    def _load_all(self):
+        """
+        Complete a lazy load, keeping the employees already handed out.
+
+        Rows are only validated here, so an invalid one is reported like a
+        failed eager load: the roster stays empty and the lazy index is
+        dropped, so this is not retried on every access.
+        """
+        with self._employee_roster.lock:
+            lazy = self._lazy
+            if lazy is None:
+                return
+            try:
+                employees, journal_entries = self._storage.load()
+            except Exception as e:
+                show_message(f"Error loading employees: {e}", "error")
+                self._lazy = None
+                lazy.close()
+                return
+            handed_out = lazy.handed_out()
+            self._employee_roster.reset([handed_out.get(employee.id, employee) for employee in employees])
+            self._journal_entries = journal_entries
+            self._lazy = None
+            lazy.close()
 
+    @timed_method('controller.save')
     def save_employees(self):
         """
-        Save employees to CSV file.
+        Save changes made since the last save to the data file.
+
+        Only creates, edits and deletes are written (appended to the journal,
+        or as row changes in an SQLite database), so the cost depends on the
+        number of changes. A CSV or snapshot file is only rewritten,
+        atomically, when the journal is due for compaction or the file
+        contents are unknown. With async_saves the write happens on the
+        background writer thread and this returns once it is queued.
         """
         try:
-            save_employees_to_csv(self.employees, self.filename)
+            self._persist()
         except Exception as e:
             show_message(f"Error saving employees: {e}", "error")
 
+    def _persist(self, transaction=False):
+        """
+        Save pending changes, or rewrite the whole data file.
+
+        With async_saves the write is queued for the writer thread, with
+        copies of the employees so later edits do not leak into it.
+
+        Args:
+            transaction (bool): Save the changes all together or not at all
+
+        Raises:
+            IOError: If unable to write, or an earlier background save failed
+        """
+        if self._lazy is not None:
+            # Nothing can have changed: every change completes the load first
+            return
+        with self._roster.lock:
+            changes = {**self._pending_changes, **self._pending_appends}
+
+            if self._needs_full_save or self._storage.should_compact(
+                    self._journal_entries + len(changes), len(self._roster)):
+                job = SaveJob(FULL_SAVE, employees=self.employees)
+            elif changes:
+                job = SaveJob(JOURNAL_APPEND, changes=changes, transaction=transaction)
+            else:
+                return
+
+            if self._writer is None:
+                self._write_job(job)
+            else:
+                job.employees = job.employees and [employee.copy() for employee in job.employees]
+                job.changes = job.changes and {emp_id: employee and employee.copy()
+                                               for emp_id, employee in job.changes.items()}
+                try:
+                    self._writer.submit(job)
+                except IOError:
+                    # An earlier queued save was lost, so rewrite everything next time
+                    self._needs_full_save = True
+                    raise
+
+            if job.kind == FULL_SAVE:
+                self._journal_entries = 0
+                self._needs_full_save = False
+            else:
+                self._journal_entries += len(changes)
+            self._pending_appends = {}
+            self._pending_changes = {}
+
+    def _write_job(self, job):
+        """
+        Perform a save (on the writer thread with async_saves).
+
+        Args:
+            job (SaveJob): Full save or journal append
+
+        Raises:
+            IOError: If unable to write
+        """
+        if job.kind == FULL_SAVE:
+            self._storage.save_all(job.employees)
+        else:
+            self._storage.save_changes(job.changes, job.transaction)
+
+    def flush(self):
+        """
+        Wait until every save has been written (only needed with async_saves).
+
+        Raises:
+            IOError: If a background save failed
+        """
+        if self._writer is not None:
+            try:
+                self._writer.flush()
+            except IOError:
+                self._needs_full_save = True
+                raise
+
+    @timed_method('controller.find')
     def find_employee_by_id(self, emp_id):
         """
         Find an employee by ID.
@@ -283,24 +556,441 @@ class EmployeeController:
 
         Returns:
             Employee/Manager object if found, None otherwise
+
+        Raises:
+            ValueError: If a lazily loaded employee's row is invalid
+        """
+        lazy = self._lazy
+        employee = self._employee_roster.by_id.get(emp_id)
+        if employee is None and lazy is not None:
+            employee = lazy.get(emp_id)
+            if employee is None:
+                # The load may have been completed, and the lazy index closed, meanwhile
+                employee = self._employee_roster.by_id.get(emp_id)
+        return employee
+
+    @timed_method('controller.create')
+    def add_employee(self, employee):
+        """
+        Add an employee to the collection and the ID index.
+
+        Args:
+            employee: Employee or Manager object to add
+
+        Raises:
+            ValueError: If an employee with the same ID already exists, or
+                phone numbers must be unique and this one is in use
+        """
+        with self._roster.lock:
+            self._roster.add(employee)
+
+            if employee.id in self._pending_changes:
+                # Deleted and re-created since the last save: still in the file
+                self._pending_changes[employee.id] = employee
+            else:
+                self._pending_appends[employee.id] = employee
+
+    @timed_method('controller.delete')
+    def remove_employee(self, emp_id):
+        """
+        Remove an employee from the collection and the ID index.
+
+        Args:
+            emp_id (str): Employee ID to remove
+
+        Returns:
+            Employee/Manager object that was removed, None if not found
+        """
+        with self._roster.lock:
+            employee = self._roster.remove(emp_id)
+            if employee is not None:
+                if emp_id in self._pending_appends:
+                    # Never reached the file, so there is nothing to delete
+                    del self._pending_appends[emp_id]
+                else:
+                    self._pending_changes[emp_id] = None
+        return employee
+
+    @timed_method('controller.edit')
+    def update_employee(self, emp_id, **changes):
+        """
+        Edit fields of an employee through their validating setters.
+
+        The edit is atomic: the fields are set on a copy, and only once all
+        of them are valid does the copy replace the employee. Anyone holding
+        the old object keeps seeing the old values.
+
+        Args:
+            emp_id (str): Employee ID to edit
+            **changes: New values for fname, lname, department, ph_number,
+                and for managers team_size and office_number
+
+        Returns:
+            Employee/Manager object that replaced the old one
+
+        Raises:
+            ValueError: If the employee doesn't exist, a field can't be edited,
+                a value fails validation, or the phone number is already in use
+        """
+        # Held from reading the employee to replacing it, so no other edit is lost
+        with self._roster.lock:
+            employee = self._roster.by_id.get(emp_id)
+            if employee is None:
+                raise ValueError(f"Employee with ID '{emp_id}' not found")
+
+            editable = MANAGER_FIELDS if isinstance(employee, Manager) else EMPLOYEE_FIELDS
+            edited = employee.copy()
+            for field, value in changes.items():
+                if field not in editable:
+                    raise ValueError(f"Cannot edit field '{field}'")
+                setattr(edited, field, value)
+
+            self._replace_employee(edited)
+        return edited
+
+    def mark_employee_changed(self, emp_id):
+        """
+        Record that an employee was edited in place so the next save writes
+        it, and update the secondary indexes.
+
+        Args:
+            emp_id (str): Employee ID that was edited
+
+        Readers may see the object while it is being edited; use
+        update_employee to change fields atomically.
+
+        Raises:
+            ValueError: If phone numbers must be unique and the new one is in use
+        """
+        with self._roster.lock:
+            employee = self._roster.by_id.get(emp_id)
+            if employee is None:
+                return
+
+            # New employees are journaled with their current values anyway
+            if emp_id not in self._pending_appends:
+                self._pending_changes[emp_id] = employee
+            self._roster.reindex(emp_id)
+
+    @timed_method('controller.batch')
+    def apply_batch(self, operations, atomic=True):
+        """
+        Apply create, edit and delete operations and save them once.
+
+        Each operation is a dict with an 'op' key ('create', 'edit' or
+        'delete') and an 'id'. Creates take fname, lname, department,
+        ph_number and, with employee_type 'M', team_size and office_number;
+        edits take any of the fields update_employee accepts. Operations go
+        through the same validation as the menu, and one that fails changes
+        nothing.
+
+        The changes are journaled as a single transaction, so after a crash
+        either all of them or none are replayed.
+
+        Args:
+            operations (iterable): Operation dicts, applied in order
+            atomic (bool): If any operation fails, undo them all and save
+                nothing; otherwise save the ones that succeeded
+
+        Returns:
+            list: One result dict per operation with 'op', 'id', 'status'
+                ('ok', 'error', or 'rolled_back' when an atomic batch failed)
+                and 'error' for failures
+
+        Raises:
+            IOError: If unable to save; the batch is undone
+            Exception: Anything raised while iterating operations; the batch is undone
+        """
+        with self._roster.lock:
+            return self._apply_batch(operations, atomic)
+
+    def _apply_batch(self, operations, atomic):
+        """Apply a batch with the roster lock held; see apply_batch."""
+        checkpoint = {
+            'pending_appends': dict(self._pending_appends),
+            'pending_changes': dict(self._pending_changes),
+            'needs_full_save': self._needs_full_save,
+        }
+        results = []
+
+        self._roster.record_changes()
+        try:
+            for operation in operations:
+                result = {'op': None, 'id': None}
+                try:
+                    if not isinstance(operation, dict):
+                        raise ValueError("Operation must be an object")
+                    result['op'], result['id'] = operation.get('op'), operation.get('id')
+                    self._apply_operation(operation)
+                    result['status'] = 'ok'
+                except ValueError as e:
+                    result['status'] = 'error'
+                    result['error'] = str(e)
+                results.append(result)
+
+            failed = any(result['status'] == 'error' for result in results)
+            if atomic and failed:
+                self._rollback(checkpoint)
+                for result in results:
+                    if result['status'] == 'ok':
+                        result['status'] = 'rolled_back'
+            else:
+                self._persist(transaction=True)
+                self.flush()
+        except BaseException:
+            self._rollback(checkpoint)
+            raise
+        finally:
+            self._roster.stop_recording()
+
+        return results
+
+    def apply_operation(self, operation):
+        """
+        Apply one create, edit or delete operation and save it.
+
+        Unlike apply_batch this records nothing to roll back, and the change
+        is journaled on its own. With async_saves the save is only queued;
+        call flush() to wait for it.
+
+        Args:
+            operation (dict): Operation, as described in apply_batch
+
+        Raises:
+            ValueError: If the operation is malformed or fails validation;
+                nothing is changed
+            IOError: If an earlier background save failed; the change is kept
+                and written by the next save
+        """
+        with self._roster.lock:
+            self._apply_operation(operation)
+            self._persist()
+
+    def _apply_operation(self, operation):
         """
-        for employee in self.employees:
-            if employee.id == emp_id:
-                return employee
-        return None
+        Apply one batch operation, leaving everything unchanged if it fails.
+
+        Args:
+            operation (dict): Operation, as described in apply_batch
+
+        Raises:
+            ValueError: If the operation is malformed or fails validation
+        """
+        fields = {key: value for key, value in operation.items() if key not in ('op', 'id')}
+        op, emp_id = operation.get('op'), operation.get('id')
+        if op not in BATCH_OPERATIONS:
+            raise ValueError(f"op must be one of {BATCH_OPERATIONS}, got {op!r}")
+        if not isinstance(emp_id, str) or not emp_id:
+            raise ValueError("id is required")
+
+        employee_type = fields.pop('employee_type', 'E') if op == 'create' else None
+        for field, value in fields.items():
+            if not isinstance(value, int if field == 'team_size' else str):
+                raise ValueError(f"Invalid value for {field}: {value!r}")
+
+        if op == 'create':
+            if employee_type not in ('E', 'M'):
+                raise ValueError(f"employee_type must be 'E' or 'M', got {employee_type!r}")
+            allowed = MANAGER_FIELDS if employee_type == 'M' else EMPLOYEE_FIELDS
+            unknown = sorted(set(fields) - set(allowed))
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            missing = [field for field in allowed if field not in fields]
+            if missing:
+                raise ValueError(f"Missing fields: {', '.join(missing)}")
+            self.add_employee((Manager if employee_type == 'M' else Employee)(emp_id, **fields))
+
+        elif op == 'edit':
+            self.update_employee(emp_id, **fields)
+
+        elif self.remove_employee(emp_id) is None:
+            raise ValueError(f"Employee with ID '{emp_id}' not found")
+
+    def _rollback(self, checkpoint):
+        """Undo everything apply_batch changed since the checkpoint."""
+        self._roster.rollback()
+        self._pending_appends = checkpoint['pending_appends']
+        self._pending_changes = checkpoint['pending_changes']
+        self._needs_full_save = checkpoint['needs_full_save']
+
+    @timed_method('controller.merge')
+    def merge_employees_from_csv(self, filename, rejects=None):
+        """
+        Upsert the employees of a CSV file into the roster by ID and save.
+
+        The file is streamed, so only the roster has to fit in memory (see
+        EmployeeMerge.merge_csv_files when it does not). New IDs are added,
+        existing employees are replaced in place (including a change between
+        Employee and Manager), and identical rows are skipped so they are not
+        written again. Invalid rows, and rows whose phone number is already
+        in use when phone numbers must be unique, are rejected.
+
+        Args:
+            filename (str): CSV file to merge
+            rejects (list, optional): Receives (line_number, row, message) for
+                each rejected row; the line number is None for phone conflicts
+
+        Returns:
+            dict: inserted, updated, unchanged and rejected counts
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            IOError: If unable to save
+        """
+        # Imported here so startup does not pay for the merge machinery
+        from EmployeeMerge import RejectCounter, new_merge_counts, row_values
+
+        counts = new_merge_counts()
+        reject_counter = RejectCounter(counts, rejects)
+
+        with self._roster.lock:
+            for employee in iter_employees_from_csv(filename, "collect", reject_counter):
+                current = self._roster.by_id.get(employee.id)
+                try:
+                    if current is None:
+                        self.add_employee(employee)
+                        counts['inserted'] += 1
+                    elif row_values(current) == row_values(employee):
+                        counts['unchanged'] += 1
+                    else:
+                        self._replace_employee(employee)
+                        counts['updated'] += 1
+                except ValueError as e:
+                    reject_counter.append((None, employee_to_row(employee), str(e)))
+
+            self._persist(transaction=True)
+            self.flush()
+        return counts
+
+    def _replace_employee(self, employee):
+        """
+        Swap in a new object for an existing employee, keeping its position.
+
+        Raises:
+            ValueError: If phone numbers must be unique and the new one is in use
+        """
+        with self._roster.lock:
+            self._roster.replace(employee)
+
+            if employee.id in self._pending_appends:
+                self._pending_appends[employee.id] = employee
+            else:
+                self._pending_changes[employee.id] = employee
+
+    def query(self, department=None, employee_type=None, last_name=None, sort=None, descending=False,
+              fields=None, limit=None):
+        """
+        Query a snapshot of the roster, using the secondary indexes where they help.
+
+        Args:
+            department (str, optional): Only employees in this department
+            employee_type (str, optional): 'E' for employees only or 'M' for managers only
+            last_name (str, optional): Only last names starting with this (case-insensitive)
+            sort (str, optional): Field to order by (see EmployeeQuery.QUERY_FIELDS)
+            descending (bool): Order from highest to lowest
+            fields (list, optional): Yield dicts with these fields instead of the objects
+            limit (int, optional): Maximum number of results
+
+        Returns:
+            generator: Employee/Manager objects, or dicts when fields is given;
+                changes made while consuming it are not seen
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        return self._roster.snapshot().query(department, employee_type, last_name, sort=sort,
+                                             descending=descending, fields=fields, limit=limit)
+
+    def find_employees_by_department(self, department):
+        """
+        Find everyone in a department.
+
+        Args:
+            department (str): Department code
+
+        Returns:
+            list: Employee/Manager objects ordered by ID
+        """
+        with self._roster.reading() as roster:
+            return roster.in_department(department)
+
+    def find_employees_by_last_name(self, prefix):
+        """
+        Find everyone whose last name starts with a prefix (case-insensitive).
+
+        Args:
+            prefix (str): Start of the last name
+
+        Returns:
+            list: Employee/Manager objects ordered by last name
+        """
+        with self._roster.reading() as roster:
+            return roster.with_last_name_prefix(prefix)
+
+    def find_employees_by_phone(self, phone):
+        """
+        Find everyone with a phone number.
+
+        Args:
+            phone (str): Phone number (can be formatted)
+
+        Returns:
+            list: Employee/Manager objects ordered by ID (at most one when
+                phone numbers are unique)
+        """
+        digits = sanitize_phone(phone)
+        if digits is None:
+            return []
+        with self._roster.reading() as roster:
+            return roster.with_phone(digits)
+
+    def close(self):
+        """
+        Wait for background saves, then close the storage (syncing the
+        journal) so every saved change is on disk.
+
+        Raises:
+            IOError: If a background save failed
+        """
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._storage.close()
 
     def quit_application(self):
         """
         Handle application shutdown.
         """
         if confirm_action("quit the application"):
-            # Final save
+            # Final save, then wait for it to reach the disk
             self.save_employees()
+            try:
+                self.flush()
+                self.close()
+            except IOError as e:
+                show_message(f"Error saving employees: {e}", "error")
             show_message("Thank you for using the Employee Management System!", "info")
         else:
             show_message("Returning to main menu.", "info")
 
 
 if __name__ == "__main__":
-    controller = EmployeeController()
-    controller.run()
\ No newline at end of file
+    import os
+    import sys
+    import EmployeeStats
+
+    # EMPLOYEE_STATS=stats.json records timings for the session and writes them on exit
+    stats_file = os.environ.get("EMPLOYEE_STATS")
+    if stats_file:
+        EmployeeStats.enable()
+
+    # --lazy indexes the file at startup and builds employees as they are used
+    lazy = "--lazy" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--lazy"]
+    controller = EmployeeController(args[0] if args else "employee_data.csv", lazy=lazy)
+    try:
+        controller.run()
+    finally:
+        if stats_file:
+            EmployeeStats.dump(stats_file)
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Employee Management System - Batch Module
+
+This module applies create, edit and delete operations from a JSON Lines
+script without driving the interactive menu:
+- One JSON object per line; blank lines and lines starting with '#' are skipped
+- All operations are validated and applied as one transaction
+  (see EmployeeController.apply_batch) and saved once at the end
+- One JSON result per operation is written to the output
+
+Example script (managers are created with "employee_type": "M" plus
+"team_size" and "office_number"):
+    {"op": "create", "id": "E100", "fname": "Ann", "lname": "Lee", "department": "ENG", "ph_number": "5551234567"}
+    {"op": "edit", "id": "E100", "department": "FIN"}
+    {"op": "delete", "id": "E007"}
+
+Run with: python3 EmployeeBatch.py employee_data.csv changes.jsonl
+"""
+
+import argparse
+import json
+import sys
+from EmployeeApp import EmployeeController
+from EmployeeView import output_to
+
+
+def read_operations(lines):
+    """
+    Parse a JSON Lines batch script.
+
+    Args:
+        lines (iterable): Lines of the script (e.g. an open file)
+
+    Returns:
+        generator: Yields operation dicts
+
+    Raises:
+        ValueError: If a line is not valid JSON
+    """
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in batch script on line {line_num}: {e}")
+
+
+def run_batch(controller, lines, output, atomic=True):
+    """
+    Apply a batch script to a controller and write one result per operation.
+
+    Args:
+        controller (EmployeeController): Controller with its data loaded
+        lines (iterable): Lines of the batch script
+        output: Text stream that receives one JSON result per line
+        atomic (bool): Undo the whole batch if any operation fails
+
+    Returns:
+        dict: Counts of results by status
+
+    Raises:
+        ValueError: If the script is not valid JSON Lines; nothing is applied
+        IOError: If unable to save; nothing is applied
+    """
+    results = controller.apply_batch(read_operations(lines), atomic)
+
+    summary = {'ok': 0, 'error': 0, 'rolled_back': 0}
+    for result in results:
+        summary[result['status']] += 1
+    output.write("".join(json.dumps(result) + "\n" for result in results))
+    output.flush()
+    return summary
+
+
+def main():
+    """Run a batch script from the command line; exit status 1 if any operation failed."""
+    parser = argparse.ArgumentParser(description="Apply a JSON Lines batch of employee changes")
+    parser.add_argument('filename', help="data file (CSV, or .snap for a snapshot)")
+    parser.add_argument('script', help="JSON Lines batch script, or - for standard input")
+    parser.add_argument('--partial', action='store_true',
+                        help="save the operations that succeed even if others fail")
+    args = parser.parse_args()
+
+    controller = EmployeeController(args.filename)
+    try:
+        # Keep standard output for results only
+        with output_to(sys.stderr):
+            if not controller.load_employees():
+                sys.exit(2)
+
+        script = sys.stdin if args.script == '-' else open(args.script, 'r')
+        with script:
+            summary = run_batch(controller, script, sys.stdout, atomic=not args.partial)
+    except (ValueError, IOError) as e:
+        print(f"Batch failed: {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        controller.close()
+
+    print(f"{summary['ok']} applied, {summary['error']} failed, {summary['rolled_back']} rolled back",
+          file=sys.stderr)
+    if summary['error']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Employee Management System - CSV Cache Module
+
+This module keeps a pre-validated copy of a CSV roster next to it, so that
+loading an unchanged file skips parsing and validation:
+- The cache ('<file>.cache') is a binary snapshot (see EmployeeSnapshot)
+  with the CSV's key as its trailer: modification time, size and SHA-256
+  of its contents when it was parsed
+- load_csv_cached() uses the cache when the key still matches, and
+  otherwise parses the CSV and writes a new cache
+- open_cache() maps a valid cache for lookups by ID (see EmployeeLazy)
+
+The modification time and size are compared first, so a changed file is
+rejected without being hashed. A missing, stale, unreadable or corrupt cache
+is only a slower load: the CSV is parsed as before, and failing to write the
+cache (for example in a read-only directory) is ignored.
+"""
+
+import hashlib
+import os
+import struct
+from EmployeeData import load_employees_from_csv
+from EmployeeSnapshot import SnapshotReader, load_snapshot, save_snapshot
+from EmployeeStats import timed
+
+CACHE_SUFFIX = '.cache'
+
+# Trailer of a cache file: magic, CSV mtime (ns), CSV size, CSV SHA-256
+KEY = struct.Struct('<4sqq32s')
+KEY_MAGIC = b'EMPK'
+
+# Bytes hashed per read
+HASH_CHUNK = 1 << 20
+
+
+def cache_filename(filename):
+    """
+    Get the name of the cache file kept for a CSV file.
+
+    Args:
+        filename (str): CSV file name
+
+    Returns:
+        str: Cache file name
+    """
+    return f"{filename}{CACHE_SUFFIX}"
+
+
+def file_key(filename):
+    """
+    Compute the cache key of a file.
+
+    Args:
+        filename (str): File to read
+
+    Returns:
+        bytes: KEY-packed modification time, size and SHA-256 of the contents
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as datafile:
+        stat = os.fstat(datafile.fileno())
+        for chunk in iter(lambda: datafile.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return KEY.pack(KEY_MAGIC, stat.st_mtime_ns, stat.st_size, digest.digest())
+
+
+def valid_cache(filename):
+    """
+    Check whether a CSV file's cache matches the file's current contents.
+
+    Args:
+        filename (str): CSV file name
+
+    Returns:
+        bool: True if the cache exists and its key matches the file
+    """
+    try:
+        with open(cache_filename(filename), 'rb') as cachefile:
+            cachefile.seek(-KEY.size, os.SEEK_END)
+            stored = cachefile.read(KEY.size)
+        magic, mtime_ns, size, _ = KEY.unpack(stored)
+        stat = os.stat(filename)
+        if magic != KEY_MAGIC or (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+            return False
+        return file_key(filename) == stored
+    except (OSError, struct.error):
+        return False
+
+
+def open_cache(filename):
+    """
+    Map a CSV file's cache if it is valid.
+
+    Args:
+        filename (str): CSV file name
+
+    Returns:
+        SnapshotReader of the cache, or None if there is no valid cache
+    """
+    if not valid_cache(filename):
+        return None
+    try:
+        return SnapshotReader(cache_filename(filename))
+    except (OSError, ValueError):
+        return None
+
+
+@timed('cache.load_csv')
+def load_csv_cached(filename):
+    """
+    Load Employee and Manager objects from a CSV file through its cache.
+
+    Args:
+        filename (str): Name of the CSV file to load from
+
+    Returns:
+        list: List of Employee and Manager objects
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If employee data is invalid
+    """
+    if valid_cache(filename):
+        try:
+            return load_snapshot(cache_filename(filename))
+        except (OSError, ValueError, struct.error):
+            pass
+
+    try:
+        # Keyed before parsing, so a file changed meanwhile leaves a stale cache
+        key = file_key(filename)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file '{filename}' not found")
+    employees = load_employees_from_csv(filename)
+    try:
+        save_snapshot(employees, cache_filename(filename), trailer=key)
+    except OSError:
+        pass
+    return employees
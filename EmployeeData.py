@@ -1,63 +1,421 @@
 import csv
-from employee import Employee, Manager
+import io
+import os
+from contextlib import contextmanager
+from itertools import accumulate, repeat
+from employee import Employee, Manager, PHONE_INVALID, validate_employee_columns
+from EmployeeStats import add_bytes, is_enabled, timed
 
 
-def load_employees_from_csv(filename="employee_data.csv"):
+FIELDNAMES = ['id', 'fname', 'lname', 'department', 'phNumber', 'employee_type', 'team_size', 'office_number']
+
+# Columns every row needs; team_size and office_number are only read for managers
+REQUIRED_COLUMNS = ('id', 'fname', 'lname', 'department', 'phNumber')
+
+ERROR_POLICIES = ("raise", "skip", "collect")
+
+# Rows validated together by the streaming loader
+BATCH_SIZE = 1000
+
+# Target bytes per range handed to each process by load_employees_parallel
+PARALLEL_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def row_to_employee(row):
+    """
+    Build an Employee or Manager object from a CSV row.
+
+    Args:
+        row (dict): CSV row as produced by csv.DictReader
+
+    Returns:
+        Employee or Manager object
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If employee data is invalid
+    """
+    # Check employee type using the employee_type column
+    if 'employee_type' in row and row['employee_type'] == 'M':
+        return Manager(
+            id=row['id'],
+            fname=row['fname'],
+            lname=row['lname'],
+            department=row['department'],
+            ph_number=row['phNumber'],
+            team_size=int(row['team_size']),
+            office_number=row['office_number']
+        )
+    return Employee(
+        id=row['id'],
+        fname=row['fname'],
+        lname=row['lname'],
+        department=row['department'],
+        ph_number=row['phNumber']
+    )
+
+
+def check_columns(fieldnames):
+    """
+    Check that a CSV header has every required column.
+
+    Args:
+        fieldnames (list): Column names from the header, or None for an empty file
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    if fieldnames is None:
+        return
+    for name in REQUIRED_COLUMNS:
+        if name not in fieldnames:
+            raise ValueError(f"Missing required column in CSV: '{name}'")
+
+
+def iter_employees_from_csv(filename="employee_data.csv", errors="raise", rejects=None):
+    """
+    Yield Employee and Manager objects from a CSV file one row at a time.
+
+    Rows are validated in batches of BATCH_SIZE with validate_employee_columns,
+    so memory stays constant and arbitrarily large files can be streamed
+    through filters.
+
+    Args:
+        filename (str): Name of the CSV file to load from
+        errors (str): What to do with an invalid row:
+            "raise" stops with a ValueError,
+            "skip" drops the row,
+            "collect" drops the row and appends (line_number, row, message) to rejects
+        rejects (list, optional): Receives rejected rows when errors is "collect"
+
+    Returns:
+        generator: Yields Employee and Manager objects in file order
+
+    Raises:
+        ValueError: If errors is not a known policy, or "collect" is used without rejects.
+            The generator raises ValueError before its first row if the header
+            lacks a required column, whatever the policy
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"errors must be one of {ERROR_POLICIES}, got '{errors}'")
+    if errors == "collect" and rejects is None:
+        raise ValueError("A rejects list is required when errors='collect'")
+
+    return _iter_rows(filename, errors, rejects)
+
+
+def _iter_rows(filename, errors, rejects):
+    """Generator behind iter_employees_from_csv (arguments already checked)."""
+    try:
+        csvfile = open(filename, 'r', newline='')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file '{filename}' not found")
+
+    with csvfile:
+        reader = csv.DictReader(csvfile)
+        check_columns(reader.fieldnames)
+        yield from _iter_reader(reader, errors, rejects)
+        if is_enabled():
+            add_bytes('data.read_csv', read=os.fstat(csvfile.fileno()).st_size)
+
+
+def _iter_reader(reader, errors, rejects, line_offset=0):
+    """
+    Yield Employee and Manager objects from a csv.DictReader.
+
+    Args:
+        reader (csv.DictReader): Reader positioned at the first data row
+        errors (str): Error policy, as for iter_employees_from_csv
+        rejects (list): Receives rejected rows when errors is "collect"
+        line_offset (int): Lines in the file before the reader's first line
+    """
+    # Validate BATCH_SIZE rows at a time so memory stays bounded
+    batch = []
+    for row in reader:
+        batch.append((line_offset + reader.line_num, row))
+        if len(batch) == BATCH_SIZE:
+            yield from _iter_batch(batch, errors, rejects)
+            batch = []
+    yield from _iter_batch(batch, errors, rejects)
+
+
+def _iter_batch(batch, errors, rejects):
+    """
+    Yield Employee and Manager objects for a batch of numbered CSV rows.
+
+    The name, department and phone columns are checked together with
+    validate_employee_columns; valid rows are built without going through
+    the setters again, and only flagged rows take the slow path that produces
+    the setter's error message.
+    """
+    try:
+        flags, phone_digits = validate_employee_columns(
+            [row['fname'] for _, row in batch],
+            [row['lname'] for _, row in batch],
+            [row['department'] for _, row in batch],
+            [row['phNumber'] for _, row in batch],
+        )
+    except KeyError:
+        # A column is missing; let the per-row path report it
+        flags, phone_digits = bytes([PHONE_INVALID]) * len(batch), [None] * len(batch)
+
+    for (line_num, row), row_flags, digits in zip(batch, flags, phone_digits):
+        try:
+            if row_flags:
+                employee = row_to_employee(row)
+            elif row.get('employee_type') == 'M':
+                employee = Manager._from_checked(
+                    row['id'], row['fname'], row['lname'], row['department'], digits,
+                    int(row['team_size']), row['office_number']
+                )
+            else:
+                employee = Employee._from_checked(
+                    row['id'], row['fname'], row['lname'], row['department'], digits
+                )
+        except KeyError as e:
+            message = f"Missing required column in CSV: {e}"
+        except (ValueError, TypeError) as e:
+            message = f"Invalid employee data in CSV on line {line_num}: {e}"
+        else:
+            yield employee
+            continue
+
+        if errors == "raise":
+            raise ValueError(message)
+        if errors == "collect":
+            rejects.append((line_num, row, message))
+
+
+@timed('data.load_csv')
+def load_employees_from_csv(filename="employee_data.csv", store=None):
     """
     Load Employee and Manager objects from a CSV file.
 
     Args:
         filename (str): Name of the CSV file to load from
+        store (EmployeeStore, optional): Columnar store to append the records to
+            instead of building a list
 
     Returns:
-        list: List of Employee and Manager objects
+        list: List of Employee and Manager objects, or the store if one was given
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
         ValueError: If employee data is invalid
     """
-    employees = []
+    if store is None:
+        return list(iter_employees_from_csv(filename))
+
+    for employee in iter_employees_from_csv(filename):
+        store.append(employee)
+    return store
+
+
+@timed('data.load_csv_parallel')
+def load_employees_parallel(filename="employee_data.csv", workers=None, chunk_size=PARALLEL_CHUNK_SIZE,
+                            errors="raise", rejects=None):
+    """
+    Load Employee and Manager objects from a CSV file using a process pool.
+
+    The file is split into byte ranges aligned on line boundaries, and each
+    range is parsed and validated in its own process. Results are merged in
+    file order and errors report absolute line numbers. Rows must not contain
+    embedded newlines, which save_employees_to_csv never writes for valid data.
+
+    Args:
+        filename (str): Name of the CSV file to load from
+        workers (int, optional): Number of processes (default: CPU count)
+        chunk_size (int): Target size in bytes of each range
+        errors (str): Error policy, as for iter_employees_from_csv
+        rejects (list, optional): Receives rejected rows when errors is "collect"
+
+    Returns:
+        list: List of Employee and Manager objects in file order
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If employee data is invalid and errors is "raise"
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"errors must be one of {ERROR_POLICIES}, got '{errors}'")
+    if errors == "collect" and rejects is None:
+        raise ValueError("A rejects list is required when errors='collect'")
+
+    workers = workers or os.cpu_count() or 1
 
     try:
-        with open(filename, 'r', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            for row in reader:
-                # Check employee type using the employee_type column
-                if 'employee_type' in row and row['employee_type'] == 'M':
-                    employee = Manager(
-                        id=row['id'],
-                        fname=row['fname'],
-                        lname=row['lname'],
-                        department=row['department'],
-                        ph_number=row['phNumber'],
-                        team_size=int(row['team_size']),
-                        office_number=row['office_number']
-                    )
-                else:
-                    employee = Employee(
-                        id=row['id'],
-                        fname=row['fname'],
-                        lname=row['lname'],
-                        department=row['department'],
-                        ph_number=row['phNumber']
-                    )
-                employees.append(employee)
-                
+        file_size = os.path.getsize(filename)
+        with open(filename, 'rb') as csvfile:
+            header = csvfile.readline()
+            data_start = csvfile.tell()
+
+            # Split into ranges, moving each boundary to the start of the next line
+            boundaries = [data_start]
+            for target in range(data_start + chunk_size, file_size, chunk_size):
+                if target <= boundaries[-1]:
+                    continue
+                csvfile.seek(target - 1)
+                csvfile.readline()
+                if csvfile.tell() < file_size:
+                    boundaries.append(csvfile.tell())
+            boundaries.append(file_size)
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file '{filename}' not found")
-    except KeyError as e:
-        raise ValueError(f"Missing required column in CSV: {e}")
-    except ValueError as e:
-        raise ValueError(f"Invalid employee data in CSV: {e}")
-        
+
+    ranges = list(zip(boundaries, boundaries[1:]))
+    if workers == 1 or len(ranges) == 1:
+        # Not worth starting processes
+        return list(iter_employees_from_csv(filename, errors, rejects))
+
+    add_bytes('data.read_csv', read=file_size)
+    fieldnames = next(csv.reader(io.TextIOWrapper(io.BytesIO(header), newline='')), [])
+    check_columns(fieldnames)
+
+    # Imported here: process pools are slow to import and only used for parallel loads
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # First pass counts lines so each range knows its absolute line numbers
+        line_counts = executor.map(_count_lines, repeat(filename), ranges)
+        line_offsets = list(accumulate(line_counts, initial=1))[:-1]
+
+        chunks = executor.map(
+            _load_range, repeat(filename), ranges, repeat(fieldnames), line_offsets, repeat(errors)
+        )
+
+        employees = []
+        for chunk_employees, chunk_rejects, error in chunks:
+            employees.extend(chunk_employees)
+            if error is not None:
+                executor.shutdown(cancel_futures=True)
+                raise ValueError(error)
+            if errors == "collect":
+                rejects.extend(chunk_rejects)
+
     return employees
 
 
+def _read_range(filename, byte_range):
+    """Read the bytes of one range of a file."""
+    start, end = byte_range
+    with open(filename, 'rb') as csvfile:
+        csvfile.seek(start)
+        return csvfile.read(end - start)
+
+
+def _count_lines(filename, byte_range):
+    """Count the lines in one range of a file (process pool worker)."""
+    return _read_range(filename, byte_range).count(b'\n')
+
+
+def _load_range(filename, byte_range, fieldnames, line_offset, errors):
+    """
+    Parse and validate one range of a CSV file (process pool worker).
+
+    Returns:
+        tuple: (employees, rejects, error message or None)
+    """
+    text = io.TextIOWrapper(io.BytesIO(_read_range(filename, byte_range)), newline='')
+    reader = csv.DictReader(text, fieldnames=fieldnames)
+    employees = []
+    rejects = []
+
+    try:
+        employees.extend(_iter_reader(reader, errors, rejects, line_offset))
+    except ValueError as e:
+        return employees, rejects, str(e)
+
+    return employees, rejects, None
+
+
+def employee_to_row(employee):
+    """
+    Convert an Employee or Manager object to a CSV row.
+
+    Args:
+        employee: Employee or Manager object
+
+    Returns:
+        dict: Row keyed by FIELDNAMES
+    """
+    row_data = {
+        'id': employee.id,
+        'fname': employee.fname,
+        'lname': employee.lname,
+        'department': employee.department,
+        'phNumber': employee.getphNumber(),  # Use raw digits for storage
+        'employee_type': 'M' if isinstance(employee, Manager) else 'E',
+        'team_size': '',
+        'office_number': ''
+    }
+
+    # If this is a Manager, add the additional fields
+    if isinstance(employee, Manager):
+        row_data['team_size'] = employee.team_size
+        row_data['office_number'] = employee.office_number
+
+    return row_data
+
+
+@contextmanager
+def atomic_write(filename, mode='w', **kwargs):
+    """
+    Open a temporary file that replaces filename only once writing succeeds.
+
+    The data is written next to the target, fsynced, and then renamed over
+    it, so a crash leaves either the old file or the new one, never a
+    truncated mix. If the block raises, the target is left untouched.
+
+    Args:
+        filename (str): File to replace
+        mode (str): 'w' for text or 'wb' for binary
+        **kwargs: Passed to open() (e.g. newline='')
+
+    Yields:
+        file: Open temporary file to write to
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    temp_name = os.path.join(directory, f".{os.path.basename(filename)}.{os.urandom(4).hex()}.tmp")
+    try:
+        # Exclusive create honours the umask; keep the target's permissions if it exists
+        with open(temp_name, mode.replace('w', 'x'), **kwargs) as tempfile:
+            if os.path.exists(filename):
+                os.chmod(temp_name, os.stat(filename).st_mode & 0o7777)
+            yield tempfile
+            tempfile.flush()
+            os.fsync(tempfile.fileno())
+        os.replace(temp_name, filename)
+    except BaseException:
+        try:
+            os.remove(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory):
+    """Flush a directory entry change (such as a rename) to disk where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@timed('data.save_csv')
 def save_employees_to_csv(employees, filename="employee_data.csv"):
     """
     Save Employee and Manager objects to a CSV file.
 
+    The file is replaced atomically, so a crash mid-save keeps the old data.
+
     Args:
         employees (list): List of Employee and Manager objects to save
         filename (str): Name of the CSV file to save to
@@ -66,30 +424,17 @@ def save_employees_to_csv(employees, filename="employee_data.csv"):
         IOError: If unable to write to the file
     """
     try:
-        with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['id', 'fname', 'lname', 'department', 'phNumber', 'employee_type', 'team_size', 'office_number']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with atomic_write(filename, 'w', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
 
             writer.writeheader()
 
             for employee in employees:
-                row_data = {
-                    'id': employee.id,
-                    'fname': employee.fname,
-                    'lname': employee.lname,
-                    'department': employee.department,
-                    'phNumber': employee._ph_number,  # Use raw digits for storage
-                    'employee_type': 'M' if isinstance(employee, Manager) else 'E',
-                    'team_size': '',
-                    'office_number': ''
-                }
-
-                # If this is a Manager, add the additional fields
-                if isinstance(employee, Manager):
-                    row_data['team_size'] = employee.team_size
-                    row_data['office_number'] = employee.office_number
-
-                writer.writerow(row_data)
-                
+                writer.writerow(employee_to_row(employee))
+
+            if is_enabled():
+                add_bytes('data.save_csv', written=csvfile.tell())
+
     except IOError as e:
-        raise IOError(f"Unable to write to CSV file '{filename}': {e}")
\ No newline at end of file
+        raise IOError(f"Unable to write to CSV file '{filename}': {e}")
+
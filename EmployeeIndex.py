@@ -0,0 +1,223 @@
+"""
+Employee Management System - Index Module
+
+This module maintains secondary indexes over the roster so common questions
+do not need a scan of every employee:
+- Department -> set of employee IDs
+- Lowercase last name -> employee IDs, as a sorted array for prefix search
+- Raw 10-digit phone number -> employee IDs, optionally enforced unique
+
+The controller updates the indexes on every create, edit and delete.
+"""
+
+from bisect import bisect_left, insort
+
+
+class EmployeeIndexes:
+    """
+    Secondary indexes by department, last name and phone number.
+
+    Attributes:
+        unique_phones (bool): Whether two employees may share a phone number
+    """
+
+    def __init__(self, unique_phones=False):
+        """
+        Initialize empty indexes.
+
+        Args:
+            unique_phones (bool): Reject employees whose phone number is already in use
+        """
+        self.unique_phones = unique_phones
+        self._by_department = {}
+        self._by_last_name = []     # sorted (lowercase last name, ID) pairs
+        self._by_phone = {}
+        self._keys = {}             # ID -> (department, lowercase last name, phone) as indexed
+        # Keys whose ID sets this object may change in place; None when it owns them all
+        self._owned_departments = None
+        self._owned_phones = None
+
+    @classmethod
+    def from_employees(cls, employees, unique_phones=False):
+        """
+        Build indexes for a list of employees.
+
+        Args:
+            employees (iterable): Employee and Manager objects
+            unique_phones (bool): Reject duplicate phone numbers
+
+        Returns:
+            EmployeeIndexes: New indexes
+
+        Raises:
+            ValueError: If unique_phones is set and two employees share a phone number
+        """
+        indexes = cls(unique_phones)
+        pairs = []
+        for employee in employees:
+            department, last_name, phone = keys = cls._keys_of(employee)
+            indexes._check_phone(phone, employee.id)
+            indexes._keys[employee.id] = keys
+            indexes._by_department.setdefault(department, set()).add(employee.id)
+            indexes._by_phone.setdefault(phone, set()).add(employee.id)
+            pairs.append((last_name, employee.id))
+        # One sort instead of an insort per employee
+        pairs.sort()
+        indexes._by_last_name = pairs
+        return indexes
+
+    def copy(self):
+        """
+        Get independent indexes with the same contents.
+
+        The ID set of each department and phone number is shared with these
+        indexes until the copy first changes it, so copying does not touch
+        every ID set. These indexes must not be changed afterwards.
+
+        Returns:
+            EmployeeIndexes: New indexes
+        """
+        indexes = EmployeeIndexes(self.unique_phones)
+        indexes._by_department = dict(self._by_department)
+        indexes._by_last_name = list(self._by_last_name)
+        indexes._by_phone = dict(self._by_phone)
+        indexes._keys = dict(self._keys)
+        indexes._owned_departments = set()
+        indexes._owned_phones = set()
+        return indexes
+
+    @staticmethod
+    def _keys_of(employee):
+        """Get the indexed values of an employee."""
+        return employee.department, employee.lname.lower(), employee.getphNumber()
+
+    def _check_phone(self, phone, emp_id):
+        """Raise ValueError if phone numbers are unique and another employee has this one."""
+        if self.unique_phones and self._by_phone.get(phone, {emp_id}) != {emp_id}:
+            raise ValueError(f"Phone number {phone} is already used by another employee")
+
+    def add(self, employee):
+        """
+        Index a new employee.
+
+        Args:
+            employee: Employee or Manager object
+
+        Raises:
+            ValueError: If unique_phones is set and the phone number is in use
+        """
+        department, last_name, phone = keys = self._keys_of(employee)
+        self._check_phone(phone, employee.id)
+
+        self._keys[employee.id] = keys
+        _ids_to_change(self._by_department, self._owned_departments, department).add(employee.id)
+        insort(self._by_last_name, (last_name, employee.id))
+        _ids_to_change(self._by_phone, self._owned_phones, phone).add(employee.id)
+
+    def remove(self, emp_id):
+        """
+        Remove an employee from the indexes.
+
+        Args:
+            emp_id (str): Employee ID
+        """
+        keys = self._keys.pop(emp_id, None)
+        if keys is None:
+            return
+
+        department, last_name, phone = keys
+        _discard(self._by_department, self._owned_departments, department, emp_id)
+        _discard(self._by_phone, self._owned_phones, phone, emp_id)
+        position = bisect_left(self._by_last_name, (last_name, emp_id))
+        del self._by_last_name[position]
+
+    def check(self, employee):
+        """
+        Check that an employee's current values can be indexed.
+
+        Args:
+            employee: Employee or Manager object
+
+        Raises:
+            ValueError: If unique_phones is set and the phone number is in use
+        """
+        self._check_phone(employee.getphNumber(), employee.id)
+
+    def update(self, employee):
+        """
+        Re-index an employee after its fields were edited in place.
+
+        Args:
+            employee: Employee or Manager object
+
+        Raises:
+            ValueError: If unique_phones is set and the new phone number is in use
+        """
+        keys = self._keys_of(employee)
+        if keys == self._keys.get(employee.id):
+            return
+        self.check(employee)
+        self.remove(employee.id)
+        self.add(employee)
+
+    def ids_in_department(self, department):
+        """
+        Get the IDs of everyone in a department.
+
+        Args:
+            department (str): Department code
+
+        Returns:
+            set: Employee IDs
+        """
+        return set(self._by_department.get(department, ()))
+
+    def ids_with_last_name_prefix(self, prefix):
+        """
+        Get the IDs of everyone whose last name starts with a prefix (case-insensitive).
+
+        Args:
+            prefix (str): Start of the last name
+
+        Returns:
+            list: Employee IDs ordered by last name, then ID
+        """
+        prefix = prefix.lower()
+        ids = []
+        for position in range(bisect_left(self._by_last_name, (prefix,)), len(self._by_last_name)):
+            last_name, emp_id = self._by_last_name[position]
+            if not last_name.startswith(prefix):
+                break
+            ids.append(emp_id)
+        return ids
+
+    def ids_with_phone(self, phone):
+        """
+        Get the IDs of everyone with a phone number.
+
+        Args:
+            phone (str): Raw 10-digit phone number
+
+        Returns:
+            set: Employee IDs
+        """
+        return set(self._by_phone.get(phone, ()))
+
+
+def _ids_to_change(index, owned, key):
+    """Get a key's ID set for changing in place, first copying it if it may be shared."""
+    ids = index.get(key)
+    if ids is None or (owned is not None and key not in owned):
+        ids = index[key] = set(ids or ())
+        if owned is not None:
+            owned.add(key)
+    return ids
+
+
+def _discard(index, owned, key, emp_id):
+    """Remove an ID from a key's set, dropping the key once it is empty."""
+    if key in index:
+        ids = _ids_to_change(index, owned, key)
+        ids.discard(emp_id)
+        if not ids:
+            del index[key]
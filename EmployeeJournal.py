@@ -0,0 +1,372 @@
+"""
+Employee Management System - Journal Module
+
+This module is the write-ahead log (journal) that sits next to the main data
+file (``<filename>.journal``), so a single change does not require
+rewriting the whole roster:
+- Every create, edit and delete is appended to the journal
+- Appends are fsynced in groups (see JournalWriter) so high mutation rates
+  do not pay for one fsync per operation
+- On load the journal is replayed over the last saved CSV or snapshot
+- Once the journal grows large it is compacted: the main file is rewritten
+  atomically (temp file plus rename) and the journal is removed
+
+Each journal entry carries a CRC of its fields. A torn final entry left by a
+crash is ignored on replay; a bad entry anywhere else is reported.
+
+Several changes can be appended as one transaction: every entry but the
+last is written with a lowercase operation ('u' or 'd'), and the uppercase
+final entry commits the group. Replay applies a group only once its commit
+entry is read, and the writer drops an uncommitted group from the end of the
+journal before appending, so a crash never leaves half a transaction applied.
+"""
+
+import csv
+import os
+import time
+import zlib
+from EmployeeData import FIELDNAMES, employee_to_row, row_to_employee, save_employees_to_csv
+from EmployeeStats import add_bytes, instrumented, is_enabled, timed, timed_method
+
+JOURNAL_FIELDNAMES = ['op'] + FIELDNAMES + ['crc']
+
+# Journal operations; the lowercase forms are uncommitted parts of a transaction
+OP_UPSERT = 'U'
+OP_DELETE = 'D'
+
+# Never compact a journal shorter than this, however small the roster is
+COMPACT_MIN_ENTRIES = 1000
+
+
+def journal_filename(filename):
+    """
+    Get the journal filename that belongs to a data file.
+
+    Args:
+        filename (str): Name of the main CSV or snapshot file
+
+    Returns:
+        str: Name of the journal file
+    """
+    return f"{filename}.journal"
+
+
+def _entry_crc(row):
+    """Compute the CRC of a journal entry's fields (everything but the crc column)."""
+    values = (row.get(name) for name in JOURNAL_FIELDNAMES[:-1])
+    fields = '\x1f'.join('' if value is None else str(value) for value in values)
+    return format(zlib.crc32(fields.encode('utf-8')), '08x')
+
+
+@instrumented
+class JournalWriter:
+    """
+    Appends entries to a journal file with group commit.
+
+    Every append is flushed to the operating system straight away, so a
+    crash of the application loses nothing. fsync, which protects against
+    power loss, runs once sync_every entries have been written or
+    sync_interval seconds have passed since the last one, whichever comes
+    first. close() always syncs.
+
+    Attributes:
+        filename (str): Name of the journal file
+        sync_every (int): Entries per fsync (1 syncs every append)
+        sync_interval (float): Maximum seconds between fsyncs, or None
+    """
+
+    def __init__(self, filename, sync_every=1, sync_interval=None):
+        """
+        Initialize a writer; the file is opened on the first append.
+
+        Args:
+            filename (str): Name of the journal file
+            sync_every (int): Entries per fsync
+            sync_interval (float, optional): Maximum seconds between fsyncs
+
+        Raises:
+            ValueError: If sync_every is not a positive integer
+        """
+        if not isinstance(sync_every, int) or sync_every < 1:
+            raise ValueError("sync_every must be a positive integer")
+        self.filename = filename
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._file = None
+        self._writer = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @timed_method('journal.append')
+    def append(self, changes, transaction=False):
+        """
+        Append changes to the journal.
+
+        Args:
+            changes (dict): Employee ID -> Employee/Manager object for a
+                create or edit, or None for a delete
+            transaction (bool): Replay all of the changes or none of them
+
+        Raises:
+            IOError: If unable to write to the journal
+        """
+        try:
+            if self._file is None:
+                _truncate_incomplete_tail(self.filename)
+                self._file = open(self.filename, 'a', newline='')
+                self._writer = csv.DictWriter(self._file, fieldnames=JOURNAL_FIELDNAMES)
+                if self._file.tell() == 0:
+                    self._writer.writeheader()
+
+            start = self._file.tell() if is_enabled() else 0
+            uncommitted = len(changes) - 1 if transaction else 0
+            for position, (emp_id, employee) in enumerate(changes.items()):
+                if employee is None:
+                    row_data = {'op': OP_DELETE, 'id': emp_id}
+                else:
+                    row_data = employee_to_row(employee)
+                    row_data['op'] = OP_UPSERT
+                if position < uncommitted:
+                    row_data['op'] = row_data['op'].lower()
+                row_data['crc'] = _entry_crc(row_data)
+                self._writer.writerow(row_data)
+            self._file.flush()
+            if is_enabled():
+                add_bytes('journal.append', written=self._file.tell() - start)
+
+            self._unsynced += len(changes)
+            if self._unsynced >= self.sync_every or (
+                    self.sync_interval is not None
+                    and time.monotonic() - self._last_sync >= self.sync_interval):
+                self.sync()
+
+        except IOError as e:
+            raise IOError(f"Unable to write to journal '{self.filename}': {e}")
+
+    @timed_method('journal.sync')
+    def sync(self):
+        """
+        fsync all entries written so far.
+        """
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """
+        Sync and close the journal file; a later append reopens it.
+        """
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+def _truncate_incomplete_tail(filename):
+    """
+    Cut off what a crash left at the end of a journal.
+
+    That is a final line without its newline, and the entries of a
+    transaction that was never committed (lowercase operations). Otherwise
+    the next entries would be appended onto them.
+    """
+    try:
+        journalfile = open(filename, 'rb+')
+    except FileNotFoundError:
+        return
+
+    uncommitted = (OP_UPSERT.lower().encode(), OP_DELETE.lower().encode())
+    with journalfile:
+        end = journalfile.seek(0, os.SEEK_END)
+        keep = end
+        for line_start, line in _lines_backwards(journalfile, end):
+            if (keep == end and not line.endswith(b'\n')) or line[:1] in uncommitted:
+                keep = line_start
+            else:
+                break
+
+        if keep != end:
+            journalfile.truncate(keep)
+
+
+def _lines_backwards(binaryfile, end, block_size=4096):
+    """Yield (start offset, bytes) of each line before end, last line first."""
+    position = end
+    tail = b''
+    while position > 0:
+        start = max(0, position - block_size)
+        binaryfile.seek(start)
+        buffer = binaryfile.read(position - start) + tail
+        cut = len(buffer)
+        while cut > 0:
+            newline = buffer.rfind(b'\n', 0, cut - 1)
+            if newline == -1:
+                break
+            yield start + newline + 1, buffer[newline + 1:cut]
+            cut = newline + 1
+        # The rest of the buffer may start in an earlier block
+        tail = buffer[:cut]
+        position = start
+
+    if tail:
+        yield 0, tail
+
+
+def append_to_journal(changes, filename="employee_data.csv"):
+    """
+    Append changes to the journal of a data file and fsync them.
+
+    Args:
+        changes (dict): Employee ID -> Employee/Manager object for a create
+            or edit, or None for a delete
+        filename (str): Name of the main CSV or snapshot file
+
+    Raises:
+        IOError: If unable to write to the journal
+    """
+    writer = JournalWriter(journal_filename(filename))
+    try:
+        writer.append(changes)
+    finally:
+        writer.close()
+
+
+@timed('journal.replay')
+def replay_journal(employees, filename="employee_data.csv"):
+    """
+    Apply the journal of a data file over employees loaded from it.
+
+    Entries of a transaction that was never committed are skipped.
+
+    Args:
+        employees (list): Employee and Manager objects loaded from the main file
+        filename (str): Name of the main CSV or snapshot file
+
+    Returns:
+        tuple: (list of employees with the journal applied, number of journal entries)
+
+    Raises:
+        ValueError: If a journal entry other than a torn final one is invalid
+    """
+    changes, entries = read_journal(filename)
+    if not entries:
+        return employees, 0
+
+    employees_by_id = {employee.id: employee for employee in employees}
+    for emp_id, employee in changes:
+        if employee is None:
+            employees_by_id.pop(emp_id, None)
+        else:
+            employees_by_id[emp_id] = employee
+    return list(employees_by_id.values()), entries
+
+
+def read_journal(filename="employee_data.csv"):
+    """
+    Read the committed changes in the journal of a data file.
+
+    Args:
+        filename (str): Name of the main CSV or snapshot file
+
+    Returns:
+        tuple: (list of (employee ID, Employee/Manager object, or None for a
+            delete) in journal order, number of journal entries)
+
+    Raises:
+        ValueError: If a journal entry other than a torn final one is invalid
+    """
+    journal = journal_filename(filename)
+    changes = []
+    transaction = []
+    entries = 0
+
+    try:
+        journalfile = open(journal, 'r', newline='')
+    except FileNotFoundError:
+        return changes, 0
+
+    with journalfile:
+        if is_enabled():
+            add_bytes('journal.replay', read=os.fstat(journalfile.fileno()).st_size)
+        reader = csv.DictReader(journalfile)
+        rows = iter(reader)
+        row = next(rows, None)
+
+        while row is not None:
+            line_num = reader.line_num
+            next_row = next(rows, None)
+
+            # Journals written before entries had a CRC have no crc column
+            if 'crc' in row and row['crc'] != _entry_crc(row):
+                if next_row is None:
+                    break  # Torn write at the end of the journal; never acknowledged
+                raise ValueError(f"Corrupt journal entry on line {line_num}")
+
+            entries += 1
+            try:
+                op = row['op']
+                if op.upper() == OP_DELETE:
+                    transaction.append((row['id'], None))
+                elif op.upper() == OP_UPSERT:
+                    transaction.append((row['id'], row_to_employee(row)))
+                else:
+                    raise ValueError(f"unknown operation '{op}'")
+            except KeyError as e:
+                raise ValueError(f"Missing required column in journal: {e}")
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Invalid journal entry on line {line_num}: {e}")
+
+            # An uppercase entry commits it and any uncommitted entries before it
+            if op.isupper():
+                changes.extend(transaction)
+                transaction = []
+
+            row = next_row
+
+    # Entries left in the transaction were never committed
+    return changes, entries
+
+
+def should_compact(journal_entries, record_count):
+    """
+    Decide whether the journal has grown large enough to be compacted.
+
+    Compacting once the journal is as long as the roster keeps the amortized
+    cost of each change constant.
+
+    Args:
+        journal_entries (int): Number of entries in the journal
+        record_count (int): Number of employees in the roster
+
+    Returns:
+        bool: True if the main file should be rewritten and the journal dropped
+    """
+    return journal_entries >= max(COMPACT_MIN_ENTRIES, record_count)
+
+
+def compact(employees, filename="employee_data.csv", save=save_employees_to_csv):
+    """
+    Rewrite the main file from employees and remove its journal.
+
+    The save functions replace the main file atomically before the journal
+    is removed, so a crash in between only means the journal is replayed
+    again over data that already contains it, which gives the same result.
+    Close any JournalWriter on the journal first.
+
+    Args:
+        employees (list): Employee and Manager objects to save
+        filename (str): Name of the main file
+        save (function): Writes employees to the main file
+            (save_employees_to_csv or EmployeeSnapshot.save_snapshot)
+
+    Raises:
+        IOError: If unable to write to the file
+    """
+    save(employees, filename)
+
+    try:
+        os.remove(journal_filename(filename))
+    except FileNotFoundError:
+        pass
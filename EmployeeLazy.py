@@ -0,0 +1,238 @@
+"""
+Employee Management System - Lazy Loading Module
+
+This module opens a CSV roster without building every employee, for
+sessions that only look at a few of them:
+- Opening the file memory-maps it and scans it once for the ID at the start
+  of each line, building an ID -> byte offset index. Nothing is parsed or
+  validated yet
+- get() reads, validates and builds one employee from its line the first
+  time it is asked for
+- If the file has a valid cache (see EmployeeCache), the cache's sorted ID
+  index is used instead: there is no scan, and employees are built from the
+  already validated cache records
+- Built employees are kept in an LRU cache of cache_size entries, so memory
+  stays bounded however many are looked at. An employee evicted from it is
+  still the same object while anything else holds it, so edits made to it
+  in place are not lost
+- Committed journal entries are read at open time and take precedence over
+  the file
+
+Like load_employees_parallel, the scan assumes that no row contains a
+newline inside a quoted field. Invalid rows are only reported when they are
+accessed.
+"""
+
+import csv
+import mmap
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from EmployeeCache import open_cache
+from EmployeeData import row_to_employee
+from EmployeeJournal import read_journal
+
+# Employees kept built by default
+LAZY_CACHE_SIZE = 1024
+
+# The ID in the first column of an unquoted row
+_LEADING_ID = re.compile(rb'^([^,"\r\n]*),', re.M)
+
+
+class LazyEmployees:
+    """
+    Read-only employees of a CSV file, built when first accessed.
+
+    Attributes:
+        filename (str): Name of the CSV file
+        cache_size (int): Most employees kept built at a time
+        journal_entries (int): Entries in the file's journal
+        closed (bool): Whether close() was called
+    """
+
+    def __init__(self, filename, cache_size=None):
+        """
+        Open and index a CSV file and read its journal.
+
+        Args:
+            filename (str): Name of the CSV file
+            cache_size (int, optional): Most employees kept built at a time;
+                None for LAZY_CACHE_SIZE
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError: If cache_size is not a positive integer, the header
+                has no id column, an ID appears twice, or the journal is invalid
+        """
+        if cache_size is None:
+            cache_size = LAZY_CACHE_SIZE
+        if not isinstance(cache_size, int) or cache_size < 1:
+            raise ValueError("cache_size must be a positive integer")
+        self.filename = filename
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        # Every employee built from the file that is still held by anyone
+        self._built = weakref.WeakValueDictionary()
+        # Guards the caches, and the file or its cache against being closed while read
+        self._cache_lock = threading.Lock()
+        self._data = b''
+        self.closed = False
+
+        self._reader = open_cache(filename)
+        try:
+            if self._reader is not None:
+                self._position = self._reader.position_of
+                self._build = self._reader.__getitem__
+                count = len(self._reader)
+            else:
+                self._map(filename)
+                offsets = self._scan()
+                self._position = offsets.get
+                self._build = self._build_row
+                count = len(offsets)
+            changes, self.journal_entries = read_journal(filename)
+        except BaseException:
+            self.close()
+            raise
+
+        # Journal changes by ID, the last one winning; None marks a delete
+        self._changes = dict(changes)
+        self._count = count + sum(
+            (employee is not None) - (self._position(emp_id) is not None)
+            for emp_id, employee in self._changes.items())
+
+    def _map(self, filename):
+        """Memory-map the CSV file."""
+        try:
+            with open(filename, 'rb') as csvfile:
+                self._data = mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file '{filename}' not found")
+        except ValueError:
+            # mmap refuses empty files
+            self._data = b''
+
+    def _scan(self):
+        """Read the header and build the ID -> line offset index."""
+        data = self._data
+        header_end = data.find(b'\n') + 1 or len(data)
+        self._fieldnames = next(csv.reader([data[:header_end].decode('utf-8')]), [])
+        if not self._fieldnames:
+            return {}
+        if 'id' not in self._fieldnames:
+            raise ValueError("Missing required column in CSV: 'id'")
+
+        if self._fieldnames[0] == 'id' and data.find(b'\n"', header_end - 1) == -1:
+            # Every row starts with its bare ID; let the regex engine find them
+            matches = ((match[1].decode('utf-8'), match.start())
+                       for match in _LEADING_ID.finditer(data, header_end))
+        else:
+            matches = self._scan_rows(header_end)
+
+        offsets = {}
+        try:
+            for emp_id, offset in matches:
+                if offsets.setdefault(emp_id, offset) != offset:
+                    raise ValueError(f"Duplicate employee ID '{emp_id}'")
+        finally:
+            # Release the scan's hold on the mapping so close() can unmap it
+            matches.close()
+        return offsets
+
+    def _scan_rows(self, position):
+        """Yield (ID, offset) by parsing each row; for quoted IDs or an id column that is not first."""
+        column = self._fieldnames.index('id')
+        data = self._data
+        while position < len(data):
+            end = data.find(b'\n', position)
+            end = len(data) if end == -1 else end + 1
+            fields = next(csv.reader([data[position:end].decode('utf-8')]), None)
+            if fields and len(fields) > column:
+                yield fields[column], position
+            position = end
+
+    def __len__(self):
+        return self._count
+
+    def get(self, emp_id):
+        """
+        Get an employee by ID, building it from the file if it is not cached.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            Employee/Manager object if found, None otherwise (or once closed)
+
+        Raises:
+            ValueError: If the employee's row is invalid
+        """
+        if emp_id in self._changes:
+            return self._changes[emp_id]
+
+        cache = self._cache
+        with self._cache_lock:
+            if self.closed:
+                return None
+            employee = cache.get(emp_id)
+            if employee is None:
+                employee = self._built.get(emp_id)
+            if employee is None:
+                position = self._position(emp_id)
+                if position is None:
+                    return None
+                employee = self._built[emp_id] = self._build(position)
+
+            cache[emp_id] = employee
+            cache.move_to_end(emp_id)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return employee
+
+    def _build_row(self, offset):
+        """Parse and validate the row starting at a byte offset."""
+        end = self._data.find(b'\n', offset)
+        line = self._data[offset:end if end != -1 else len(self._data)].decode('utf-8')
+        row = dict(zip(self._fieldnames, next(csv.reader([line]))))
+        try:
+            return row_to_employee(row)
+        except KeyError as e:
+            raise ValueError(f"Missing required column in CSV: {e}")
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid employee data in CSV at byte {offset}: {e}")
+
+    def cached(self):
+        """
+        Get the employees built from the file that are still cached.
+
+        Returns:
+            dict: Employee ID -> Employee/Manager object
+        """
+        with self._cache_lock:
+            return dict(self._cache)
+
+    def handed_out(self):
+        """
+        Get every employee get() may have returned that can still be in use.
+
+        This is the journal's employees and those built from the file that
+        are cached or still held anywhere else, so completing a load can
+        keep these objects, and any edits made to them in place.
+
+        Returns:
+            dict: Employee ID -> Employee/Manager object
+        """
+        with self._cache_lock:
+            employees = dict(self._built.items())
+        employees.update((emp_id, employee) for emp_id, employee in self._changes.items() if employee is not None)
+        return employees
+
+    def close(self):
+        """Unmap the file or its cache; get() returns None afterwards."""
+        with self._cache_lock:
+            self.closed = True
+            if isinstance(self._data, mmap.mmap):
+                self._data.close()
+            if self._reader is not None:
+                self._reader.close()
@@ -0,0 +1,194 @@
+"""
+Employee Management System - Merge Module
+
+This module merges an incoming employee CSV into the roster by ID, with
+upsert semantics: new IDs are inserted, existing ones replaced, and rows
+that are identical to the current record are left alone.
+
+merge_csv_files works on the files directly, so neither file has to fit in
+memory:
+- Both files are split into hashed partitions by ID in a temporary directory
+- Each partition pair is merged in memory
+- The merged partitions are combined in file order and replace the data
+  file atomically; employees keep their position and new ones follow in
+  incoming order
+
+EmployeeController.merge_employees_from_csv does the same against a loaded
+roster and journals the changes.
+"""
+
+import csv
+import heapq
+import os
+import tempfile
+import zlib
+from itertools import count
+from EmployeeData import FIELDNAMES, atomic_write, employee_to_row, iter_employees_from_csv
+from EmployeeJournal import journal_filename
+from EmployeeStats import timed
+
+# Target bytes of input per partition for merge_csv_files
+MERGE_PARTITION_SIZE = 64 * 1024 * 1024
+
+
+def new_merge_counts():
+    """
+    Get zeroed merge counters.
+
+    Returns:
+        dict: inserted, updated, unchanged and rejected counts
+    """
+    return {'inserted': 0, 'updated': 0, 'unchanged': 0, 'rejected': 0}
+
+
+def row_values(employee):
+    """
+    Get an employee's CSV fields as strings, for comparing records.
+
+    Args:
+        employee: Employee or Manager object
+
+    Returns:
+        list: Field values in FIELDNAMES order
+    """
+    row = employee_to_row(employee)
+    return [str(row[field]) for field in FIELDNAMES]
+
+
+class RejectCounter:
+    """
+    Rejects list for iter_employees_from_csv that counts invalid rows.
+
+    Rows are only kept when a list to forward them to is given, so counting
+    the rejects of a huge file takes no memory.
+    """
+
+    def __init__(self, counts, rejects=None):
+        """
+        Initialize a counter.
+
+        Args:
+            counts (dict): Merge counts whose 'rejected' entry is incremented
+            rejects (list, optional): Receives (line_number, row, message) tuples
+        """
+        self.counts = counts
+        self.rejects = rejects
+
+    def append(self, reject):
+        """Count a rejected row and forward it."""
+        self.counts['rejected'] += 1
+        if self.rejects is not None:
+            self.rejects.append(reject)
+
+
+@timed('merge.csv_files')
+def merge_csv_files(filename, incoming, rejects=None, partitions=None):
+    """
+    Merge an incoming CSV into a data CSV by ID without loading either file.
+
+    Incoming rows are validated; invalid ones are counted and skipped. Rows
+    of the data file were validated when they were saved. If nothing was
+    inserted or updated the data file is not rewritten.
+
+    Args:
+        filename (str): Data CSV file to merge into (created if missing)
+        incoming (str): CSV file with the employees to upsert
+        rejects (list, optional): Receives (line_number, row, message) for
+            each invalid incoming row
+        partitions (int, optional): Number of hashed partitions; by default
+            one per MERGE_PARTITION_SIZE bytes of input
+
+    Returns:
+        dict: inserted, updated, unchanged and rejected counts
+
+    Raises:
+        FileNotFoundError: If the incoming file doesn't exist
+        ValueError: If the data file has a journal that has not been compacted
+        IOError: If unable to write the merged file
+    """
+    if os.path.exists(journal_filename(filename)):
+        raise ValueError(f"'{filename}' has uncompacted journal entries; load and save it first")
+
+    if partitions is None:
+        size = os.path.getsize(incoming) + (os.path.getsize(filename) if os.path.exists(filename) else 0)
+        partitions = max(1, -(-size // MERGE_PARTITION_SIZE))
+
+    counts = new_merge_counts()
+    directory = os.path.dirname(os.path.abspath(filename))
+    with tempfile.TemporaryDirectory(dir=directory, prefix='.merge-') as workdir:
+        # Rows carry a sequence number so the final file keeps its order
+        sequence = count()
+        with _PartitionWriters(workdir, 'current', partitions) as writers:
+            if os.path.exists(filename):
+                with open(filename, 'r', newline='') as csvfile:
+                    for row in csv.DictReader(csvfile):
+                        writers.write(next(sequence), [row[field] for field in FIELDNAMES])
+
+        with _PartitionWriters(workdir, 'incoming', partitions) as writers:
+            for employee in iter_employees_from_csv(incoming, "collect", RejectCounter(counts, rejects)):
+                writers.write(next(sequence), row_values(employee))
+
+        for partition in range(partitions):
+            _merge_partition(workdir, partition, counts)
+
+        if counts['inserted'] or counts['updated']:
+            merged = [_read_partition(workdir, 'merged', partition) for partition in range(partitions)]
+            with atomic_write(filename, 'w', newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDNAMES)
+                writer.writerows(values for _, values in heapq.merge(*merged, key=lambda item: item[0]))
+
+    return counts
+
+
+class _PartitionWriters:
+    """CSV writers for one set of hashed partition files, keyed by crc32 of the ID."""
+
+    def __init__(self, workdir, name, partitions):
+        self._files = [open(_partition_path(workdir, name, partition), 'w', newline='')
+                       for partition in range(partitions)]
+        self._writers = [csv.writer(partfile) for partfile in self._files]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        for partfile in self._files:
+            partfile.close()
+
+    def write(self, seq, values):
+        """Write a row (FIELDNAMES values) with its sequence number to its partition."""
+        partition = zlib.crc32(values[0].encode('utf-8')) % len(self._writers)
+        self._writers[partition].writerow([seq] + values)
+
+
+def _partition_path(workdir, name, partition):
+    """Get the file name of one partition."""
+    return os.path.join(workdir, f"{name}-{partition}.csv")
+
+
+def _read_partition(workdir, name, partition):
+    """Yield (sequence number, values) from a partition file."""
+    with open(_partition_path(workdir, name, partition), 'r', newline='') as partfile:
+        for row in csv.reader(partfile):
+            yield int(row[0]), row[1:]
+
+
+def _merge_partition(workdir, partition, counts):
+    """Upsert one incoming partition into the matching current one and write it sorted by sequence."""
+    records = {values[0]: [seq, values] for seq, values in _read_partition(workdir, 'current', partition)}
+
+    for seq, values in _read_partition(workdir, 'incoming', partition):
+        record = records.get(values[0])
+        if record is None:
+            records[values[0]] = [seq, values]
+            counts['inserted'] += 1
+        elif record[1] == values:
+            counts['unchanged'] += 1
+        else:
+            record[1] = values
+            counts['updated'] += 1
+
+    with open(_partition_path(workdir, 'merged', partition), 'w', newline='') as partfile:
+        writer = csv.writer(partfile)
+        writer.writerows([seq] + values for seq, values in sorted(records.values(), key=lambda record: record[0]))
@@ -0,0 +1,125 @@
+"""
+Employee Management System - Query Module
+
+This module filters, sorts and projects employees:
+- Filters by department, employee type and last name prefix
+- Ordering by any field; with a limit only the top matches are kept, in a
+  heap of that size, instead of sorting everything
+- Projection of chosen fields into dicts
+- Results are yielded one at a time, and nothing is copied unless the
+  ordering needs it
+
+query() makes a single pass over any iterable of employees (a list, an
+EmployeeStore, a SnapshotReader). RosterSnapshot.query, which
+EmployeeController.query uses, first narrows the candidates with the
+department and last name indexes.
+"""
+
+import heapq
+from itertools import islice
+from employee import Manager
+
+# Fields that can be sorted on and projected
+QUERY_FIELDS = ('id', 'employee_type', 'fname', 'lname', 'department', 'ph_number', 'team_size', 'office_number')
+EMPLOYEE_TYPES = ('E', 'M')
+
+
+def _getter(field):
+    """Get a function reading one field of an employee, or None where it doesn't apply."""
+    if field == 'employee_type':
+        return lambda employee: 'M' if isinstance(employee, Manager) else 'E'
+    return lambda employee: getattr(employee, field, None)
+
+
+def _sort_key(field, descending):
+    """Get a sort key on a field that puts employees without it (e.g. team_size) last."""
+    get = _getter(field)
+    missing, present = ((0, ''), 1) if descending else ((1, ''), 0)
+
+    def key(employee):
+        value = get(employee)
+        return missing if value is None else (present, value)
+    return key
+
+
+def check_criteria(employee_type=None, sort=None, fields=None, limit=None):
+    """
+    Validate query options that do not depend on the data.
+
+    Args:
+        employee_type (str, optional): 'E' or 'M'
+        sort (str, optional): Field in QUERY_FIELDS
+        fields (list, optional): Fields in QUERY_FIELDS
+        limit (int, optional): Maximum number of results
+
+    Raises:
+        ValueError: If an option is invalid
+    """
+    if employee_type is not None and employee_type not in EMPLOYEE_TYPES:
+        raise ValueError(f"employee_type must be 'E' or 'M', got {employee_type!r}")
+    if sort is not None and sort not in QUERY_FIELDS:
+        raise ValueError(f"Cannot sort by {sort!r}; choose from {', '.join(QUERY_FIELDS)}")
+    if fields is not None:
+        unknown = [field for field in fields if field not in QUERY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise ValueError("limit must be a non-negative integer")
+
+
+def query(employees, department=None, employee_type=None, last_name=None,
+          sort=None, descending=False, fields=None, limit=None):
+    """
+    Filter, order and project employees.
+
+    The options are checked straight away; the employees are only read as
+    the results are consumed.
+
+    Args:
+        employees (iterable): Employee and Manager objects
+        department (str, optional): Only employees in this department
+        employee_type (str, optional): 'E' for employees only or 'M' for managers only
+        last_name (str, optional): Only last names starting with this (case-insensitive)
+        sort (str, optional): Field to order by; without it the input order is kept.
+            Employees without the field (team_size for non-managers) come last
+        descending (bool): Order from highest to lowest
+        fields (list, optional): Yield dicts with these fields instead of the objects
+        limit (int, optional): Maximum number of results
+
+    Returns:
+        generator: Employee/Manager objects, or dicts when fields is given
+
+    Raises:
+        ValueError: If an option is invalid
+    """
+    check_criteria(employee_type, sort, fields, limit)
+
+    matches = employees
+    if department is not None:
+        matches = (employee for employee in matches if employee.department == department)
+    if employee_type is not None:
+        managers = employee_type == 'M'
+        matches = (employee for employee in matches if isinstance(employee, Manager) == managers)
+    if last_name is not None:
+        prefix = last_name.lower()
+        matches = (employee for employee in matches if employee.lname.lower().startswith(prefix))
+
+    ordered = _ordered(matches, sort, descending, limit)
+    if fields is None:
+        return ordered
+    getters = [(field, _getter(field)) for field in fields]
+    return ({field: get(employee) for field, get in getters} for employee in ordered)
+
+
+def _ordered(matches, sort, descending, limit):
+    """Yield matches in order, reading them only once the first result is asked for."""
+    if sort is None:
+        yield from (matches if limit is None else islice(matches, limit))
+        return
+
+    key = _sort_key(sort, descending)
+    if limit is None:
+        yield from sorted(matches, key=key, reverse=descending)
+    else:
+        # Same result as sorting and slicing, keeping only limit employees at a time
+        yield from (heapq.nlargest if descending else heapq.nsmallest)(limit, matches, key=key)
@@ -0,0 +1,382 @@
+"""
+Employee Management System - Roster Module
+
+This module holds the controller's employees by ID together with their
+secondary indexes, so the roster can be shared between threads:
+- Writers take one lock, so changes are applied one at a time
+- Lookups by ID read the live dict without waiting. Reads that finish
+  straight away (lists, index queries) briefly block writers through
+  reading(); anything that is iterated later works on a snapshot
+- Snapshots are copy-on-write: taking one is O(1), and the first change
+  after it copies the roster so the snapshot never changes. That copy is
+  still O(n), but shallow: the ID dict, the last name list and the index
+  dicts are copied, while the employees and the per-department and
+  per-phone ID sets are shared (each set is copied when it first changes).
+  Take snapshots only for reads that outlive a single call
+- Changes can be recorded and rolled back, so a batch of them is undone
+  without copying anything
+- An employee object is replaced, not edited, when a change goes through
+  replace(), so a reader holding it never sees a half-applied edit
+"""
+
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from EmployeeIndex import EmployeeIndexes
+from EmployeeQuery import query
+
+
+class RosterSnapshot:
+    """
+    Unchanging view of the roster at one point in time.
+
+    Iterating yields employees in insertion order.
+    """
+
+    __slots__ = ('_employees_by_id', '_indexes')
+
+    def __init__(self, employees_by_id, indexes):
+        """
+        Initialize a snapshot; the roster must not change the objects afterwards.
+
+        Args:
+            employees_by_id (dict): Employee ID -> Employee/Manager object
+            indexes (EmployeeIndexes): Indexes of the same employees
+        """
+        self._employees_by_id = employees_by_id
+        self._indexes = indexes
+
+    def __iter__(self):
+        return iter(self._employees_by_id.values())
+
+    def __len__(self):
+        return len(self._employees_by_id)
+
+    def get(self, emp_id):
+        """
+        Get an employee by ID.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            Employee/Manager object if found, None otherwise
+        """
+        return self._employees_by_id.get(emp_id)
+
+    def in_department(self, department):
+        """
+        Get everyone in a department.
+
+        Args:
+            department (str): Department code
+
+        Returns:
+            list: Employee/Manager objects ordered by ID
+        """
+        return [self._employees_by_id[emp_id] for emp_id in sorted(self._indexes.ids_in_department(department))]
+
+    def with_last_name_prefix(self, prefix):
+        """
+        Get everyone whose last name starts with a prefix (case-insensitive).
+
+        Args:
+            prefix (str): Start of the last name
+
+        Returns:
+            list: Employee/Manager objects ordered by last name, then ID
+        """
+        return [self._employees_by_id[emp_id] for emp_id in self._indexes.ids_with_last_name_prefix(prefix)]
+
+    def with_phone(self, phone):
+        """
+        Get everyone with a phone number.
+
+        Args:
+            phone (str): Raw 10-digit phone number
+
+        Returns:
+            list: Employee/Manager objects ordered by ID
+        """
+        return [self._employees_by_id[emp_id] for emp_id in sorted(self._indexes.ids_with_phone(phone))]
+
+    def query(self, department=None, employee_type=None, last_name=None, **options):
+        """
+        Filter, order and project employees (see EmployeeQuery.query).
+
+        A department or last name prefix is looked up in its index, using
+        whichever matches fewer employees; the other filters are applied to
+        those candidates. Without a sort, results come in the order of the
+        index used (ID for department, last name for last name prefix), or
+        in roster order when there is no index to use.
+
+        Args:
+            department (str, optional): Only employees in this department
+            employee_type (str, optional): 'E' or 'M'
+            last_name (str, optional): Only last names starting with this (case-insensitive)
+            **options: sort, descending, fields and limit, as for EmployeeQuery.query
+
+        Returns:
+            generator: Employee/Manager objects, or dicts when fields is given
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        candidates = self
+        if department is not None or last_name is not None:
+            by_department = None if department is None else self._indexes.ids_in_department(department)
+            by_last_name = None if last_name is None else self._indexes.ids_with_last_name_prefix(last_name)
+            if by_last_name is None or (by_department is not None and len(by_department) <= len(by_last_name)):
+                candidates = [self._employees_by_id[emp_id] for emp_id in sorted(by_department)]
+                department = None
+            else:
+                candidates = [self._employees_by_id[emp_id] for emp_id in by_last_name]
+                last_name = None
+        return query(candidates, department, employee_type, last_name, **options)
+
+
+class EmployeeRoster:
+    """
+    Thread-safe employees by ID with secondary indexes.
+
+    Attributes:
+        lock (threading.RLock): Serializes writers; hold it to make several
+            changes, or a read followed by a change, atomic
+        by_id (dict): Live employees by ID. Only look up single IDs in it;
+            iterate a snapshot() or reading() instead, as a writer may change or replace it
+    """
+
+    def __init__(self, unique_phones=False):
+        """
+        Initialize an empty roster.
+
+        Args:
+            unique_phones (bool): Reject employees whose phone number is already in use
+        """
+        self.lock = threading.RLock()
+        # Held only while data is swapped or changed in place, never while copying
+        self._publish_lock = threading.Lock()
+        self.by_id = {}
+        self._indexes = EmployeeIndexes(unique_phones)
+        # True once a snapshot may be using the current data
+        self._shared = False
+        # (method, argument) calls undoing recorded changes, while recording
+        self._undo = None
+        # Employee IDs in order before the first recorded removal
+        self._undo_order = None
+
+    @property
+    def unique_phones(self):
+        """bool: Whether two employees may not share a phone number."""
+        return self._indexes.unique_phones
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, emp_id):
+        return emp_id in self.by_id
+
+    def snapshot(self):
+        """
+        Get an unchanging view of the current roster.
+
+        The next change copies the roster's tables (see the module
+        docstring); prefer reading() or slice() for reads that finish at once.
+
+        Returns:
+            RosterSnapshot: Employees and indexes as of now
+        """
+        with self._publish_lock:
+            self._shared = True
+            return RosterSnapshot(self.by_id, self._indexes)
+
+    @contextmanager
+    def reading(self):
+        """
+        Read the current roster without taking a snapshot.
+
+        Unlike a snapshot, this does not make the next change copy the
+        roster, but changes wait until the block ends: keep it short and do
+        not use the view afterwards.
+
+        Yields:
+            RosterSnapshot: View of the live employees and indexes
+        """
+        with self._publish_lock:
+            yield RosterSnapshot(self.by_id, self._indexes)
+
+    def slice(self, start=0, stop=None):
+        """
+        Get employees by position in insertion order, without a snapshot.
+
+        Args:
+            start (int): Position of the first employee
+            stop (int, optional): Position to stop before; None for the end
+
+        Returns:
+            list: Employee/Manager objects
+        """
+        with self._publish_lock:
+            return list(islice(self.by_id.values(), start, stop))
+
+    def _acquire_unshared(self):
+        """
+        Take the publish lock for an in-place change, first copying data a
+        snapshot may be using (an O(n) shallow copy). Call with self.lock held.
+        """
+        while True:
+            # Copy outside the publish lock so readers are not held up
+            copies = (dict(self.by_id), self._indexes.copy()) if self._shared else None
+            self._publish_lock.acquire()
+            if copies is not None:
+                self.by_id, self._indexes = copies
+                self._shared = False
+            if not self._shared:
+                return
+            # A snapshot was taken while checking; copy again
+            self._publish_lock.release()
+
+    def add(self, employee):
+        """
+        Add a new employee.
+
+        Args:
+            employee: Employee or Manager object
+
+        Raises:
+            ValueError: If the ID exists, or phone numbers must be unique and this one is in use
+        """
+        with self.lock:
+            self._acquire_unshared()
+            try:
+                if employee.id in self.by_id:
+                    raise ValueError(f"Employee with ID '{employee.id}' already exists")
+                self._indexes.add(employee)
+                self.by_id[employee.id] = employee
+                if self._undo is not None:
+                    self._undo.append((self.remove, employee.id))
+            finally:
+                self._publish_lock.release()
+
+    def remove(self, emp_id):
+        """
+        Remove an employee.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            Employee/Manager object that was removed, None if not found
+        """
+        with self.lock:
+            self._acquire_unshared()
+            try:
+                if self._undo is not None and self._undo_order is None and emp_id in self.by_id:
+                    self._undo_order = list(self.by_id)
+                employee = self.by_id.pop(emp_id, None)
+                if employee is not None:
+                    self._indexes.remove(emp_id)
+                    if self._undo is not None:
+                        self._undo.append((self.add, employee))
+                return employee
+            finally:
+                self._publish_lock.release()
+
+    def replace(self, employee):
+        """
+        Swap in a new object for an existing employee, keeping its position.
+
+        Args:
+            employee: Employee or Manager object with the ID to replace
+
+        Raises:
+            ValueError: If the ID doesn't exist, or phone numbers must be
+                unique and the new one is in use
+        """
+        with self.lock:
+            self._acquire_unshared()
+            try:
+                if employee.id not in self.by_id:
+                    raise ValueError(f"Employee with ID '{employee.id}' not found")
+                self._indexes.check(employee)
+                self._indexes.remove(employee.id)
+                self._indexes.add(employee)
+                if self._undo is not None:
+                    self._undo.append((self.replace, self.by_id[employee.id]))
+                self.by_id[employee.id] = employee
+            finally:
+                self._publish_lock.release()
+
+    def reindex(self, emp_id):
+        """
+        Update the indexes after an employee object was edited in place.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            Employee/Manager object, None if not found
+
+        Raises:
+            ValueError: If phone numbers must be unique and the new one is in use
+        """
+        with self.lock:
+            self._acquire_unshared()
+            try:
+                employee = self.by_id.get(emp_id)
+                if employee is not None:
+                    self._indexes.update(employee)
+                return employee
+            finally:
+                self._publish_lock.release()
+
+    def reset(self, employees):
+        """
+        Replace every employee.
+
+        Args:
+            employees (iterable): Employee and Manager objects
+
+        Raises:
+            ValueError: If two employees share an ID, or a phone number when
+                phone numbers must be unique; the roster is unchanged
+        """
+        employees_by_id = {}
+        for employee in employees:
+            if employee.id in employees_by_id:
+                raise ValueError(f"Duplicate employee ID '{employee.id}'")
+            employees_by_id[employee.id] = employee
+        indexes = EmployeeIndexes.from_employees(employees_by_id.values(), self.unique_phones)
+
+        with self.lock, self._publish_lock:
+            self.by_id, self._indexes = employees_by_id, indexes
+            self._shared = False
+
+    def record_changes(self):
+        """
+        Start recording changes made through add(), remove() and replace()
+        so rollback() can undo them. Edits reindexed in place are not
+        recorded.
+
+        Call with self.lock held, and hold it until stop_recording() or
+        rollback().
+        """
+        self._undo = []
+        self._undo_order = None
+
+    def stop_recording(self):
+        """Stop recording changes and keep them."""
+        self._undo = None
+        self._undo_order = None
+
+    def rollback(self):
+        """Undo every change recorded since record_changes() and stop recording."""
+        undo, order = self._undo, self._undo_order
+        self.stop_recording()
+        for method, argument in reversed(undo):
+            method(argument)
+
+        if order is not None:
+            # Removed employees were added back at the end; put them back in place
+            with self._publish_lock:
+                self.by_id = {emp_id: self.by_id[emp_id] for emp_id in order if emp_id in self.by_id}
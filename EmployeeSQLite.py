@@ -0,0 +1,184 @@
+"""
+Employee Management System - SQLite Storage Module
+
+This module is the SQLite back end of EmployeeStorage, for data files named
+'.db', '.sqlite' or '.sqlite3' or opened with storage='sqlite':
+- One employees table in a file-backed database in WAL mode, so readers of
+  the file are not blocked by a save
+- The ID (unique) and department columns are indexed
+- Statements are constants with ? parameters, prepared once by sqlite3
+- Full saves insert every row with executemany; later saves upsert or delete
+  only the changed rows, each save in one transaction
+"""
+
+import os
+import sqlite3
+import threading
+from employee import Employee, Manager
+from EmployeeStats import instrumented, timed_method
+from EmployeeStorage import EmployeeStorage
+
+# seq keeps insertion order, so an edited row stays where it was
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS employees (
+        seq INTEGER PRIMARY KEY,
+        id TEXT NOT NULL UNIQUE,
+        fname TEXT NOT NULL,
+        lname TEXT NOT NULL,
+        department TEXT NOT NULL,
+        ph_number TEXT NOT NULL,
+        employee_type TEXT NOT NULL,
+        team_size INTEGER,
+        office_number TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS employees_department ON employees (department)",
+)
+
+# Statements are constants with ? parameters, so sqlite3 prepares each one
+# once and reuses it from its statement cache
+_SELECT_ALL = ("SELECT id, fname, lname, department, ph_number, employee_type, team_size, office_number "
+               "FROM employees ORDER BY seq")
+_INSERT = ("INSERT INTO employees (id, fname, lname, department, ph_number, employee_type, team_size, office_number) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+_UPSERT = _INSERT + (
+    " ON CONFLICT (id) DO UPDATE SET fname = excluded.fname, lname = excluded.lname,"
+    " department = excluded.department, ph_number = excluded.ph_number, employee_type = excluded.employee_type,"
+    " team_size = excluded.team_size, office_number = excluded.office_number"
+)
+_DELETE = "DELETE FROM employees WHERE id = ?"
+_DELETE_ALL = "DELETE FROM employees"
+
+
+@instrumented
+class SQLiteStorage(EmployeeStorage):
+    """
+    SQLite database file in WAL mode.
+
+    Each save is one SQLite transaction: save_all replaces the table with
+    batched inserts (executemany), and save_changes upserts edited and
+    created rows and deletes removed ones by ID, so its cost depends only on
+    the number of changes. Saves are atomic whether or not transaction is set.
+
+    With sync_every=1 and no sync_interval every commit is fsynced
+    (synchronous=FULL). Otherwise commits are only synced at WAL checkpoints
+    (synchronous=NORMAL): a power loss may drop the latest saves, but never
+    corrupts the database.
+
+    Attributes:
+        filename (str): Name of the database file
+    """
+
+    def __init__(self, filename, sync_every=1, sync_interval=None):
+        """
+        Initialize the storage; the database is opened on first use.
+
+        Args:
+            filename (str): Name of the database file
+            sync_every (int): 1 to fsync every save
+            sync_interval (float, optional): Any value allows unsynced commits, as sync_every > 1 does
+
+        Raises:
+            ValueError: If sync_every is not a positive integer
+        """
+        if not isinstance(sync_every, int) or sync_every < 1:
+            raise ValueError("sync_every must be a positive integer")
+        self.filename = filename
+        self._synchronous = 'FULL' if sync_every == 1 and sync_interval is None else 'NORMAL'
+        self._connection = None
+        # The connection is used by the caller's thread and the writer thread
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the database and create the table if needed. Call with self._lock held."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.filename, isolation_level=None, check_same_thread=False)
+            try:
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.execute(f"PRAGMA synchronous = {self._synchronous}")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    @timed_method('sqlite.load')
+    def load(self):
+        """
+        Read the table in insertion order (see EmployeeStorage.load).
+
+        Rows were validated when they were saved, so they are not checked again.
+        """
+        if not os.path.exists(self.filename):
+            raise FileNotFoundError(f"Database file '{self.filename}' not found")
+
+        employees = []
+        with self._lock:
+            try:
+                rows = self._connect().execute(_SELECT_ALL)
+                for emp_id, fname, lname, department, phone, emp_type, team_size, office_number in rows:
+                    if emp_type == 'M':
+                        employees.append(Manager._from_checked(
+                            emp_id, fname, lname, department, phone, team_size, office_number))
+                    else:
+                        employees.append(Employee._from_checked(emp_id, fname, lname, department, phone))
+            except sqlite3.Error as e:
+                raise IOError(f"Unable to read database '{self.filename}': {e}")
+        return employees, 0
+
+    def should_compact(self, changes, record_count):
+        """Rows are changed in place, so there is never anything to compact."""
+        return False
+
+    @timed_method('sqlite.save_all')
+    def save_all(self, employees):
+        """Replace every row in one transaction."""
+        def apply(connection):
+            connection.execute(_DELETE_ALL)
+            connection.executemany(_INSERT, map(_employee_params, employees))
+        self._write(apply)
+
+    @timed_method('sqlite.save_changes')
+    def save_changes(self, changes, transaction=False):
+        """Upsert created and edited rows and delete removed ones in one transaction."""
+        deleted = [(emp_id,) for emp_id, employee in changes.items() if employee is None]
+        saved = [_employee_params(employee) for employee in changes.values() if employee is not None]
+
+        def apply(connection):
+            if deleted:
+                connection.executemany(_DELETE, deleted)
+            if saved:
+                connection.executemany(_UPSERT, saved)
+        self._write(apply)
+
+    def _write(self, apply):
+        """Run apply(connection) in a transaction, rolling it back if it fails."""
+        with self._lock:
+            try:
+                connection = self._connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    apply(connection)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                raise IOError(f"Unable to write to database '{self.filename}': {e}")
+
+    def close(self):
+        """Close the database; a later call reopens it."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _employee_params(employee):
+    """Get the _INSERT parameters for an employee."""
+    if isinstance(employee, Manager):
+        return (employee.id, employee.fname, employee.lname, employee.department, employee.getphNumber(),
+                'M', employee.team_size, employee.office_number)
+    return (employee.id, employee.fname, employee.lname, employee.department, employee.getphNumber(),
+            'E', None, None)
@@ -0,0 +1,334 @@
+"""
+Employee Management System - Service Module
+
+This module serves the roster to other tools over a local socket (TCP or
+Unix domain) with a JSON Lines protocol: one request object per line in,
+one response object per line out, in request order on each connection.
+
+Requests:
+    {"op": "find", "id": "E001"}
+    {"op": "list", "department": "ENG", "offset": 0, "limit": 100}
+    {"op": "create", "id": "E100", "fname": "Ann", "lname": "Lee", "department": "ENG", "ph_number": "5551234567"}
+    {"op": "update", "id": "E100", "department": "FIN"}
+    {"op": "delete", "id": "E100"}
+
+Creates, updates and deletes take the same fields as batch operations (see
+EmployeeController.apply_batch) and go through the same validation. A
+request may carry a "req" value, which is echoed in its response.
+
+Responses are {"ok": true, ...} with "employee" or "employees" records, or
+{"ok": false, "error": "..."}.
+
+Concurrency:
+- Requests are read and answered on one event loop; reads are served there
+  directly and do not wait for anything, not even for writes being saved
+- Creates, updates and deletes are applied on a worker thread, so a slow
+  step (a compaction that copies the roster, or a full save queue) does not
+  stall other connections. The controller applies each change in a single
+  step, so reads never see a half-applied edit
+- Writes to the same ID are serialized by a per-ID lock that is held until
+  the change is on disk, so they complete in arrival order
+- Saves go to the controller's background writer; writes that are waiting
+  share one flush (group commit)
+
+Run with: python3 EmployeeService.py employee_data.csv --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import asynccontextmanager
+from itertools import islice
+from EmployeeApp import EMPLOYEE_FIELDS, MANAGER_FIELDS, EmployeeController
+from EmployeeStorage import STORAGE_KINDS
+from EmployeeView import output_to
+from employee import Manager
+
+# Service operations; writes map onto the batch operations
+READ_OPERATIONS = ('find', 'list')
+WRITE_OPERATIONS = {'create': 'create', 'update': 'edit', 'delete': 'delete'}
+
+# Records per list response when the request gives no limit, and the most allowed
+LIST_LIMIT = 100
+MAX_LIST_LIMIT = 1000
+
+# Longest request line accepted, in bytes
+MAX_REQUEST_SIZE = 64 * 1024
+
+
+def employee_record(employee):
+    """
+    Get an employee as a JSON-ready dict with the fields used in requests.
+
+    Args:
+        employee: Employee or Manager object
+
+    Returns:
+        dict: id, employee_type and the editable fields; ph_number is digits only
+    """
+    manager = isinstance(employee, Manager)
+    record = {'id': employee.id, 'employee_type': 'M' if manager else 'E'}
+    for field in MANAGER_FIELDS if manager else EMPLOYEE_FIELDS:
+        record[field] = employee.getphNumber() if field == 'ph_number' else getattr(employee, field)
+    return record
+
+
+def _request_id(request):
+    """Get a request's employee ID, raising ValueError unless it is a non-empty string."""
+    emp_id = request.get('id')
+    if not isinstance(emp_id, str) or not emp_id:
+        raise ValueError("id is required")
+    return emp_id
+
+
+class EmployeeService:
+    """
+    Asyncio JSON Lines server over an EmployeeController.
+
+    The controller should be created with async_saves=True so that writes
+    are not held up by the disk. Other threads may use it too, but a long
+    change there (such as a merge) holds up the service's writes.
+
+    Attributes:
+        controller (EmployeeController): Controller with its data loaded
+    """
+
+    def __init__(self, controller):
+        """
+        Initialize the service.
+
+        Args:
+            controller (EmployeeController): Controller with its data loaded
+        """
+        self.controller = controller
+        self._server = None
+        # Employee ID -> [lock, number of requests using it]
+        self._locks = {}
+        # Writes applied so far, and how many of them are known to be on disk
+        self._applied = 0
+        self._durable = 0
+        self._flushing = None
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """
+        Start listening.
+
+        Args:
+            host (str): TCP address to bind
+            port (int): TCP port; 0 picks a free one
+            path (str, optional): Unix socket path to listen on instead of TCP
+
+        Returns:
+            asyncio.base_events.Server: The listening server
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path, limit=MAX_REQUEST_SIZE)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port, limit=MAX_REQUEST_SIZE)
+        return self._server
+
+    async def close(self):
+        """
+        Stop listening and wait for saves in progress.
+
+        Raises:
+            IOError: If a background save failed
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await asyncio.get_running_loop().run_in_executor(None, self.controller.flush)
+
+    async def _handle_client(self, reader, writer):
+        """Answer the requests of one connection until it closes."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(self._encode({'ok': False, 'error': "Request too long"}))
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(self._encode(await self.handle_line(line)))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _encode(response):
+        """Serialize a response as one line."""
+        return (json.dumps(response) + "\n").encode('utf-8')
+
+    async def handle_line(self, line):
+        """
+        Answer one request line.
+
+        Args:
+            line (bytes or str): JSON request
+
+        Returns:
+            dict: Response
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'ok': False, 'error': f"Invalid JSON: {e}"}
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': "Request must be an object"}
+
+        try:
+            response = await self.handle_request(request)
+        except (ValueError, IOError) as e:
+            response = {'ok': False, 'error': str(e)}
+        if 'req' in request:
+            response['req'] = request['req']
+        return response
+
+    async def handle_request(self, request):
+        """
+        Answer one request.
+
+        Args:
+            request (dict): Request, as described in the module docstring
+
+        Returns:
+            dict: Successful response
+
+        Raises:
+            ValueError: If the request is malformed or fails validation
+            IOError: If the change could not be saved
+        """
+        op = request.get('op')
+        if op == 'find':
+            emp_id = _request_id(request)
+            employee = self.controller.find_employee_by_id(emp_id)
+            if employee is None:
+                raise ValueError(f"Employee with ID '{emp_id}' not found")
+            return {'ok': True, 'employee': employee_record(employee)}
+
+        if op == 'list':
+            return {'ok': True, 'employees': self._list(request)}
+
+        if op in WRITE_OPERATIONS:
+            return await self._write(request)
+
+        raise ValueError(f"op must be one of {READ_OPERATIONS + tuple(WRITE_OPERATIONS)}, got {op!r}")
+
+    def _list(self, request):
+        """Get one page of employee records, optionally from a single department."""
+        offset, limit = request.get('offset', 0), request.get('limit', LIST_LIMIT)
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError("offset must be a non-negative integer")
+        if not isinstance(limit, int) or not 0 < limit <= MAX_LIST_LIMIT:
+            raise ValueError(f"limit must be an integer from 1 to {MAX_LIST_LIMIT}")
+
+        department = request.get('department')
+        if department is not None and not isinstance(department, str):
+            raise ValueError("department must be a string")
+        if department is not None:
+            employees = islice(self.controller.find_employees_by_department(department), offset, offset + limit)
+        else:
+            employees = self.controller.list_employees(offset, limit)
+        return [employee_record(employee) for employee in employees]
+
+    async def _write(self, request):
+        """Apply a create, update or delete and wait until it is saved."""
+        emp_id = _request_id(request)
+        operation = {key: value for key, value in request.items() if key != 'req'}
+        operation['op'] = WRITE_OPERATIONS[request['op']]
+
+        async with self._id_lock(emp_id):
+            # Off the event loop: applying may compact or wait for room in the save queue
+            await asyncio.get_running_loop().run_in_executor(None, self.controller.apply_operation, operation)
+            self._applied += 1
+            await self._wait_durable(self._applied)
+
+            employee = self.controller.find_employee_by_id(emp_id)
+            if employee is None:
+                return {'ok': True}
+            return {'ok': True, 'employee': employee_record(employee)}
+
+    @asynccontextmanager
+    async def _id_lock(self, emp_id):
+        """Hold the write lock of one employee ID; unused locks are dropped."""
+        entry = self._locks.get(emp_id)
+        if entry is None:
+            entry = self._locks[emp_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[emp_id]
+
+    async def _wait_durable(self, write):
+        """Wait until the numbered write is on disk, sharing flushes between waiting writes."""
+        while self._durable < write:
+            if self._flushing is None:
+                self._flushing = asyncio.ensure_future(self._flush())
+            await asyncio.shield(self._flushing)
+
+    async def _flush(self):
+        """Flush the controller off the event loop; covers every write applied before it started."""
+        covered = self._applied
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.controller.flush)
+            self._durable = max(self._durable, covered)
+        finally:
+            self._flushing = None
+
+
+async def serve(controller, host='127.0.0.1', port=8765, path=None):
+    """
+    Run the service until cancelled.
+
+    Args:
+        controller (EmployeeController): Controller with its data loaded
+        host (str): TCP address to bind
+        port (int): TCP port
+        path (str, optional): Unix socket path to listen on instead of TCP
+    """
+    service = EmployeeService(controller)
+    server = await service.start(host, port, path)
+    where = path or ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving employees on {where}", file=sys.stderr)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+def main():
+    """Serve a data file from the command line until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve the employee roster over JSON Lines")
+    parser.add_argument('filename', help="data file (CSV, .snap for a snapshot, .db for SQLite)")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP address to bind")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port")
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--unique-phones', action='store_true', help="reject duplicate phone numbers")
+    parser.add_argument('--storage', choices=STORAGE_KINDS, help="storage back end (default: from the extension)")
+    args = parser.parse_args()
+
+    controller = EmployeeController(args.filename, unique_phones=args.unique_phones, async_saves=True,
+                                    storage=args.storage)
+    try:
+        with output_to(sys.stderr):
+            if not controller.load_employees():
+                sys.exit(2)
+        asyncio.run(serve(controller, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        controller.close()
+
+
+if __name__ == "__main__":
+    main()
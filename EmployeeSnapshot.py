@@ -0,0 +1,400 @@
+"""
+Employee Management System - Snapshot Module
+
+This module stores a roster in a compact binary snapshot instead of CSV.
+CSV stays the import/export format; snapshots are for fast saves and loads.
+
+File layout (all integers little-endian):
+- Header: magic b'EMPS', format version, record size, record count,
+  string table offset, string count, ID index offset
+- Records: one fixed-width record per employee, in roster order
+- ID index: one uint32 record position per employee, sorted by ID
+- String table: (string count + 1) uint64 offsets followed by the UTF-8
+  bytes of every distinct ID, name, department and office number
+- Trailer: optional bytes after the string table, ignored by readers (the
+  CSV cache keeps its key there, see EmployeeCache)
+
+Version 1 files have no ID index (and no index offset in the header); they
+can still be loaded and read.
+
+Each record holds string table indexes for the ID, first name, last name,
+department and office number, the employee type ('E' or 'M'), the phone
+number as an int64 and the team size (-1 for employees).
+"""
+
+import mmap
+import struct
+from employee import Employee, Manager
+from EmployeeData import atomic_write, load_employees_from_csv, save_employees_to_csv
+from EmployeeStats import add_bytes, timed
+
+SNAPSHOT_EXTENSION = '.snap'
+
+MAGIC = b'EMPS'
+FORMAT_VERSION = 2
+
+PREFIX = struct.Struct('<4sH')
+HEADERS = {
+    1: struct.Struct('<4sHHQQQ'),
+    2: struct.Struct('<4sHHQQQQ'),
+}
+HEADER = HEADERS[FORMAT_VERSION]
+RECORD = struct.Struct('<IIIIcqqI')
+OFFSET_SIZE = 8
+INDEX_ENTRY = struct.Struct('<I')
+
+# String index stored for employees, who have no office number
+NO_STRING = 0xFFFFFFFF
+NO_TEAM = -1
+
+
+def is_snapshot_file(filename):
+    """
+    Check whether a filename refers to a snapshot rather than a CSV file.
+
+    Args:
+        filename (str): File name
+
+    Returns:
+        bool: True if the name ends with SNAPSHOT_EXTENSION
+    """
+    return str(filename).endswith(SNAPSHOT_EXTENSION)
+
+
+@timed('snapshot.save')
+def save_snapshot(employees, filename, trailer=b''):
+    """
+    Save Employee and Manager objects to a binary snapshot file.
+
+    The file is replaced atomically, so a crash mid-save keeps the old
+    snapshot, and readers that already mapped it keep seeing the old data.
+
+    Args:
+        employees (list): List of Employee and Manager objects to save
+        filename (str): Name of the snapshot file to save to
+        trailer (bytes): Written after the string table; readers ignore it
+
+    Raises:
+        IOError: If unable to write to the file
+    """
+    string_indexes = {}
+    strings = []
+
+    def intern(value):
+        index = string_indexes.get(value)
+        if index is None:
+            index = string_indexes[value] = len(strings)
+            strings.append(value.encode('utf-8'))
+        return index
+
+    records = bytearray()
+    for employee in employees:
+        is_manager = isinstance(employee, Manager)
+        records += RECORD.pack(
+            intern(employee.id),
+            intern(employee.fname),
+            intern(employee.lname),
+            intern(employee.department),
+            b'M' if is_manager else b'E',
+            int(employee.getphNumber()),
+            employee.team_size if is_manager else NO_TEAM,
+            intern(employee.office_number) if is_manager else NO_STRING,
+        )
+
+    offsets = [0]
+    for value in strings:
+        offsets.append(offsets[-1] + len(value))
+
+    # Record positions in ID order, compared as UTF-8 bytes like the reader does
+    record_count = len(records) // RECORD.size
+    record_ids = [strings[id_index] for id_index, *_ in RECORD.iter_unpack(records)]
+    id_order = sorted(range(record_count), key=record_ids.__getitem__)
+
+    index_offset = HEADER.size + len(records)
+    strings_offset = index_offset + record_count * INDEX_ENTRY.size
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, record_count,
+                         strings_offset, len(strings), index_offset)
+
+    try:
+        with atomic_write(filename, 'wb') as snapfile:
+            snapfile.write(header)
+            snapfile.write(records)
+            snapfile.write(struct.pack(f'<{record_count}I', *id_order))
+            snapfile.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+            snapfile.write(b''.join(strings))
+            snapfile.write(trailer)
+            add_bytes('snapshot.save', written=snapfile.tell())
+    except IOError as e:
+        raise IOError(f"Unable to write to snapshot file '{filename}': {e}")
+
+
+@timed('snapshot.load')
+def load_snapshot(filename):
+    """
+    Load Employee and Manager objects from a binary snapshot file.
+
+    Records were validated when the snapshot was written, so names,
+    departments and phones are not checked again.
+
+    Args:
+        filename (str): Name of the snapshot file to load from
+
+    Returns:
+        list: List of Employee and Manager objects
+
+    Raises:
+        FileNotFoundError: If the snapshot file doesn't exist
+        ValueError: If the file is not a snapshot or has an unsupported version
+    """
+    try:
+        with open(filename, 'rb') as snapfile:
+            data = snapfile.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Snapshot file '{filename}' not found")
+
+    add_bytes('snapshot.load', read=len(data))
+    header_size, record_count, strings_offset, string_count, _ = read_header(data, filename)
+    strings = _read_strings(data, strings_offset, string_count)
+
+    employees = []
+    records = memoryview(data)[header_size:header_size + record_count * RECORD.size]
+    for id_index, fname_index, lname_index, department_index, emp_type, phone, team_size, office_index \
+            in RECORD.iter_unpack(records):
+        fields = (
+            strings[id_index],
+            strings[fname_index],
+            strings[lname_index],
+            strings[department_index],
+            f"{phone:010d}",
+        )
+        if emp_type == b'M':
+            employees.append(Manager._from_checked(*fields, team_size, strings[office_index]))
+        else:
+            employees.append(Employee._from_checked(*fields))
+
+    return employees
+
+
+def read_header(data, filename="snapshot"):
+    """
+    Parse and check a snapshot header.
+
+    Args:
+        data (bytes): Snapshot contents (at least the header)
+        filename (str): File name used in error messages
+
+    Returns:
+        tuple: (header size, record count, string table offset, string count,
+            ID index offset or None for version 1 files)
+
+    Raises:
+        ValueError: If the file is not a snapshot or has an unsupported version
+    """
+    if len(data) < PREFIX.size or PREFIX.unpack_from(data)[0] != MAGIC:
+        raise ValueError(f"'{filename}' is not an employee snapshot")
+
+    version = PREFIX.unpack_from(data)[1]
+    header = HEADERS.get(version)
+    if header is None or len(data) < header.size:
+        raise ValueError(f"Unsupported snapshot version {version} in '{filename}'")
+
+    _, _, record_size, record_count, strings_offset, string_count, *index_offset = header.unpack_from(data)
+    if record_size != RECORD.size:
+        raise ValueError(f"Unsupported snapshot version {version} in '{filename}'")
+    return header.size, record_count, strings_offset, string_count, (index_offset[0] if index_offset else None)
+
+
+def _read_strings(data, strings_offset, string_count):
+    """Decode the whole string table into a list."""
+    offsets = struct.unpack_from(f'<{string_count + 1}Q', data, strings_offset)
+    blob = data[strings_offset + (string_count + 1) * OFFSET_SIZE:]
+    return [
+        blob[start:end].decode('utf-8')
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+
+class SnapshotReader:
+    """
+    Read-only, memory-mapped access to a snapshot file.
+
+    Nothing is decoded up front: records and their strings are read from the
+    mapping when they are accessed, so opening is nearly instant and every
+    process that maps the same file shares one copy in the page cache.
+    Journal entries that have not been compacted into the snapshot are not
+    visible.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, filename):
+        """
+        Map a snapshot file.
+
+        Args:
+            filename (str): Name of the snapshot file
+
+        Raises:
+            FileNotFoundError: If the snapshot file doesn't exist
+            ValueError: If the file is not a snapshot or has an unsupported version
+        """
+        try:
+            with open(filename, 'rb') as snapfile:
+                self._map = mmap.mmap(snapfile.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Snapshot file '{filename}' not found")
+        except ValueError:
+            # mmap cannot map an empty file
+            raise ValueError(f"'{filename}' is not an employee snapshot")
+
+        try:
+            (self._records_offset, self._count, self._strings_offset,
+             string_count, self._index_offset) = read_header(self._map, filename)
+        except ValueError:
+            self._map.close()
+            raise
+        self._blob_offset = self._strings_offset + (string_count + 1) * OFFSET_SIZE
+
+        # Version 1 files have no ID index; fall back to an in-memory one
+        self._positions = None
+        if self._index_offset is None:
+            self._positions = {self._string(self._field(position, 0)): position
+                               for position in range(self._count)}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def __len__(self):
+        """Return the number of records in the snapshot."""
+        return self._count
+
+    def __getitem__(self, position):
+        """
+        Build the Employee or Manager object stored at a record position.
+
+        Args:
+            position (int): Record position (negative values count from the end)
+
+        Returns:
+            Employee or Manager object
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("Snapshot record position out of range")
+
+        id_index, fname_index, lname_index, department_index, emp_type, phone, team_size, office_index = \
+            RECORD.unpack_from(self._map, self._records_offset + position * RECORD.size)
+        fields = (
+            self._string(id_index),
+            self._string(fname_index),
+            self._string(lname_index),
+            self._string(department_index),
+            f"{phone:010d}",
+        )
+        if emp_type == b'M':
+            return Manager._from_checked(*fields, team_size, self._string(office_index))
+        return Employee._from_checked(*fields)
+
+    def __iter__(self):
+        """Iterate over all records in roster order."""
+        for position in range(self._count):
+            yield self[position]
+
+    def position_of(self, emp_id):
+        """
+        Find the record position of an employee ID.
+
+        Uses a binary search over the ID index, reading only the IDs it
+        compares against.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            int: Record position, None if not found
+        """
+        if self._positions is not None:
+            return self._positions.get(emp_id)
+
+        key = emp_id.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = INDEX_ENTRY.unpack_from(self._map, self._index_offset + middle * INDEX_ENTRY.size)[0]
+            candidate = self._string_bytes(self._field(position, 0))
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return position
+        return None
+
+    def find(self, emp_id):
+        """
+        Build the Employee or Manager object for an ID.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            Employee/Manager object if found, None otherwise
+        """
+        position = self.position_of(emp_id)
+        return None if position is None else self[position]
+
+    def _field(self, position, field):
+        """Read one string index field (0 = ID) of a record."""
+        return struct.unpack_from('<I', self._map, self._records_offset + position * RECORD.size + 4 * field)[0]
+
+    def _string_bytes(self, index):
+        """Read the UTF-8 bytes of one string table entry."""
+        start, end = struct.unpack_from('<2Q', self._map, self._strings_offset + index * OFFSET_SIZE)
+        return self._map[self._blob_offset + start:self._blob_offset + end]
+
+    def _string(self, index):
+        """Read one string table entry."""
+        return self._string_bytes(index).decode('utf-8')
+
+
+def csv_to_snapshot(csv_filename, snapshot_filename):
+    """
+    Import a CSV file into a snapshot file.
+
+    Args:
+        csv_filename (str): CSV file to read
+        snapshot_filename (str): Snapshot file to write
+
+    Returns:
+        int: Number of employees written
+    """
+    employees = load_employees_from_csv(csv_filename)
+    save_snapshot(employees, snapshot_filename)
+    return len(employees)
+
+
+def snapshot_to_csv(snapshot_filename, csv_filename):
+    """
+    Export a snapshot file to a CSV file.
+
+    Args:
+        snapshot_filename (str): Snapshot file to read
+        csv_filename (str): CSV file to write
+
+    Returns:
+        int: Number of employees written
+    """
+    employees = load_snapshot(snapshot_filename)
+    save_employees_to_csv(employees, csv_filename)
+    return len(employees)
@@ -0,0 +1,302 @@
+"""
+Employee Management System - Stats Module
+
+This module is an opt-in instrumentation layer for the hot paths:
+- Call counts and latency histograms for controller operations and file I/O
+- Bytes read and written by the persistence layer
+- Export as a dict or JSON, or as log records through the logging module
+
+Instrumentation is off by default. Methods marked with timed_method() in
+an @instrumented class are then the plain, unwrapped methods: enable() swaps
+timing wrappers onto the class and disable() takes them off again. Functions
+decorated with timed() only pay for a single flag check, and the byte
+counters return immediately. Turn it on with enable(), or by setting the
+EMPLOYEE_STATS environment variable when running EmployeeApp.py (see its
+__main__ block).
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+
+# Upper bounds (seconds) of the latency histogram buckets; slower calls go in a final overflow bucket
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+BUCKET_LABELS = ('<=1us', '<=10us', '<=100us', '<=1ms', '<=10ms', '<=100ms', '<=1s', '<=10s', '>10s')
+
+_enabled = False
+_lock = threading.Lock()
+_stats = {}
+_classes = []
+
+
+class OperationStats:
+    """
+    Counters for one instrumented operation.
+
+    Attributes:
+        count (int): Number of timed calls
+        total_seconds (float): Sum of call latencies
+        max_seconds (float): Slowest call
+        histogram (list): Call counts per LATENCY_BUCKETS bucket
+        bytes_read (int): Bytes read from files
+        bytes_written (int): Bytes written to files
+    """
+
+    __slots__ = ('count', 'total_seconds', 'max_seconds', 'histogram', 'bytes_read', 'bytes_written')
+
+    def __init__(self):
+        """Initialize zeroed counters."""
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * len(BUCKET_LABELS)
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def to_dict(self):
+        """
+        Get the counters as plain data.
+
+        Returns:
+            dict: Counters, mean latency and the histogram keyed by bucket label
+        """
+        return {
+            'count': self.count,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.count if self.count else 0.0,
+            'max_seconds': self.max_seconds,
+            'histogram': dict(zip(BUCKET_LABELS, self.histogram)),
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+        }
+
+
+def enable():
+    """Start recording stats."""
+    global _enabled
+    _enabled = True
+    for cls in _classes:
+        _wrap_methods(cls)
+
+
+def disable():
+    """Stop recording stats; what was recorded so far is kept."""
+    global _enabled
+    _enabled = False
+    for cls in _classes:
+        _unwrap_methods(cls)
+
+
+def is_enabled():
+    """
+    Check whether stats are being recorded.
+
+    Returns:
+        bool: True if enabled
+    """
+    return _enabled
+
+
+def reset():
+    """Drop all recorded stats."""
+    with _lock:
+        _stats.clear()
+
+
+def _operation(name):
+    """Get the counters for an operation, creating them on first use. Call with _lock held."""
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = OperationStats()
+    return stats
+
+
+def record_call(name, seconds):
+    """
+    Record one call of an operation.
+
+    Args:
+        name (str): Operation name, e.g. 'controller.save'
+        seconds (float): Call latency
+    """
+    if not _enabled:
+        return
+    with _lock:
+        stats = _operation(name)
+        stats.count += 1
+        stats.total_seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+
+def add_bytes(name, read=0, written=0):
+    """
+    Add to the bytes read and written by an operation.
+
+    Args:
+        name (str): Operation name, e.g. 'data.read_csv'
+        read (int): Bytes read
+        written (int): Bytes written
+    """
+    if not _enabled:
+        return
+    with _lock:
+        stats = _operation(name)
+        stats.bytes_read += read
+        stats.bytes_written += written
+
+
+def _timing_wrapper(name, func):
+    """Wrap a function so every call is recorded under name, including calls that raise."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record_call(name, time.perf_counter() - start)
+    wrapper._stats_original = func
+    return wrapper
+
+
+def timed(name):
+    """
+    Decorator that records the call count and latency of a function.
+
+    When stats are disabled the wrapper only checks a flag before calling
+    the function. Use timed_method for methods on hot paths.
+
+    Args:
+        name (str): Operation name to record under
+
+    Returns:
+        function: Decorator
+    """
+    def decorator(func):
+        timed_func = _timing_wrapper(name, func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            return timed_func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def timed_method(name):
+    """
+    Mark a method of an @instrumented class for timing.
+
+    The method itself is returned unchanged, so it costs nothing while
+    stats are disabled.
+
+    Args:
+        name (str): Operation name to record under
+
+    Returns:
+        function: Decorator
+    """
+    def decorator(func):
+        func._stats_name = name
+        return func
+    return decorator
+
+
+def instrumented(cls):
+    """
+    Class decorator that lets enable() time the methods marked with timed_method.
+
+    Args:
+        cls (type): Class to register
+
+    Returns:
+        type: The same class
+    """
+    _classes.append(cls)
+    if _enabled:
+        _wrap_methods(cls)
+    return cls
+
+
+def _wrap_methods(cls):
+    """Replace the marked methods of a class with timing wrappers."""
+    for attr, value in list(vars(cls).items()):
+        name = getattr(value, '_stats_name', None)
+        if name is not None and not hasattr(value, '_stats_original'):
+            setattr(cls, attr, _timing_wrapper(name, value))
+
+
+def _unwrap_methods(cls):
+    """Put back the original methods of a class."""
+    for attr, value in list(vars(cls).items()):
+        original = getattr(value, '_stats_original', None)
+        if original is not None:
+            setattr(cls, attr, original)
+
+
+def get_stats():
+    """
+    Get everything recorded so far.
+
+    Returns:
+        dict: Operation name -> counters (see OperationStats.to_dict), sorted by name
+    """
+    with _lock:
+        return {name: _stats[name].to_dict() for name in sorted(_stats)}
+
+
+def to_json(indent=2):
+    """
+    Get the recorded stats as a JSON document.
+
+    Args:
+        indent (int): JSON indentation
+
+    Returns:
+        str: JSON object keyed by operation name
+    """
+    import json
+    return json.dumps(get_stats(), indent=indent)
+
+
+def dump(filename):
+    """
+    Write the recorded stats to a JSON file.
+
+    Args:
+        filename (str): File to write
+
+    Raises:
+        IOError: If unable to write to the file
+    """
+    try:
+        with open(filename, 'w') as statsfile:
+            statsfile.write(to_json())
+    except IOError as e:
+        raise IOError(f"Unable to write stats file '{filename}': {e}")
+
+
+def log_stats(logger=None, level=None):
+    """
+    Log one line per operation, with the full counters attached.
+
+    Each record carries the counters dict as its ``stats`` attribute, so
+    handlers and formatters can use them (e.g. ``%(stats)s``).
+
+    Args:
+        logger (logging.Logger, optional): Logger to use; defaults to this module's
+        level (int, optional): Logging level; defaults to logging.INFO
+    """
+    import logging
+    logger = logger or logging.getLogger(__name__)
+    level = logging.INFO if level is None else level
+    for name, stats in get_stats().items():
+        logger.log(
+            level,
+            f"{name}: {stats['count']} calls, mean {stats['mean_seconds'] * 1000:.3f} ms, "
+            f"max {stats['max_seconds'] * 1000:.3f} ms, "
+            f"{stats['bytes_read']} bytes read, {stats['bytes_written']} bytes written",
+            extra={'stats': {name: stats}},
+        )
@@ -0,0 +1,215 @@
+"""
+Employee Management System - Storage Module
+
+This module lets the controller persist the roster in different back ends
+behind one interface (EmployeeStorage):
+- FileStorage: a CSV or binary snapshot file plus its write-ahead journal
+  (see EmployeeJournal). Changes are appended to the journal, and the main
+  file is rewritten when the journal is compacted. CSV files are loaded
+  through their cache (see EmployeeCache)
+- SQLiteStorage (EmployeeSQLite): an SQLite database file (stdlib sqlite3)
+  in WAL mode, with the ID and department columns indexed. Loads read the
+  table, and saves update, insert or delete only the changed rows, so there
+  is nothing to compact
+
+open_storage() picks the back end from the file extension ('.snap' for a
+snapshot, '.db', '.sqlite' or '.sqlite3' for SQLite, anything else is CSV)
+unless one is named explicitly. The SQLite and lazy loading modules are only
+imported when they are used, to keep startup fast.
+"""
+
+from EmployeeCache import load_csv_cached
+from EmployeeData import save_employees_to_csv
+from EmployeeJournal import JournalWriter, compact, journal_filename, replay_journal, should_compact
+from EmployeeSnapshot import is_snapshot_file, load_snapshot, save_snapshot
+
+# Back ends that open_storage accepts by name
+STORAGE_KINDS = ('csv', 'snapshot', 'sqlite')
+
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+
+def storage_kind(filename):
+    """
+    Get the back end a data file uses, from its extension.
+
+    Args:
+        filename (str): Data file name
+
+    Returns:
+        str: One of STORAGE_KINDS
+    """
+    if is_snapshot_file(filename):
+        return 'snapshot'
+    if str(filename).lower().endswith(SQLITE_EXTENSIONS):
+        return 'sqlite'
+    return 'csv'
+
+
+def open_storage(filename, kind=None, sync_every=1, sync_interval=None):
+    """
+    Create the storage back end for a data file.
+
+    Args:
+        filename (str): Data file name
+        kind (str, optional): One of STORAGE_KINDS; by default chosen by storage_kind()
+        sync_every (int): Changes per fsync (group commit); 1 syncs every save
+        sync_interval (float, optional): Maximum seconds between fsyncs
+
+    Returns:
+        EmployeeStorage: FileStorage or SQLiteStorage
+
+    Raises:
+        ValueError: If kind or sync_every is invalid
+    """
+    if kind is None:
+        kind = storage_kind(filename)
+    if kind not in STORAGE_KINDS:
+        raise ValueError(f"storage must be one of {STORAGE_KINDS}, got {kind!r}")
+    if kind == 'sqlite':
+        from EmployeeSQLite import SQLiteStorage
+        return SQLiteStorage(filename, sync_every, sync_interval)
+    return FileStorage(filename, kind == 'snapshot', sync_every, sync_interval)
+
+
+class EmployeeStorage:
+    """
+    Interface of a storage back end.
+
+    The controller calls save_all and save_changes from one thread at a
+    time (the writer thread with async_saves), and load only once queued
+    saves are done.
+
+    Attributes:
+        filename (str): Data file name
+    """
+
+    def load(self):
+        """
+        Read every stored employee.
+
+        Returns:
+            tuple: (list of Employee/Manager objects in insertion order,
+                number of changes saved since the last save_all)
+
+        Raises:
+            FileNotFoundError: If nothing has been stored yet
+            ValueError: If the stored data is invalid
+        """
+        raise NotImplementedError
+
+    def open_lazy(self, cache_size):
+        """
+        Open the stored employees for lookups by ID without building them all.
+
+        Args:
+            cache_size (int, optional): Most employees kept built at a time;
+                None for the default
+
+        Returns:
+            LazyEmployees, or None if this back end only loads eagerly
+
+        Raises:
+            FileNotFoundError: If nothing has been stored yet
+            ValueError: If the stored data is invalid
+        """
+        return None
+
+    def should_compact(self, changes, record_count):
+        """
+        Decide whether to save everything instead of the changes.
+
+        Args:
+            changes (int): Changes saved since the last save_all, including the pending ones
+            record_count (int): Number of employees
+
+        Returns:
+            bool: True if the next save should be save_all
+        """
+        raise NotImplementedError
+
+    def save_all(self, employees):
+        """
+        Replace the stored employees.
+
+        Args:
+            employees (list): Employee and Manager objects in insertion order
+
+        Raises:
+            IOError: If unable to write
+        """
+        raise NotImplementedError
+
+    def save_changes(self, changes, transaction=False):
+        """
+        Save changes made since the last save.
+
+        Args:
+            changes (dict): Employee ID -> Employee/Manager object for a
+                create or edit, or None for a delete
+            transaction (bool): Apply all of the changes or none of them
+
+        Raises:
+            IOError: If unable to write
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Make every saved change durable and release open files."""
+        raise NotImplementedError
+
+
+class FileStorage(EmployeeStorage):
+    """
+    CSV or snapshot file with a write-ahead journal.
+
+    Attributes:
+        filename (str): Name of the CSV or snapshot file
+        snapshot (bool): Use the binary snapshot format instead of CSV
+    """
+
+    def __init__(self, filename, snapshot=False, sync_every=1, sync_interval=None):
+        """
+        Initialize the storage; no file is opened until it is used.
+
+        Args:
+            filename (str): Name of the CSV or snapshot file
+            snapshot (bool): Use the binary snapshot format instead of CSV
+            sync_every (int): Journal entries per fsync
+            sync_interval (float, optional): Maximum seconds between journal fsyncs
+
+        Raises:
+            ValueError: If sync_every is not a positive integer
+        """
+        self.filename = filename
+        self.snapshot = snapshot
+        self._journal = JournalWriter(journal_filename(filename), sync_every, sync_interval)
+
+    def load(self):
+        """Load the main file and replay its journal (see EmployeeStorage.load)."""
+        load = load_snapshot if self.snapshot else load_csv_cached
+        return replay_journal(load(self.filename), self.filename)
+
+    def open_lazy(self, cache_size):
+        """Index a CSV file by ID (see EmployeeLazy); snapshots load eagerly."""
+        if self.snapshot:
+            return None
+        from EmployeeLazy import LazyEmployees
+        return LazyEmployees(self.filename, cache_size)
+
+    def should_compact(self, changes, record_count):
+        """Compact once the journal is as long as the roster (see EmployeeJournal.should_compact)."""
+        return should_compact(changes, record_count)
+
+    def save_all(self, employees):
+        """Rewrite the main file atomically and remove the journal."""
+        self._journal.close()
+        compact(employees, self.filename, save_snapshot if self.snapshot else save_employees_to_csv)
+
+    def save_changes(self, changes, transaction=False):
+        """Append the changes to the journal."""
+        self._journal.append(changes, transaction)
+
+    def close(self):
+        """Sync and close the journal."""
+        self._journal.close()
@@ -0,0 +1,249 @@
+"""
+Employee Management System - Columnar Store Module
+
+This module keeps a roster as one packed column per field instead of a list
+of Employee/Manager objects, for analytics-style scans such as
+"all phones in ENG" or "average team size per department":
+- Department codes are interned into a small table and stored as integers
+- 10-digit phone numbers are stored as 64-bit integers
+- Team sizes are stored in an integer array (-1 for non-managers)
+
+Filters and aggregates run over whole columns at once, and Employee/Manager
+objects are only built on demand.
+"""
+
+from array import array
+from itertools import compress, repeat
+from operator import eq
+from employee import Employee, Manager
+
+# Team size stored for rows that are not managers
+NO_TEAM = -1
+
+
+class EmployeeStore:
+    """
+    Columnar, append-only store of employee records.
+
+    Attributes:
+        ids (list): Employee IDs
+        fnames (list): First names
+        lnames (list): Last names
+        department_codes (array): Index into the department table per row
+        phones (array): Raw 10-digit phone numbers as int64
+        team_sizes (array): Team size per row, NO_TEAM for employees
+        office_numbers (list): Office number per row, '' for employees
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty store.
+        """
+        self.ids = []
+        self.fnames = []
+        self.lnames = []
+        self.department_codes = array('H')
+        self.phones = array('q')
+        self.team_sizes = array('l')
+        self.office_numbers = []
+
+        self._departments = []        # code -> department
+        self._department_codes = {}   # department -> code
+        self._positions = {}          # ID -> row position
+
+    @classmethod
+    def from_employees(cls, employees):
+        """
+        Build a store from Employee and Manager objects.
+
+        Args:
+            employees (iterable): Employee and Manager objects
+
+        Returns:
+            EmployeeStore: New store holding the employees
+        """
+        store = cls()
+        for employee in employees:
+            store.append(employee)
+        return store
+
+    def __len__(self):
+        """Return the number of records in the store."""
+        return len(self.ids)
+
+    def __iter__(self):
+        """Iterate over materialized Employee/Manager objects in row order."""
+        for position in range(len(self.ids)):
+            yield self.materialize(position)
+
+    def __getitem__(self, position):
+        """Materialize the record at a row position (negative values count from the end)."""
+        if position < 0:
+            position += len(self.ids)
+        if not 0 <= position < len(self.ids):
+            raise IndexError("Store row position out of range")
+        return self.materialize(position)
+
+    def append(self, employee):
+        """
+        Append an already validated Employee or Manager object.
+
+        Args:
+            employee: Employee or Manager object
+
+        Raises:
+            ValueError: If an employee with the same ID is already stored
+        """
+        if employee.id in self._positions:
+            raise ValueError(f"Employee with ID '{employee.id}' already exists")
+
+        self._positions[employee.id] = len(self.ids)
+        self.ids.append(employee.id)
+        self.fnames.append(employee.fname)
+        self.lnames.append(employee.lname)
+        self.department_codes.append(self._intern_department(employee.department))
+        self.phones.append(int(employee.getphNumber()))
+
+        if isinstance(employee, Manager):
+            self.team_sizes.append(employee.team_size)
+            self.office_numbers.append(employee.office_number)
+        else:
+            self.team_sizes.append(NO_TEAM)
+            self.office_numbers.append('')
+
+    def _intern_department(self, department):
+        """Return the code for a department, adding it to the table if new."""
+        code = self._department_codes.get(department)
+        if code is None:
+            code = len(self._departments)
+            self._departments.append(department)
+            self._department_codes[department] = code
+        return code
+
+    @property
+    def departments(self):
+        """Get the distinct department codes in the order first seen."""
+        return list(self._departments)
+
+    def select(self, department=None, employee_type=None):
+        """
+        Find row positions matching all of the given filters.
+
+        Args:
+            department (str, optional): Department code to match
+            employee_type (str, optional): 'E' for employees, 'M' for managers
+
+        Returns:
+            list: Matching row positions in row order
+        """
+        mask = None
+
+        if department is not None:
+            code = self._department_codes.get(department)
+            if code is None:
+                return []
+            mask = bytes(map(eq, self.department_codes, repeat(code)))
+
+        if employee_type is not None:
+            if employee_type not in ('E', 'M'):
+                raise ValueError("Employee type must be 'E' or 'M'")
+            is_manager = (employee_type == 'M')
+            type_mask = bytes((size != NO_TEAM) == is_manager for size in self.team_sizes)
+            mask = type_mask if mask is None else bytes(map(min, mask, type_mask))
+
+        if mask is None:
+            return list(range(len(self.ids)))
+        return list(compress(range(len(self.ids)), mask))
+
+    def phones_in(self, department):
+        """
+        Get the raw phone numbers of everyone in a department.
+
+        Args:
+            department (str): Department code
+
+        Returns:
+            list: 10-digit phone number strings
+        """
+        phones = self.phones
+        return [f"{phones[position]:010d}" for position in self.select(department=department)]
+
+    def count_by_department(self):
+        """
+        Count records per department.
+
+        Returns:
+            dict: Department -> number of employees and managers
+        """
+        counts = [0] * len(self._departments)
+        for code in self.department_codes:
+            counts[code] += 1
+        return dict(zip(self._departments, counts))
+
+    def average_team_size_by_department(self):
+        """
+        Average manager team size per department.
+
+        Returns:
+            dict: Department -> average team size, for departments with managers
+        """
+        totals = [0] * len(self._departments)
+        managers = [0] * len(self._departments)
+        for code, size in zip(self.department_codes, self.team_sizes):
+            if size != NO_TEAM:
+                totals[code] += size
+                managers[code] += 1
+        return {
+            department: totals[code] / managers[code]
+            for code, department in enumerate(self._departments)
+            if managers[code]
+        }
+
+    def position_of(self, emp_id):
+        """
+        Get the row position of an employee ID.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            int: Row position, None if not found
+        """
+        return self._positions.get(emp_id)
+
+    def materialize(self, position):
+        """
+        Build an Employee or Manager object for a row.
+
+        The object is a copy; changing it does not update the store.
+
+        Args:
+            position (int): Row position
+
+        Returns:
+            Employee or Manager object
+        """
+        fields = (
+            self.ids[position],
+            self.fnames[position],
+            self.lnames[position],
+            self._departments[self.department_codes[position]],
+            f"{self.phones[position]:010d}",
+        )
+        team_size = self.team_sizes[position]
+        if team_size == NO_TEAM:
+            return Employee(*fields)
+        return Manager(*fields, team_size, self.office_numbers[position])
+
+    def find(self, emp_id):
+        """
+        Build the Employee or Manager object for an ID.
+
+        Args:
+            emp_id (str): Employee ID
+
+        Returns:
+            Employee/Manager object if found, None otherwise
+        """
+        position = self._positions.get(emp_id)
+        return None if position is None else self.materialize(position)
@@ -4,24 +4,108 @@ Employee Management System - View Module
 This module handles all user interface operations including:
 - Menu display
 - User input prompting
-- Employee data display
+- Employee data display (whole tables, or one page at a time)
 - User message display
 
 The view layer contains no business logic - only input/output operations.
+Output goes through an OutputSink: each menu, table or report is collected
+and written in one call, to stdout by default or to any file-like target
+(see output_to).
 """
 
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from EmployeeQuery import QUERY_FIELDS
+
+# Employees shown per page by browse_employees
+PAGE_SIZE = 20
+
+
+class OutputSink:
+    """
+    Writes view output to a text stream, one whole block at a time.
+
+    Attributes:
+        target: File-like object with write() (a file, io.StringIO, ...),
+            or None for whatever sys.stdout is at the time of writing
+    """
+
+    def __init__(self, target=None):
+        """
+        Initialize a sink.
+
+        Args:
+            target (optional): File-like object to write to; None for sys.stdout
+        """
+        self.target = target
+
+    def write(self, lines):
+        """
+        Write lines with a single write() call and flush them.
+
+        Args:
+            lines (iterable): Lines of text, without trailing newlines
+        """
+        stream = sys.stdout if self.target is None else self.target
+        stream.write("".join(f"{line}\n" for line in lines))
+        stream.flush()
+
+
+_sink = OutputSink()
+
+
+def set_output(sink):
+    """
+    Send all view output to a sink.
+
+    Args:
+        sink (OutputSink): Sink to use from now on
+
+    Returns:
+        OutputSink: The sink that was in use before
+    """
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+@contextmanager
+def output_to(target):
+    """
+    Temporarily send view output to a file-like object.
+
+    Args:
+        target: File-like object, e.g. an open file or io.StringIO
+
+    Yields:
+        The target
+    """
+    previous = set_output(OutputSink(target))
+    try:
+        yield target
+    finally:
+        set_output(previous)
+
+
+def _write(*lines):
+    """Write lines to the current sink in one call."""
+    _sink.write(lines)
+
 
 def display_menu():
     """
     Display the main menu options to the user.
     """
-    print("\nEmployee Management System")
-    print("1. Create New Employee")
-    print("2. Edit Existing Employee")
-    print("3. Delete Existing Employee")
-    print("4. Display Employees")
-    print("5. Quit")
-    print('\n')
+    _write(
+        "\nEmployee Management System",
+        "1. Create New Employee",
+        "2. Edit Existing Employee",
+        "3. Delete Existing Employee",
+        "4. Display Employees",
+        "5. Quit",
+        "\n",
+    )
 
 
 def get_user_input(prompt, input_type="string", validation_func=None):
@@ -48,7 +132,7 @@ def get_user_input(prompt, input_type="string", validation_func=None):
                 if input_type == "string":
                     return user_input
                 else:
-                    print("Input cannot be empty. Please try again.")
+                    _write("Input cannot be empty. Please try again.")
                     continue
 
             # Convert to specified type
@@ -64,15 +148,15 @@ def get_user_input(prompt, input_type="string", validation_func=None):
                 if validation_func(converted_input):
                     return converted_input
                 else:
-                    print("Invalid input. Please try again.")
+                    _write("Invalid input. Please try again.")
                     continue
 
             return converted_input
 
         except ValueError:
-            print(f"Invalid input type. Expected {input_type}. Please try again.")
+            _write(f"Invalid input type. Expected {input_type}. Please try again.")
         except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
+            _write("\nOperation cancelled by user.")
             return None
 
 
@@ -86,8 +170,7 @@ def get_employee_data(is_manager=False):
     Returns:
         dict: Dictionary containing employee data
     """
-    print(f"\nEnter {'Manager' if is_manager else 'Employee'} Information:")
-    print("-" * 40)
+    _write(f"\nEnter {'Manager' if is_manager else 'Employee'} Information:", "-" * 40)
 
     data = {}
     data['id'] = get_user_input("Employee ID: ", "string")
@@ -122,10 +205,52 @@ def get_employee_data(is_manager=False):
     return data
 
 
+def format_employee_row(number, emp):
+    """
+    Format one employee as a row of the employee table.
+
+    The columns after '#' are kept on the employee until it changes, so
+    showing the same employees again does not reformat them.
+
+    Args:
+        number (int): Row number shown in the '#' column
+        emp: Employee or Manager object
+
+    Returns:
+        str: Table row
+    """
+    return f"{number:<3} {emp.table_row(_table_row)}"
+
+
+def _table_row(emp):
+    """Format the columns of an employee's table row after '#'."""
+    emp_type = type(emp).__name__
+    details = ""
+
+    # Add manager-specific details
+    if emp_type == "Manager":
+        details = f"Team:{emp.team_size}, Office:{emp.office_number}"
+
+    return (f"{emp.id:<8} {emp.display_name:<25} {emp.department:<6} "
+            f"{emp.ph_number:<15} {emp_type:<10} {details:<20}")
+
+
+def _table_header(title):
+    """Get the lines of a table title and column headings."""
+    return [
+        f"\n{title}",
+        "="*100,
+        f"{'#':<3} {'ID':<8} {'Name':<25} {'Dept':<6} {'Phone':<15} {'Type':<10} {'Details':<20}",
+        "-"*100,
+    ]
+
+
 def display_employees(employees, title="Employee List"):
     """
     Display employees in a clean, formatted table.
 
+    Prints every employee; use browse_employees for large rosters.
+
     Args:
         employees (list): List of Employee/Manager objects to display
         title (str): Title to display above the list
@@ -134,24 +259,182 @@ def display_employees(employees, title="Employee List"):
         show_message("No employees found.", "info")
         return
 
-    print(f"\n{title}")
-    print("="*100)
-    print(f"{'#':<3} {'ID':<8} {'Name':<25} {'Dept':<6} {'Phone':<15} {'Type':<10} {'Details':<20}")
-    print("-"*100)
+    lines = _table_header(title)
+    lines.extend(format_employee_row(i, emp) for i, emp in enumerate(employees, 1))
+    lines.append("-"*100)
+    lines.append(f"Total: {len(employees)} employees")
+    _sink.write(lines)
+
 
-    for i, emp in enumerate(employees, 1):
-        emp_type = type(emp).__name__
-        details = ""
+class EmployeePages:
+    """
+    Splits employees into pages, reading only as far as the pages asked for.
 
-        # Add manager-specific details
-        if emp_type == "Manager":
-            details = f"Team:{emp.team_size}, Office:{emp.office_number}"
+    Sequences with random access (lists, EmployeeStore, SnapshotReader) are
+    indexed directly. Any other iterable is consumed on demand, and records
+    already read are kept so earlier pages can be shown again; the total is
+    unknown until the last record has been read.
 
-        print(f"{i:<3} {emp.id:<8} {emp.fname + ' ' + emp.lname:<25} {emp.department:<6} "
-              f"{emp.ph_number:<15} {emp_type:<10} {details:<20}")
+    Attributes:
+        page_size (int): Employees per page
+        total (int): Number of employees, or None while not yet known
+    """
 
-    print("-"*100)
-    print(f"Total: {len(employees)} employees")
+    def __init__(self, employees, page_size=PAGE_SIZE):
+        """
+        Initialize pages over employees.
+
+        Args:
+            employees: Sequence or iterable of Employee/Manager objects
+            page_size (int): Employees per page
+
+        Raises:
+            ValueError: If page_size is not a positive integer
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        self.page_size = page_size
+
+        if hasattr(employees, '__getitem__') and hasattr(employees, '__len__'):
+            self._records = employees
+            self._source = None
+            self.total = len(employees)
+        else:
+            self._records = []
+            self._source = iter(employees)
+            self.total = None
+
+    @property
+    def page_count(self):
+        """int: Number of pages (at least 1), or None while the total is not known."""
+        if self.total is None:
+            return None
+        return max(1, -(-self.total // self.page_size))
+
+    def page(self, index):
+        """
+        Get the employees on one page.
+
+        Args:
+            index (int): Page number (0-based)
+
+        Returns:
+            list: Employee/Manager objects on the page
+
+        Raises:
+            IndexError: If the page is past the end
+        """
+        if index < 0:
+            raise IndexError("Page out of range")
+        start = index * self.page_size
+        end = start + self.page_size
+
+        # Read one record past the page so we know whether it is the last one
+        if self._source is not None and len(self._records) <= end:
+            self._records.extend(islice(self._source, end + 1 - len(self._records)))
+            if len(self._records) <= end:
+                self.total = len(self._records)
+                self._source = None
+
+        available = self.total if self.total is not None else len(self._records)
+        if index > 0 and start >= available:
+            raise IndexError("Page out of range")
+        return [self._records[position] for position in range(start, min(end, available))]
+
+    @property
+    def loaded(self):
+        """int: Number of employees read so far (all of them once the total is known)."""
+        return self.total if self.total is not None else len(self._records)
+
+    def employee(self, position):
+        """
+        Get an employee that has already been read.
+
+        Args:
+            position (int): 0-based position in the whole list, below loaded
+
+        Returns:
+            Employee/Manager object
+
+        Raises:
+            IndexError: If the position has not been read
+        """
+        if not 0 <= position < self.loaded:
+            raise IndexError("Employee not read yet")
+        return self._records[position]
+
+
+def display_employee_page(pages, index, title="Employee List"):
+    """
+    Display one page of employees in the employee table layout.
+
+    Args:
+        pages (EmployeePages): Paged employees
+        index (int): Page number (0-based)
+        title (str): Title to display above the page
+
+    Raises:
+        IndexError: If the page is past the end
+    """
+    employees = pages.page(index)
+    if not employees:
+        show_message("No employees found.", "info")
+        return
+
+    lines = _table_header(title)
+    first = index * pages.page_size + 1
+    lines.extend(format_employee_row(i, emp) for i, emp in enumerate(employees, first))
+    lines.append("-"*100)
+    if pages.total is None:
+        lines.append(f"Page {index + 1} (more employees follow)")
+    else:
+        lines.append(f"Page {index + 1} of {pages.page_count} - Total: {pages.total} employees")
+    _sink.write(lines)
+
+
+def browse_employees(employees, title="Employee List", page_size=PAGE_SIZE):
+    """
+    Let the user page through employees one screen at a time.
+
+    Only the visible page is formatted, so this stays responsive for rosters
+    of any size.
+
+    Args:
+        employees: Sequence or iterable of Employee/Manager objects
+        title (str): Title to display above each page
+        page_size (int): Employees per page
+
+    Returns:
+        EmployeePages: The pages that were browsed
+    """
+    pages = EmployeePages(employees, page_size)
+    index = 0
+    display_employee_page(pages, index, title)
+
+    while pages.page_count != 1:
+        command = get_user_input("[n]ext, [p]revious, page number or [q]uit: ", "string")
+        if command is None or command.lower() in ('q', 'quit'):
+            return pages
+
+        if command.lower() in ('', 'n', 'next'):
+            target = index + 1
+        elif command.lower() in ('p', 'prev', 'previous'):
+            target = index - 1
+        elif command.isdigit():
+            target = int(command) - 1
+        else:
+            show_message("Unknown command.", "error")
+            continue
+
+        try:
+            pages.page(target)
+        except IndexError:
+            show_message("No such page.", "warning")
+            continue
+        index = target
+        display_employee_page(pages, index, title)
+
+    return pages
 
 
 def display_employee_details(employee, index=None):
@@ -164,17 +447,21 @@ def display_employee_details(employee, index=None):
     """
     emp_type = type(employee).__name__
 
-    print(f"\n{emp_type} Details" + (f" (Index: {index})" if index is not None else ""))
-    print("-" * 40)
-    print(f"ID: {employee.id}")
-    print(f"Name: {employee.fname} {employee.lname}")
-    print(f"Department: {employee.department}")
-    print(f"Phone (Formatted): {employee.ph_number}")
-    print(f"Phone (Unformatted): {employee.getphNumber()}")
+    lines = [
+        f"\n{emp_type} Details" + (f" (Index: {index})" if index is not None else ""),
+        "-" * 40,
+        f"ID: {employee.id}",
+        f"Name: {employee.display_name}",
+        f"Department: {employee.department}",
+        f"Phone (Formatted): {employee.ph_number}",
+        f"Phone (Unformatted): {employee.getphNumber()}",
+    ]
 
     if emp_type == "Manager":
-        print(f"Team Size: {employee.team_size}")
-        print(f"Office: {employee.office_number}")
+        lines.append(f"Team Size: {employee.team_size}")
+        lines.append(f"Office: {employee.office_number}")
+
+    _sink.write(lines)
 
 
 def show_message(message, msg_type="info"):
@@ -193,7 +480,7 @@ def show_message(message, msg_type="info"):
     }
 
     symbol = symbols.get(msg_type, "•")
-    print(f"\n{symbol} {message}")
+    _write(f"\n{symbol} {message}")
 
 
 def confirm_action(action_description):
@@ -217,7 +504,7 @@ def confirm_action(action_description):
         elif response in ['n', 'no']:
             return False
         else:
-            print("Please enter 'y' for yes or 'n' for no.")
+            _write("Please enter 'y' for yes or 'n' for no.")
 
 
 def get_menu_choice():
@@ -233,6 +520,43 @@ def get_menu_choice():
     return get_user_input("Select an option (1-5): ", "int", validate_choice)
 
 
+def get_query_options():
+    """
+    Ask how to filter and sort the employee list.
+
+    Returns:
+        dict: Criteria for EmployeeController.query; empty to list everyone
+            in roster order, None if cancelled
+    """
+    choice = get_user_input("Filter or sort the list? (y/n): ")
+    if choice is None:
+        return None
+    if choice.lower() not in ('y', 'yes'):
+        return {}
+
+    criteria = {}
+    department = get_user_input("Department (Enter for all): ")
+    if department is None:
+        return None
+    if department:
+        criteria['department'] = department.upper()
+
+    employee_type = get_user_input("(E)mployees or (M)anagers only (Enter for both): ")
+    if employee_type is None:
+        return None
+    if employee_type:
+        criteria['employee_type'] = employee_type.upper()
+
+    sort = get_user_input(f"Sort by ({', '.join(QUERY_FIELDS)}; start with - for descending, "
+                          "Enter for none): ")
+    if sort is None:
+        return None
+    if sort:
+        criteria['descending'] = sort.startswith('-')
+        criteria['sort'] = sort.lstrip('-').lower()
+    return criteria
+
+
 def get_employee_index(max_index):
     """
     Get and validate employee index from user.
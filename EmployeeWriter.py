@@ -0,0 +1,177 @@
+"""
+Employee Management System - Background Writer Module
+
+This module moves saves off the caller's thread, so the interface stays
+responsive when the data file is on slow storage:
+- The controller describes each save as a SaveJob and submits it
+- A single writer thread performs the jobs in order
+- Jobs that queue up while a write is in progress are coalesced: journal
+  appends are merged into one, and a full save replaces everything before it
+- The queue is bounded, so a caller that saves faster than the disk can keep
+  up waits in submit() instead of using unbounded memory
+- flush() waits for everything submitted so far and reports a failed write
+"""
+
+import queue
+import threading
+
+# Kinds of SaveJob
+FULL_SAVE = 'full'
+JOURNAL_APPEND = 'journal'
+
+# Saves that may wait for the writer thread before submit() blocks
+MAX_PENDING_SAVES = 16
+
+
+class SaveJob:
+    """
+    One save, described by values that no longer change.
+
+    Attributes:
+        kind (str): FULL_SAVE or JOURNAL_APPEND
+        employees (list): Copies of every employee, for FULL_SAVE
+        changes (dict): Employee ID -> copy of the employee, or None for a
+            delete, for JOURNAL_APPEND
+        transaction (bool): Journal the changes as one transaction
+    """
+
+    __slots__ = ('kind', 'employees', 'changes', 'transaction')
+
+    def __init__(self, kind, employees=None, changes=None, transaction=False):
+        """
+        Initialize a job.
+
+        Args:
+            kind (str): FULL_SAVE or JOURNAL_APPEND
+            employees (list, optional): Employees to save, for FULL_SAVE
+            changes (dict, optional): Changes to journal, for JOURNAL_APPEND
+            transaction (bool): Journal the changes as one transaction
+        """
+        self.kind = kind
+        self.employees = employees
+        self.changes = changes
+        self.transaction = transaction
+
+
+def coalesce(jobs):
+    """
+    Combine queued jobs into the fewest jobs with the same end result.
+
+    Args:
+        jobs (list): SaveJob objects in submission order
+
+    Returns:
+        list: SaveJob objects to perform in order
+    """
+    combined = []
+    for job in jobs:
+        if job.kind == FULL_SAVE:
+            # Rewrites everything, so nothing queued before it matters
+            combined = [job]
+        elif combined and combined[-1].kind == JOURNAL_APPEND:
+            previous = combined[-1]
+            combined[-1] = SaveJob(JOURNAL_APPEND, changes={**previous.changes, **job.changes},
+                                   transaction=previous.transaction or job.transaction)
+        else:
+            combined.append(job)
+    return combined
+
+
+class BackgroundWriter:
+    """
+    Performs SaveJobs on a writer thread with coalescing and backpressure.
+
+    Attributes:
+        max_pending (int): Queue size after which submit() blocks
+    """
+
+    _STOP = object()
+
+    def __init__(self, write, max_pending=MAX_PENDING_SAVES):
+        """
+        Initialize a writer; the thread starts on the first submit.
+
+        Args:
+            write (function): Called on the writer thread with each SaveJob
+            max_pending (int): Queue size after which submit() blocks
+
+        Raises:
+            ValueError: If max_pending is not a positive integer
+        """
+        if not isinstance(max_pending, int) or max_pending < 1:
+            raise ValueError("max_pending must be a positive integer")
+        self.max_pending = max_pending
+        self._write = write
+        self._queue = queue.Queue(max_pending)
+        self._thread = None
+        self._error = None
+
+    def submit(self, job):
+        """
+        Queue a job, waiting while the queue is full.
+
+        Args:
+            job (SaveJob): Job to perform
+
+        Raises:
+            IOError: If an earlier job failed (reported once)
+        """
+        self._raise_error()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="employee-writer", daemon=True)
+            self._thread.start()
+        self._queue.put(job)
+
+    def flush(self):
+        """
+        Wait until every submitted job has been performed.
+
+        Raises:
+            IOError: If a job failed (reported once)
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Flush and stop the writer thread; a later submit starts a new one.
+
+        Raises:
+            IOError: If a job failed (reported once)
+        """
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def _raise_error(self):
+        """Raise and clear the error of a failed job."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise IOError(f"Background save failed: {error}")
+
+    def _run(self):
+        """Writer thread: take everything queued, coalesce it and write it."""
+        stop = False
+        while not stop:
+            jobs = [self._queue.get()]
+            while True:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if self._STOP in jobs:
+                stop = True
+                jobs = [job for job in jobs if job is not self._STOP]
+
+            try:
+                for job in coalesce(jobs):
+                    self._write(job)
+            except Exception as e:
+                self._error = e
+            finally:
+                for _ in range(len(jobs) + stop):
+                    self._queue.task_done()
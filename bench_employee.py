@@ -0,0 +1,450 @@
+"""
+Employee Management System - Benchmarks
+
+Measures the hot paths of the model, persistence and controller layers on
+synthetic rosters (10k to 10M rows):
+- Employee/Manager construction and setter validation
+- Memory per record
+- load_employees_from_csv and save_employees_to_csv
+- find_employee_by_id
+- Controller create/edit/delete cycles, each followed by a save
+- Startup: a fresh interpreter importing the controller and loading the
+  roster (eagerly and lazily) from a CSV file with a warm cache
+
+Results can be written as JSON and compared against a stored baseline;
+the exit status is 1 if anything regressed beyond the tolerance or a lazy
+startup took longer than the startup target.
+
+Run with: python3 bench_employee.py --records 10000 1000000
+          python3 bench_employee.py --baseline bench_baseline.json
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeData import FIELDNAMES, load_employees_from_csv, save_employees_to_csv
+from EmployeeView import output_to
+
+DEPARTMENTS = ['ENG', 'MKT', 'FIN', 'ITM', 'HRM', 'OPS', 'SLS', 'LGL']
+FIRST_NAMES = ['John', 'Sarah', 'Michael', 'Emily', 'David', 'Jennifer', 'Robert', 'Lisa', 'James', 'Maria']
+LAST_NAMES = ['Doe', 'Johnson', 'Brown', 'Davis', 'Wilson', 'Smith', 'Garcia', 'Miller', 'Anderson', 'Martinez']
+
+# Longest acceptable lazy startup, in seconds, at every roster size; eager
+# startups grow with the roster and are only compared with the baseline
+STARTUP_TARGET_SECONDS = 0.5
+
+# Run in a fresh interpreter: time from the first import to the first lookup
+_STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+import io, sys
+from EmployeeApp import EmployeeController
+from EmployeeView import output_to
+controller = EmployeeController(sys.argv[1], lazy=sys.argv[2] == 'lazy')
+with output_to(io.StringIO()):
+    controller.load_employees()
+controller.find_employee_by_id(sys.argv[3])
+print(time.perf_counter() - start)
+"""
+
+
+def generate_rows(count, manager_ratio=0.2, seed=42):
+    """
+    Generate synthetic employee CSV rows.
+
+    Args:
+        count (int): Number of rows to generate
+        manager_ratio (float): Fraction of rows that are managers
+        seed (int): Random seed, so runs are reproducible
+
+    Returns:
+        generator: Yields rows as lists in FIELDNAMES order
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        is_manager = rng.random() < manager_ratio
+        yield [
+            f"{'M' if is_manager else 'E'}{i:07d}",
+            rng.choice(FIRST_NAMES),
+            rng.choice(LAST_NAMES),
+            rng.choice(DEPARTMENTS),
+            f"{rng.randrange(10 ** 10):010d}",
+            'M' if is_manager else 'E',
+            str(rng.randrange(1, 50)) if is_manager else '',
+            f"{rng.choice('ABCDE')}-{rng.randrange(100, 999)}" if is_manager else '',
+        ]
+
+
+def write_csv(filename, count, manager_ratio=0.2, seed=42):
+    """
+    Write a synthetic roster to a CSV file.
+
+    Args:
+        filename (str): Name of the CSV file to write
+        count (int): Number of rows to write
+        manager_ratio (float): Fraction of rows that are managers
+        seed (int): Random seed
+    """
+    with open(filename, 'w', newline='') as csvfile:
+        csvfile.write(','.join(FIELDNAMES) + '\n')
+        for row in generate_rows(count, manager_ratio, seed):
+            csvfile.write(','.join(row) + '\n')
+
+
+def build_employees(rows):
+    """Construct Employee/Manager objects from generated rows."""
+    employees = []
+    for row in rows:
+        if row[5] == 'M':
+            employees.append(Manager(row[0], row[1], row[2], row[3], row[4], int(row[6]), row[7]))
+        else:
+            employees.append(Employee(row[0], row[1], row[2], row[3], row[4]))
+    return employees
+
+
+def measure_memory(count, manager_ratio=0.2):
+    """
+    Measure memory held by a roster of Employee/Manager objects.
+
+    Args:
+        count (int): Number of records
+        manager_ratio (float): Fraction of rows that are managers
+
+    Returns:
+        dict: Total bytes and bytes per record
+    """
+    rows = list(generate_rows(count, manager_ratio))
+    gc.collect()
+    tracemalloc.start()
+    employees = build_employees(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del employees
+    return {'bytes': current, 'bytes_per_record': current / count}
+
+
+def best_time(func, repeat=1):
+    """
+    Time a function.
+
+    Args:
+        func (function): Function to call with no arguments
+        repeat (int): Number of runs; the fastest is reported
+
+    Returns:
+        float: Best time in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _rate(operations, seconds):
+    """Build a result entry from an operation count and a time."""
+    return {'seconds': seconds, 'ops_per_second': operations / seconds if seconds else float('inf')}
+
+
+def measure_construct(rows, repeat=1):
+    """
+    Measure Employee/Manager construction (with validation).
+
+    Args:
+        rows (list): Generated rows
+        repeat (int): Number of runs
+
+    Returns:
+        dict: Best time and objects per second
+    """
+    return _rate(len(rows), best_time(lambda: build_employees(rows), repeat))
+
+
+def measure_setters(employees, repeat=1):
+    """
+    Measure setter validation by reassigning every editable field.
+
+    Args:
+        employees (list): Employee and Manager objects
+        repeat (int): Number of runs
+
+    Returns:
+        dict: Best time and records per second
+    """
+    def run():
+        for employee in employees:
+            employee.fname = employee.fname
+            employee.lname = employee.lname
+            employee.department = employee.department
+            employee.ph_number = employee.getphNumber()
+            if isinstance(employee, Manager):
+                employee.team_size = employee.team_size
+                employee.office_number = employee.office_number
+
+    return _rate(len(employees), best_time(run, repeat))
+
+
+def measure_load(filename, repeat=1):
+    """
+    Measure load_employees_from_csv throughput.
+
+    Args:
+        filename (str): CSV file to load
+        repeat (int): Number of runs; the fastest is reported
+
+    Returns:
+        dict: Best time in seconds and records per second
+    """
+    loaded = []
+    seconds = best_time(lambda: loaded.append(len(load_employees_from_csv(filename))), repeat)
+    return _rate(loaded[-1], seconds)
+
+
+def measure_save(employees, filename, repeat=1):
+    """
+    Measure save_employees_to_csv throughput.
+
+    Args:
+        employees (list): Employee and Manager objects
+        filename (str): CSV file to write
+        repeat (int): Number of runs
+
+    Returns:
+        dict: Best time and records per second
+    """
+    return _rate(len(employees), best_time(lambda: save_employees_to_csv(employees, filename), repeat))
+
+
+def measure_find(controller, lookups=100000, seed=42, repeat=1):
+    """
+    Measure find_employee_by_id with a mix of existing and missing IDs.
+
+    Args:
+        controller (EmployeeController): Controller holding the roster
+        lookups (int): Number of lookups per run
+        seed (int): Random seed
+        repeat (int): Number of runs
+
+    Returns:
+        dict: Best time and lookups per second
+    """
+    rng = random.Random(seed)
+    ids = [employee.id for employee in controller.employees]
+    keys = [rng.choice(ids) if rng.random() < 0.9 else f"X{i:07d}" for i in range(lookups)]
+
+    def run():
+        for emp_id in keys:
+            controller.find_employee_by_id(emp_id)
+
+    return _rate(lookups, best_time(run, repeat))
+
+
+def measure_controller_cycles(controller, cycles=200):
+    """
+    Measure controller create, edit and delete operations, each saved.
+
+    Every save appends to the journal with the controller's sync settings,
+    so this includes fsync cost.
+
+    Args:
+        controller (EmployeeController): Controller with a loaded roster
+        cycles (int): Number of create/edit/delete cycles
+
+    Returns:
+        dict: Time and operations per second (three operations per cycle)
+    """
+    def run():
+        for i in range(cycles):
+            controller.add_employee(Employee(f"B{i:07d}", "Bench", "User", "ENG", f"555{i:07d}"))
+            controller.save_employees()
+            controller.update_employee(f"B{i:07d}", lname="Edited", department="OPS")
+            controller.save_employees()
+            controller.remove_employee(f"B{i:07d}")
+            controller.save_employees()
+
+    return _rate(3 * cycles, best_time(run))
+
+
+def measure_startup(filename, lazy=False, repeat=1):
+    """
+    Measure startup in a fresh interpreter, from import to the first lookup.
+
+    The first run is not timed; it also writes the CSV cache, so the timed
+    runs measure a warm start of an unchanged file.
+
+    Args:
+        filename (str): CSV file to load
+        lazy (bool): Load lazily instead of building every employee
+        repeat (int): Number of timed runs; the fastest is reported
+
+    Returns:
+        dict: Result entry, one operation per startup
+    """
+    command = [sys.executable, '-c', _STARTUP_SCRIPT, filename, 'lazy' if lazy else 'eager', 'E0000000']
+    directory = os.path.dirname(os.path.abspath(__file__))
+    times = [float(subprocess.run(command, cwd=directory, check=True, capture_output=True, text=True).stdout)
+             for _ in range(repeat + 1)]
+    return _rate(1, min(times[1:]))
+
+
+def run_suite(count, manager_ratio=0.2, seed=42, repeat=1, cycles=200):
+    """
+    Run every benchmark on one roster size.
+
+    Args:
+        count (int): Number of records
+        manager_ratio (float): Fraction of rows that are managers
+        seed (int): Random seed
+        repeat (int): Runs per timing benchmark
+        cycles (int): Controller create/edit/delete cycles
+
+    Returns:
+        dict: Benchmark name -> result entry
+    """
+    results = {'memory': measure_memory(count, manager_ratio)}
+
+    rows = list(generate_rows(count, manager_ratio, seed))
+    results['construct'] = measure_construct(rows, repeat)
+    employees = build_employees(rows)
+    del rows
+    results['setters'] = measure_setters(employees, repeat)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'bench.csv')
+        results['save'] = measure_save(employees, filename, repeat)
+        del employees
+        results['load'] = measure_load(filename, repeat)
+
+        controller = EmployeeController(filename)
+        with output_to(io.StringIO()):
+            controller.load_employees()
+        results['find'] = measure_find(controller, min(count, 100000), seed, repeat)
+        results['controller_cycle'] = measure_controller_cycles(controller, cycles)
+        controller.close()
+
+        results['startup'] = measure_startup(filename, False, repeat)
+        results['startup_lazy'] = measure_startup(filename, True, repeat)
+
+    return results
+
+
+def compare_results(results, baseline, tolerance=0.25):
+    """
+    Find benchmarks that got slower or bigger than a baseline.
+
+    Sizes and benchmarks missing from either side are skipped.
+
+    Args:
+        results (dict): Report from this run
+        baseline (dict): Stored report
+        tolerance (float): Allowed fractional slowdown (or growth for memory)
+
+    Returns:
+        list: One message per regression
+    """
+    regressions = []
+    for size, benchmarks in results['results'].items():
+        for name, result in benchmarks.items():
+            old = baseline.get('results', {}).get(size, {}).get(name)
+            if old is None:
+                continue
+            if 'ops_per_second' in result:
+                if result['ops_per_second'] < old['ops_per_second'] * (1 - tolerance):
+                    regressions.append(f"{name} @ {size}: {result['ops_per_second']:,.0f} ops/s "
+                                       f"vs baseline {old['ops_per_second']:,.0f}")
+            elif result['bytes_per_record'] > old['bytes_per_record'] * (1 + tolerance):
+                regressions.append(f"{name} @ {size}: {result['bytes_per_record']:.0f} bytes/record "
+                                   f"vs baseline {old['bytes_per_record']:.0f}")
+    return regressions
+
+
+def check_startup(results, target=STARTUP_TARGET_SECONDS):
+    """
+    Find lazy startups slower than the target.
+
+    Args:
+        results (dict): Report from this run
+        target (float): Longest acceptable startup in seconds
+
+    Returns:
+        list: One message per roster size over the target
+    """
+    return [f"startup_lazy @ {size}: {benchmarks['startup_lazy']['seconds']:.3f}s vs target {target:.3f}s"
+            for size, benchmarks in results['results'].items()
+            if 'startup_lazy' in benchmarks and benchmarks['startup_lazy']['seconds'] > target]
+
+
+def main():
+    """Run the benchmarks, print a short report and optionally compare with a baseline."""
+    parser = argparse.ArgumentParser(description="Employee Management System benchmarks")
+    parser.add_argument('--records', type=int, nargs='+', default=[10000],
+                        help="roster sizes to benchmark (e.g. 10000 1000000 10000000)")
+    parser.add_argument('--managers', type=float, default=0.2, help="fraction of managers")
+    parser.add_argument('--seed', type=int, default=42, help="random seed for the synthetic rosters")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark; the fastest is reported")
+    parser.add_argument('--cycles', type=int, default=200, help="controller create/edit/delete cycles")
+    parser.add_argument('--json', metavar='FILE', help="write the results to FILE as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="compare the results with a stored JSON report")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument('--startup-target', type=float, default=STARTUP_TARGET_SECONDS,
+                        help="longest acceptable lazy startup in seconds")
+    args = parser.parse_args()
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'manager_ratio': args.managers,
+        'seed': args.seed,
+        'results': {},
+    }
+    for count in args.records:
+        results = report['results'][str(count)] = run_suite(
+            count, args.managers, args.seed, args.repeat, args.cycles)
+
+        print(f"{count:,} records")
+        print(f"  Memory:  {results['memory']['bytes_per_record']:.0f} bytes/record")
+        for name in ('construct', 'setters', 'load', 'save', 'find', 'controller_cycle'):
+            print(f"  {name + ':':<18}{results[name]['ops_per_second']:>14,.0f} ops/s")
+        for name in ('startup', 'startup_lazy'):
+            print(f"  {name + ':':<18}{results[name]['seconds'] * 1000:>14,.1f} ms")
+
+    report['startup_target_seconds'] = args.startup_target
+    if args.json:
+        with open(args.json, 'w') as jsonfile:
+            json.dump(report, jsonfile, indent=2)
+
+    slow_startups = check_startup(report, args.startup_target)
+    for message in slow_startups:
+        print(f"SLOW STARTUP {message}")
+
+    if args.baseline:
+        with open(args.baseline) as jsonfile:
+            regressions = compare_results(report, json.load(jsonfile), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if not regressions:
+            print("No regressions against the baseline")
+        if regressions:
+            sys.exit(1)
+
+    if slow_startups:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,81 @@
+import re
+
+# Error flags set per row by validate_employee_columns (0 means the row is valid)
+FNAME_INVALID = 1
+LNAME_INVALID = 2
+DEPARTMENT_INVALID = 4
+PHONE_INVALID = 8
+
+_NON_DIGITS = re.compile(r'\D')
+
+
+def _is_valid_name(value):
+    """Return True if value is a non-empty name without digits."""
+    # isalpha() rules out digits in one C call; only mixed names need the scan
+    return bool(value) and bool(value.strip()) and (value.isalpha() or not any(map(str.isdigit, value)))
+
+
+def _is_valid_department(value):
+    """Return True if value is exactly 3 uppercase letters."""
+    return bool(value) and len(value) == 3 and value.isupper() and value.isalpha()
+
+
+def sanitize_phone(value):
+    """Return the 10 digits of a phone number, or None if it does not have exactly 10."""
+    if not value:
+        return None
+    if len(value) == 10 and value.isdecimal():
+        return value
+    digits_only = _NON_DIGITS.sub('', value)
+    return digits_only if len(digits_only) == 10 else None
+
+
+def validate_employee_columns(fnames, lnames, departments, phones):
+    """
+    Validate whole columns of employee fields in one pass.
+
+    Applies the same rules as the Employee setters without building objects,
+    so bulk loaders can skip per-field setter calls for valid rows.
+
+    Args:
+        fnames (list): First names
+        lnames (list): Last names
+        departments (list): Department codes
+        phones (list): Phone numbers (can be formatted)
+
+    Returns:
+        tuple: (errors, phone_digits) where errors is a bytearray holding an
+            OR of FNAME_INVALID, LNAME_INVALID, DEPARTMENT_INVALID and
+            PHONE_INVALID per row (0 if valid), and phone_digits is a list of
+            sanitized 10-digit phone numbers (None where invalid)
+    """
+    phone_digits = list(map(sanitize_phone, phones))
+    errors = bytearray(
+        (0 if fname_ok else FNAME_INVALID)
+        | (0 if lname_ok else LNAME_INVALID)
+        | (0 if department_ok else DEPARTMENT_INVALID)
+        | (0 if digits is not None else PHONE_INVALID)
+        for fname_ok, lname_ok, department_ok, digits in zip(
+            map(_is_valid_name, fnames),
+            map(_is_valid_name, lnames),
+            map(_is_valid_department, departments),
+            phone_digits,
+        )
+    )
+    return errors, phone_digits
+
+
+def _format_phone(employee):
+    """Format an employee's phone digits as (XXX)XXX-XXXX."""
+    digits = employee._ph_number
+    return f"({digits[:3]}){digits[3:6]}-{digits[6:]}"
+
+
+def _display_name(employee):
+    """Join an employee's first and last name."""
+    return f"{employee._fname} {employee._lname}"
+
+
 class Employee:
     """
     Employee class to manage employee information with validation.
@@ -8,7 +86,15 @@ class Employee:
         _lname (str): Last name (cannot be empty or contain digits)
         _department (str): Department code (exactly 3 uppercase letters)
         _ph_number (str): Phone number (exactly 10 digits)
+        _formatted_phone (str): ph_number as last built, or None; any field change clears it
+        _display_name (str): display_name as last built, or None; any field change clears it
+        _table_row (str): Table row as last built (see table_row), or None; any field change clears it
     """
+
+    # Fixed attribute slots instead of a per-instance __dict__ keep each record small
+    # (__weakref__ lets lazy loads track employees they handed out; see EmployeeLazy)
+    __slots__ = ('_id', '_fname', '_lname', '_department', '_ph_number', '_formatted_phone', '_display_name',
+                 '_table_row', '__weakref__')
     
     def __init__(self, id, fname, lname, department, ph_number):
         """
@@ -29,6 +115,25 @@ class Employee:
         self.lname = lname
         self.department = department
         self.ph_number = ph_number
+
+    @classmethod
+    def _from_checked(cls, id, fname, lname, department, ph_digits):
+        """
+        Build an Employee from fields that already passed validate_employee_columns.
+
+        Skips the per-field setters, so only rows whose error flags are 0 may be
+        passed, with the sanitized phone digits.
+        """
+        employee = cls.__new__(cls)
+        object.__setattr__(employee, '_id', str(id))
+        object.__setattr__(employee, '_fname', fname)
+        object.__setattr__(employee, '_lname', lname)
+        object.__setattr__(employee, '_department', department)
+        object.__setattr__(employee, '_ph_number', ph_digits)
+        object.__setattr__(employee, '_formatted_phone', None)
+        object.__setattr__(employee, '_display_name', None)
+        object.__setattr__(employee, '_table_row', None)
+        return employee
     
     @property
     def id(self):
@@ -53,7 +158,7 @@ class Employee:
         """
         if not value or not value.strip():
             raise ValueError("First name cannot be empty")
-        if any(char.isdigit() for char in value):
+        if not value.isalpha() and any(map(str.isdigit, value)):
             raise ValueError("First name cannot contain digits")
         self._fname = value
     
@@ -75,7 +180,7 @@ class Employee:
         """
         if not value or not value.strip():
             raise ValueError("Last name cannot be empty")
-        if any(char.isdigit() for char in value):
+        if not value.isalpha() and any(map(str.isdigit, value)):
             raise ValueError("Last name cannot contain digits")
         self._lname = value
     
@@ -105,8 +210,12 @@ class Employee:
     
     @property
     def ph_number(self):
-        """Get formatted phone number as (XXX)XXX-XXXX."""
-        return f"({self._ph_number[:3]}){self._ph_number[3:6]}-{self._ph_number[6:]}"
+        """Get formatted phone number as (XXX)XXX-XXXX, built once until a field changes."""
+        phone = self._formatted_phone
+        if phone is None:
+            phone = _format_phone(self)
+            object.__setattr__(self, '_formatted_phone', phone)
+        return phone
     
     @ph_number.setter
     def ph_number(self, value):
@@ -120,19 +229,42 @@ class Employee:
         Raises:
             ValueError: If phone number doesn't contain exactly 10 digits
         """
-        import re
-
         if not value:
             raise ValueError("Phone number cannot be empty")
 
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', value)
+        digits_only = sanitize_phone(value)
 
-        if len(digits_only) != 10:
+        if digits_only is None:
             raise ValueError("Phone number must contain exactly 10 digits")
 
         self._ph_number = digits_only
 
+    @property
+    def display_name(self):
+        """Get the full name as 'First Last', built once until a field changes."""
+        name = self._display_name
+        if name is None:
+            name = _display_name(self)
+            object.__setattr__(self, '_display_name', name)
+        return name
+
+    def table_row(self, build):
+        """
+        Get the employee's row in the employee table, built once until a field changes.
+
+        Args:
+            build (callable): Function taking the employee and returning the row
+
+        Returns:
+            str: The kept or newly built row
+        """
+        row = self._table_row
+        if row is None:
+            row = build(self)
+            object.__setattr__(self, '_table_row', row)
+        return row
+
     def getphNumber(self):
         """
         Return the unformatted 10-digit phone number.
@@ -142,19 +274,31 @@ class Employee:
         """
         return self._ph_number
 
+    def copy(self):
+        """
+        Return an independent copy, e.g. to hand to another thread.
+
+        Returns:
+            Employee: New object with the same values
+        """
+        return Employee._from_checked(self._id, self._fname, self._lname, self._department, self._ph_number)
+
     def __str__(self):
         """Return string representation of Employee."""
-        return f"Employee(ID: {self._id}, Name: {self._fname} {self._lname}, Dept: {self._department}, Phone: {self.ph_number})"
+        return f"Employee(ID: {self._id}, Name: {self.display_name}, Dept: {self._department}, Phone: {self.ph_number})"
     
     def __repr__(self):
         """Return detailed string representation of Employee."""
         return f"Employee({self._id}, '{self._fname}', '{self._lname}', '{self._department}', '{self._ph_number}')"
     
     def __setattr__(self, name, value):
-        """Prevent modification of _id after initialization."""
+        """Prevent modification of _id after initialization; clear cached strings on any change."""
         if name == '_id' and hasattr(self, '_id'):
             raise AttributeError("Employee ID is read-only and cannot be modified")
-        super().__setattr__(name, value)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_formatted_phone', None)
+        object.__setattr__(self, '_display_name', None)
+        object.__setattr__(self, '_table_row', None)
 
 
 class Manager(Employee):
@@ -166,6 +310,8 @@ class Manager(Employee):
         office_number (str): Office number/location
     """
 
+    __slots__ = ('_team_size', '_office_number')
+
     def __init__(self, id, fname, lname, department, ph_number, team_size, office_number):
         """
         Initialize Manager object with validation.
@@ -186,6 +332,18 @@ class Manager(Employee):
         self.team_size = team_size
         self.office_number = office_number
 
+    @classmethod
+    def _from_checked(cls, id, fname, lname, department, ph_digits, team_size, office_number):
+        """
+        Build a Manager from Employee fields that already passed validate_employee_columns.
+
+        Team size and office number are still validated by their setters.
+        """
+        manager = super()._from_checked(id, fname, lname, department, ph_digits)
+        manager.team_size = team_size
+        manager.office_number = office_number
+        return manager
+
     @property
     def team_size(self):
         """Get team size."""
@@ -226,9 +384,19 @@ class Manager(Employee):
             raise ValueError("Office number cannot be empty")
         self._office_number = value.strip()
 
+    def copy(self):
+        """
+        Return an independent copy, e.g. to hand to another thread.
+
+        Returns:
+            Manager: New object with the same values
+        """
+        return Manager._from_checked(self._id, self._fname, self._lname, self._department, self._ph_number,
+                                     self._team_size, self._office_number)
+
     def __str__(self):
         """Return string representation of Manager (demonstrates polymorphism)."""
-        return f"Manager(ID: {self._id}, Name: {self._fname} {self._lname}, Dept: {self._department}, Phone: {self.ph_number}, Team Size: {self._team_size}, Office: {self._office_number})"
+        return f"Manager(ID: {self._id}, Name: {self.display_name}, Dept: {self._department}, Phone: {self.ph_number}, Team Size: {self._team_size}, Office: {self._office_number})"
 
     def __repr__(self):
         """Return detailed string representation of Manager."""
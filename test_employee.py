@@ -9,7 +9,10 @@ Requirements:
 """
 
 import pytest
-from employee import Employee, Manager
+from employee import (
+    Employee, Manager, validate_employee_columns,
+    FNAME_INVALID, LNAME_INVALID, DEPARTMENT_INVALID, PHONE_INVALID
+)
 
 
 class TestEmployee:
@@ -105,12 +108,35 @@ class TestEmployee:
         with pytest.raises(AttributeError, match="Employee ID is read-only"):
             emp._id = "MODIFIED"
 
+    def test_slots_instead_of_dict(self):
+        """Test that records use fixed slots and reject unknown attributes."""
+        emp = Employee("E001", "John", "Doe", "ENG", "5551234567")
+        mgr = Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201")
+
+        assert not hasattr(emp, "__dict__")
+        assert not hasattr(mgr, "__dict__")
+        with pytest.raises(AttributeError):
+            emp.nickname = "Johnny"
+
     def test_employee_string_representation(self):
         """Test the string representation of Employee objects."""
         emp = Employee("E001", "John", "Doe", "ENG", "5551234567")
         expected = "Employee(ID: E001, Name: John Doe, Dept: ENG, Phone: (555)123-4567)"
         assert str(emp) == expected
 
+    def test_cached_representations(self):
+        """Test that formatted strings are reused until a field changes."""
+        emp = Employee("E001", "John", "Doe", "ENG", "5551234567")
+
+        assert emp.ph_number is emp.ph_number
+        assert emp.display_name is emp.display_name
+        assert emp.display_name == "John Doe"
+        emp.ph_number = "555-000-1111"
+        emp.lname = "Roe"
+        assert emp.ph_number == "(555)000-1111"
+        assert emp.display_name == "John Roe"
+        assert emp.copy().ph_number == "(555)000-1111"
+
 
 class TestManager:
     """Test cases for the Manager class."""
@@ -220,6 +246,59 @@ class TestPolymorphism:
         assert isinstance(mgr, Manager)
 
 
+
+class TestBulkValidation:
+    """Test cases for column-at-a-time validation."""
+
+    def test_error_bitmap(self):
+        """Test that each row gets the flags for the fields that would fail their setters."""
+        errors, digits = validate_employee_columns(
+            ["John", "", "Bob123", "Mary Ann", "Eve"],
+            ["Doe", "Smith", "Jones", "O'Brien", "Lee2"],
+            ["ENG", "ENG", "eng", "FIN", "ENGR"],
+            ["5551234567", "(555) 123-4567", "555-abc-1234", "555.123.4567", ""],
+        )
+
+        assert list(errors) == [
+            0,
+            FNAME_INVALID,
+            FNAME_INVALID | DEPARTMENT_INVALID | PHONE_INVALID,
+            0,
+            LNAME_INVALID | DEPARTMENT_INVALID | PHONE_INVALID,
+        ]
+        assert digits == ["5551234567", "5551234567", None, "5551234567", None]
+
+    def test_matches_setters(self):
+        """Test that rows flagged valid are exactly the rows the constructor accepts."""
+        samples = [
+            ("John", "Doe", "ENG", "5551234567"),
+            ("   ", "Doe", "ENG", "5551234567"),
+            ("Jöhn", "Dœ", "ÄÖÜ", "555 123 4567"),
+            ("John", "Doe", "EN1", "5551234567"),
+            ("John", "Doe", "ENG", "12345678901"),
+        ]
+        errors, _ = validate_employee_columns(*zip(*samples))
+
+        for sample, flags in zip(samples, errors):
+            try:
+                Employee("E001", *sample)
+                accepted = True
+            except ValueError:
+                accepted = False
+            assert accepted == (flags == 0), sample
+
+    def test_from_checked(self):
+        """Test that objects built from checked fields match normally constructed ones."""
+        emp = Employee._from_checked("E001", "John", "Doe", "ENG", "5551234567")
+        mgr = Manager._from_checked("M001", "Jane", "Smith", "ITM", "5559876543", 5, " A-201 ")
+
+        assert repr(emp) == repr(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        assert repr(mgr) == repr(Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"))
+        with pytest.raises(AttributeError, match="read-only"):
+            emp._id = "MODIFIED"
+        with pytest.raises(ValueError, match="Team size"):
+            Manager._from_checked("M002", "Jane", "Smith", "ITM", "5559876543", -1, "A-201")
+
 if __name__ == "__main__":
     # Allow running tests directly with python
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,611 @@
+"""
+Pytest unit tests for the EmployeeController.
+
+These tests drive the controller's non-interactive methods directly,
+so no menu input is needed.
+Run with: pytest test_employee_app.py -v
+"""
+
+import os
+import threading
+import pytest
+import EmployeeJournal
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeData import save_employees_to_csv
+from EmployeeJournal import journal_filename
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Controller pointed at an empty CSV file in a temporary directory."""
+    return EmployeeController(str(tmp_path / "employees.csv"))
+
+
+@pytest.fixture
+def load_controller(tmp_path):
+    """Factory for controllers loaded from a two-employee CSV file; each is closed afterwards."""
+    controllers = []
+
+    def load(**options):
+        controller = EmployeeController(str(tmp_path / "employees.csv"), **options)
+        save_employees_to_csv([
+            Employee("E001", "John", "Doe", "ENG", "5551234567"),
+            Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"),
+        ], controller.filename)
+        controller.load_employees()
+        controllers.append(controller)
+        return controller
+
+    yield load
+    for controller in controllers:
+        controller.close()
+
+
+@pytest.fixture
+def loaded(load_controller):
+    """Controller loaded from a two-employee CSV file."""
+    return load_controller()
+
+
+def reload(controller):
+    """Load a fresh controller from the same file."""
+    fresh = EmployeeController(controller.filename)
+    fresh.load_employees()
+    return fresh
+
+
+class TestEmployeeIndex:
+    """Test cases for the controller's ID index."""
+
+    def test_find_employee_by_id(self, controller):
+        """Test that added employees can be found by ID."""
+        emp = Employee("E001", "John", "Doe", "ENG", "5551234567")
+        mgr = Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201")
+        controller.add_employee(emp)
+        controller.add_employee(mgr)
+
+        assert controller.find_employee_by_id("E001") is emp
+        assert controller.find_employee_by_id("M001") is mgr
+        assert controller.find_employee_by_id("X999") is None
+
+    def test_duplicate_id_rejected(self, controller):
+        """Test that adding a second employee with the same ID raises ValueError."""
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+
+        with pytest.raises(ValueError, match="already exists"):
+            controller.add_employee(Employee("E001", "Jim", "Doe", "ENG", "5551234568"))
+
+    def test_remove_keeps_order(self, controller):
+        """Test that removing an employee updates the index and keeps insertion order."""
+        for i in range(1, 5):
+            controller.add_employee(Employee(f"E00{i}", "Test", "User", "ENG", f"555123456{i}"))
+
+        removed = controller.remove_employee("E002")
+
+        assert removed.id == "E002"
+        assert controller.find_employee_by_id("E002") is None
+        assert [emp.id for emp in controller.employees] == ["E001", "E003", "E004"]
+        assert controller.remove_employee("E002") is None
+
+    def test_load_rebuilds_index(self, controller):
+        """Test that loading from CSV replaces the index."""
+        controller.add_employee(Employee("OLD1", "Old", "Record", "ENG", "5550000000"))
+        save_employees_to_csv([
+            Employee("E001", "John", "Doe", "ENG", "5551234567"),
+            Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"),
+        ], controller.filename)
+
+        controller.load_employees()
+
+        assert controller.find_employee_by_id("OLD1") is None
+        assert isinstance(controller.find_employee_by_id("M001"), Manager)
+        assert len(controller.employees) == 2
+
+
+class TestSecondaryIndexes:
+    """Test cases for the department, last name and phone indexes."""
+
+    @pytest.fixture
+    def staffed(self, tmp_path):
+        """Controller with unique phone numbers and three employees."""
+        controller = EmployeeController(str(tmp_path / "employees.csv"), unique_phones=True)
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.add_employee(Employee("E002", "Sam", "Dover", "FIN", "5551234568"))
+        controller.add_employee(Manager("M001", "Jane", "Smith", "ENG", "5559876543", 5, "A-201"))
+        return controller
+
+    def test_queries(self, staffed):
+        """Test lookups by department, last name prefix and formatted phone."""
+        assert [emp.id for emp in staffed.find_employees_by_department("ENG")] == ["E001", "M001"]
+        assert [emp.id for emp in staffed.find_employees_by_last_name("do")] == ["E001", "E002"]
+        assert [emp.id for emp in staffed.find_employees_by_phone("(555) 987-6543")] == ["M001"]
+        assert staffed.find_employees_by_phone("not a phone") == []
+
+    def test_edit_and_remove_update_indexes(self, staffed):
+        """Test that edits move an employee between index entries and removes drop it."""
+        staffed.update_employee("E001", lname="Smith", department="FIN")
+        staffed.remove_employee("E002")
+
+        assert [emp.id for emp in staffed.find_employees_by_department("FIN")] == ["E001"]
+        assert [emp.id for emp in staffed.find_employees_by_last_name("Sm")] == ["E001", "M001"]
+        assert staffed.find_employees_by_last_name("Do") == []
+
+    def test_duplicate_phone_rejected(self, staffed):
+        """Test that creates and edits reusing a phone number are rejected."""
+        with pytest.raises(ValueError, match="already used"):
+            staffed.add_employee(Employee("E003", "Kim", "Lee", "HRM", "555-123-4567"))
+        with pytest.raises(ValueError, match="already used"):
+            staffed.update_employee("E002", fname="Samuel", ph_number="5551234567")
+
+        assert staffed.find_employee_by_id("E003") is None
+        assert staffed.find_employee_by_id("E002").getphNumber() == "5551234568"
+        assert [emp.id for emp in staffed.find_employees_by_phone("5551234567")] == ["E001"]
+
+    def test_shared_phones_allowed_by_default(self, controller):
+        """Test that phone numbers only need to be unique when configured."""
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.add_employee(Employee("E002", "Jim", "Doe", "ENG", "5551234567"))
+
+        assert len(controller.find_employees_by_phone("5551234567")) == 2
+
+
+class TestIncrementalSave:
+    """Test cases for dirty-tracking saves."""
+
+    def test_create_is_journaled(self, loaded):
+        """Test that a new employee goes to the journal and the CSV is left alone."""
+        with open(loaded.filename) as csvfile:
+            original = csvfile.read()
+
+        loaded.add_employee(Employee("E002", "Sam", "Lee", "FIN", "5550001111"))
+        loaded.save_employees()
+
+        with open(loaded.filename) as csvfile:
+            assert csvfile.read() == original
+        assert os.path.exists(journal_filename(loaded.filename))
+        assert [emp.id for emp in reload(loaded).employees] == ["E001", "M001", "E002"]
+
+    def test_recreate_after_saved_delete(self, loaded):
+        """Test that an ID deleted in one save and created again in the next survives a reload."""
+        loaded.remove_employee("E001")
+        loaded.save_employees()
+        loaded.add_employee(Employee("E001", "Sam", "Lee", "FIN", "5550001111"))
+        loaded.save_employees()
+
+        fresh = reload(loaded)
+        assert [emp.id for emp in fresh.employees] == ["M001", "E001"]
+        assert fresh.find_employee_by_id("E001").fname == "Sam"
+
+    def test_edit_and_delete_are_journaled(self, loaded):
+        """Test that edits and deletes go to the journal and are replayed on load."""
+        with open(loaded.filename) as csvfile:
+            original = csvfile.read()
+
+        loaded.find_employee_by_id("M001").team_size = 9
+        loaded.mark_employee_changed("M001")
+        loaded.remove_employee("E001")
+        loaded.save_employees()
+
+        with open(loaded.filename) as csvfile:
+            assert csvfile.read() == original
+        fresh = reload(loaded)
+        assert [emp.id for emp in fresh.employees] == ["M001"]
+        assert fresh.find_employee_by_id("M001").team_size == 9
+
+    def test_create_then_delete_writes_nothing(self, loaded):
+        """Test that an employee created and deleted between saves never hits the file."""
+        loaded.add_employee(Employee("E002", "Sam", "Lee", "FIN", "5550001111"))
+        loaded.remove_employee("E002")
+        loaded.save_employees()
+
+        assert not os.path.exists(journal_filename(loaded.filename))
+        assert len(reload(loaded).employees) == 2
+
+    def test_compaction(self, loaded, monkeypatch):
+        """Test that a long journal is merged into the CSV and removed."""
+        monkeypatch.setattr(EmployeeJournal, "COMPACT_MIN_ENTRIES", 3)
+
+        for team_size in range(3):
+            loaded.find_employee_by_id("M001").team_size = team_size
+            loaded.mark_employee_changed("M001")
+            loaded.save_employees()
+
+        assert not os.path.exists(journal_filename(loaded.filename))
+        assert reload(loaded).find_employee_by_id("M001").team_size == 2
+
+
+class TestSnapshotController:
+    """Test cases for a controller backed by a binary snapshot file."""
+
+    def test_changes_survive_reload(self, tmp_path):
+        """Test that creates, edits and deletes on a snapshot file are reloaded."""
+        controller = EmployeeController(str(tmp_path / "employees.snap"))
+        controller.load_employees()
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.add_employee(Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"))
+        controller.save_employees()
+
+        controller.find_employee_by_id("M001").team_size = 7
+        controller.mark_employee_changed("M001")
+        controller.remove_employee("E001")
+        controller.add_employee(Employee("E002", "Sam", "Lee", "FIN", "5550001111"))
+        controller.save_employees()
+
+        fresh = EmployeeController(controller.filename)
+        fresh.load_employees()
+        assert [emp.id for emp in fresh.employees] == ["M001", "E002"]
+        assert fresh.find_employee_by_id("M001").team_size == 7
+
+
+class TestDurability:
+    """Test cases for the write-ahead journal and group commit."""
+
+    def test_torn_journal_tail_is_ignored(self, controller):
+        """Test that a half-written final journal entry is dropped on load and repaired on append."""
+        controller.load_employees()
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.save_employees()
+        controller.add_employee(Employee("E002", "Sam", "Lee", "FIN", "5550001111"))
+        controller.save_employees()
+        controller.close()
+
+        # Simulate a crash part-way through writing the last entry
+        journal = journal_filename(controller.filename)
+        with open(journal, 'rb+') as journalfile:
+            journalfile.truncate(journalfile.seek(0, os.SEEK_END) - 12)
+
+        fresh = EmployeeController(controller.filename)
+        fresh.load_employees()
+        assert [emp.id for emp in fresh.employees] == ["E001"]
+
+        fresh.add_employee(Employee("E003", "Ann", "Lee", "FIN", "5550002222"))
+        fresh.save_employees()
+        fresh.close()
+        assert [emp.id for emp in reload(controller).employees] == ["E001", "E003"]
+
+    def test_group_commit(self, tmp_path, monkeypatch):
+        """Test that sync_every batches fsync calls across saves."""
+        syncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: syncs.append(fd) or real_fsync(fd))
+
+        controller = EmployeeController(str(tmp_path / "employees.csv"), sync_every=3)
+        controller.load_employees()
+        controller.add_employee(Employee("E000", "Test", "User", "ENG", "5550000000"))
+        controller.save_employees()  # First save rewrites the unknown file
+        syncs.clear()
+
+        for i in range(1, 7):
+            controller.add_employee(Employee(f"E00{i}", "Test", "User", "ENG", f"555000000{i}"))
+            controller.save_employees()
+        assert len(syncs) == 2
+
+        controller.add_employee(Employee("E007", "Test", "User", "ENG", "5550000007"))
+        controller.save_employees()
+        controller.close()
+        assert len(syncs) == 3
+        assert len(reload(controller).employees) == 8
+
+    def test_zero_team_size_entry(self, controller):
+        """Test that an entry with a zero field passes its CRC check on replay."""
+        controller.load_employees()
+        controller.add_employee(Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"))
+        controller.save_employees()
+        controller.find_employee_by_id("M001").team_size = 0
+        controller.mark_employee_changed("M001")
+        controller.save_employees()
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.save_employees()
+        controller.close()
+
+        fresh = reload(controller)
+        assert fresh.find_employee_by_id("M001").team_size == 0
+        assert fresh.find_employee_by_id("E001") is not None
+
+    def test_uncommitted_transaction_is_dropped(self, controller):
+        """Test that a batch cut short by a crash is neither replayed nor appended onto."""
+        controller.load_employees()
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.save_employees()
+        controller.apply_batch([
+            {"op": "edit", "id": "E001", "lname": "Smith"},
+            {"op": "create", "id": "E002", "fname": "Sam", "lname": "Lee", "department": "FIN",
+             "ph_number": "5550001111"},
+        ])
+        controller.close()
+
+        # Simulate a crash after the first entry of the transaction
+        journal = journal_filename(controller.filename)
+        with open(journal, 'rb') as journalfile:
+            lines = journalfile.readlines()
+        assert lines[-2].startswith(b'u,E001')
+        with open(journal, 'wb') as journalfile:
+            journalfile.writelines(lines[:-1])
+
+        fresh = reload(controller)
+        assert [(emp.id, emp.lname) for emp in fresh.employees] == [("E001", "Doe")]
+
+        fresh.add_employee(Employee("E003", "Ann", "Lee", "FIN", "5550002222"))
+        fresh.save_employees()
+        fresh.close()
+        assert [(emp.id, emp.lname) for emp in reload(controller).employees] == [("E001", "Doe"), ("E003", "Lee")]
+
+
+class TestBatch:
+    """Test cases for applying batches of operations."""
+
+    def test_batch_applied_and_saved(self, loaded):
+        """Test creates, edits and deletes applied together and saved once."""
+        results = loaded.apply_batch([
+            {"op": "create", "id": "M002", "employee_type": "M", "fname": "Bo", "lname": "Kim",
+             "department": "OPS", "ph_number": "555-000-1111", "team_size": 3, "office_number": "B-1"},
+            {"op": "edit", "id": "E001", "department": "FIN", "ph_number": "5550002222"},
+            {"op": "delete", "id": "M001"},
+        ])
+
+        assert [result["status"] for result in results] == ["ok", "ok", "ok"]
+        employees = reload(loaded).employees
+        assert [emp.id for emp in employees] == ["E001", "M002"]
+        assert employees[0].department == "FIN"
+        assert employees[1].team_size == 3
+
+    def test_failed_batch_is_rolled_back(self, loaded):
+        """Test that one invalid operation undoes the whole batch by default."""
+        results = loaded.apply_batch([
+            {"op": "edit", "id": "E001", "lname": "Smith"},
+            {"op": "delete", "id": "M001"},
+            {"op": "edit", "id": "E001", "fname": "Jo", "department": "finance"},
+            {"op": "create", "id": "E009", "fname": "Ann"},
+            {"op": "rename", "id": "E001"},
+        ])
+
+        assert [result["status"] for result in results] == [
+            "rolled_back", "rolled_back", "error", "error", "error"]
+        assert "Missing fields: lname" in results[3]["error"]
+        assert [(emp.id, emp.fname, emp.lname) for emp in loaded.employees] == [
+            ("E001", "John", "Doe"), ("M001", "Jane", "Smith")]
+        assert [emp.id for emp in loaded.find_employees_by_last_name("Smith")] == ["M001"]
+        assert not os.path.exists(journal_filename(loaded.filename))
+
+    def test_rollback_keeps_order(self, loaded):
+        """Test that rolling back puts deleted employees back in place and undoes every change."""
+        results = loaded.apply_batch([
+            {"op": "delete", "id": "E001"},
+            {"op": "create", "id": "E002", "fname": "Sam", "lname": "Doe", "department": "ENG",
+             "ph_number": "5551234567"},
+            {"op": "edit", "id": "M001", "team_size": 9},
+            {"op": "delete", "id": "X999"},
+        ])
+
+        assert results[3]["status"] == "error"
+        assert [emp.id for emp in loaded.employees] == ["E001", "M001"]
+        assert loaded.find_employee_by_id("M001").team_size == 5
+        assert [emp.id for emp in loaded.find_employees_by_last_name("Doe")] == ["E001"]
+
+    def test_partial_batch(self, loaded):
+        """Test that atomic=False saves the operations that succeeded, each one whole."""
+        results = loaded.apply_batch([
+            {"op": "edit", "id": "E001", "fname": "Jo", "department": "finance"},
+            {"op": "edit", "id": "M001", "team_size": 7},
+            {"op": "delete", "id": "X999"},
+        ], atomic=False)
+
+        assert [result["status"] for result in results] == ["error", "ok", "error"]
+        employees = reload(loaded).employees
+        assert employees[0].fname == "John"
+        assert employees[1].team_size == 7
+
+
+class TestMerge:
+    """Test cases for merging a CSV into the loaded roster."""
+
+    def test_merge_is_journaled(self, tmp_path):
+        """Test upsert counts, in-place replacement and that unchanged rows are not written."""
+        controller = EmployeeController(str(tmp_path / "employees.csv"), unique_phones=True)
+        save_employees_to_csv([
+            Employee("E001", "John", "Doe", "ENG", "5551234567"),
+            Employee("E002", "Sam", "Lee", "FIN", "5550001111"),
+        ], controller.filename)
+        controller.load_employees()
+        incoming = tmp_path / "incoming.csv"
+        save_employees_to_csv([
+            Employee("E001", "John", "Doe", "ENG", "5551234567"),
+            Manager("E002", "Sam", "Lee", "FIN", "5550001111", 3, "C-3"),
+            Employee("E003", "Ann", "Kim", "OPS", "5551234567"),
+            Employee("E004", "Bo", "Park", "OPS", "5550004444"),
+        ], str(incoming))
+
+        rejects = []
+        counts = controller.merge_employees_from_csv(str(incoming), rejects)
+
+        assert counts == {'inserted': 1, 'updated': 1, 'unchanged': 1, 'rejected': 1}
+        assert "already used" in rejects[0][2]
+        with open(journal_filename(controller.filename)) as journalfile:
+            assert [line.split(',')[1] for line in journalfile.readlines()[1:]] == ["E002", "E004"]
+        employees = reload(controller).employees
+        assert [emp.id for emp in employees] == ["E001", "E002", "E004"]
+        assert isinstance(employees[1], Manager)
+
+
+class TestAsyncSaves:
+    """Test cases for saving on the background writer thread."""
+
+    @pytest.fixture
+    def loaded(self, load_controller):
+        """Async-saving controller loaded from a two-employee CSV file."""
+        return load_controller(async_saves=True)
+
+    def test_saves_are_written_by_flush(self, loaded):
+        """Test that queued saves are on disk once flush returns."""
+        loaded.add_employee(Employee("E002", "Sam", "Lee", "FIN", "5550001111"))
+        loaded.save_employees()
+        loaded.remove_employee("E001")
+        loaded.save_employees()
+        loaded.flush()
+
+        assert [emp.id for emp in reload(loaded).employees] == ["M001", "E002"]
+
+    def test_queued_saves_are_coalesced_and_copied(self, loaded, monkeypatch):
+        """Test that saves queued behind a slow write become one write of the values at save time."""
+        writes = []
+        release = threading.Event()
+        write = loaded._write_job
+
+        def slow_write(job):
+            release.wait()
+            writes.append(job.kind)
+            write(job)
+        monkeypatch.setattr(loaded._writer, "_write", slow_write)
+
+        manager = loaded.find_employee_by_id("M001")
+        for team_size in range(1, 5):
+            manager.team_size = team_size
+            loaded.mark_employee_changed("M001")
+            loaded.save_employees()
+        manager.team_size = 99
+        release.set()
+        loaded.flush()
+
+        assert len(writes) < 4
+        assert reload(loaded).find_employee_by_id("M001").team_size == 4
+
+    def test_failed_write_is_reported(self, loaded, monkeypatch):
+        """Test that flush reports a failed background write and the next save rewrites the file."""
+        def failing_append(changes, transaction=False):
+            raise IOError("disk full")
+        monkeypatch.setattr(loaded._storage, "save_changes", failing_append)
+
+        loaded.remove_employee("E001")
+        loaded.save_employees()
+        with pytest.raises(IOError, match="disk full"):
+            loaded.flush()
+
+        monkeypatch.undo()
+        loaded.save_employees()
+        loaded.flush()
+        assert not os.path.exists(journal_filename(loaded.filename))
+        assert [emp.id for emp in reload(loaded).employees] == ["M001"]
+
+
+class TestMenu:
+    """Test cases for the interactive edit and delete screens."""
+
+    def test_edit_and_delete_show_one_page(self, controller, monkeypatch, capsys):
+        """Test that picking an employee pages through the roster, and any number can still be chosen."""
+        for i in range(25):
+            controller.add_employee(Employee(f"E{i:03d}", "Test", "User", "ENG", f"555000{i:04d}"))
+        controller.page_size = 10
+        answers = iter([
+            "q", "25", "Changed", "", "", "", "",   # edit: stop paging, pick #25, new first name
+            "q", "1", "y", "",                      # delete: stop paging, pick #1, confirm
+        ])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+        controller.edit_existing_employee()
+        controller.delete_existing_employee()
+
+        output = capsys.readouterr().out
+        assert "E010" not in output
+        assert controller.find_employee_by_id("E024").fname == "Changed"
+        assert controller.find_employee_by_id("E000") is None
+        assert next(answers, None) is None
+
+    def test_display_all_takes_no_snapshot(self, controller, monkeypatch, capsys):
+        """Test that listing everyone does not make the next change copy the roster."""
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        monkeypatch.setattr("builtins.input", lambda prompt="": "n")
+
+        controller.display_employees()
+
+        assert "All Employees (1 total)" in capsys.readouterr().out
+        assert not controller._employee_roster._shared
+
+
+class TestConcurrentAccess:
+    """Test cases for atomic edits and snapshot reads."""
+
+    @pytest.fixture
+    def staffed(self, controller):
+        """Controller with two employees."""
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.add_employee(Manager("M001", "Jane", "Smith", "ENG", "5559876543", 5, "A-201"))
+        return controller
+
+    def test_failed_edit_changes_nothing(self, staffed):
+        """Test that an edit failing on a later field leaves the earlier ones unchanged."""
+        before = staffed.find_employee_by_id("E001")
+        with pytest.raises(ValueError):
+            staffed.update_employee("E001", fname="Johnny", department="bad")
+
+        assert staffed.find_employee_by_id("E001") is before
+        assert before.fname == "John"
+
+    def test_edit_replaces_object(self, staffed):
+        """Test that readers holding the old object keep seeing the old values."""
+        before = staffed.find_employee_by_id("E001")
+        after = staffed.update_employee("E001", fname="Johnny", department="FIN")
+
+        assert (before.fname, before.department) == ("John", "ENG")
+        assert staffed.find_employee_by_id("E001") is after
+        assert [emp.id for emp in staffed.find_employees_by_department("FIN")] == ["E001"]
+
+    def test_iteration_sees_snapshot(self, staffed):
+        """Test that changes made while iterating neither raise nor show up."""
+        seen = []
+        for employee in staffed.iter_employees():
+            seen.append(employee.id)
+            staffed.add_employee(Employee(f"N{len(seen)}", "New", "Hire", "OPS", "5550000000"))
+            staffed.remove_employee("M001")
+
+        assert seen == ["E001", "M001"]
+        assert [emp.id for emp in staffed.employees] == ["E001", "N1", "N2"]
+
+    def test_writes_after_snapshot(self, staffed):
+        """Test that writes leave an earlier snapshot's indexes alone, and that list reads take no snapshot."""
+        snapshot = staffed._employee_roster.snapshot()
+        staffed.add_employee(Employee("E002", "Sam", "Doe", "ENG", "5551234567"))
+        staffed.update_employee("M001", department="FIN")
+
+        assert [emp.id for emp in snapshot.in_department("ENG")] == ["E001", "M001"]
+        assert [emp.id for emp in snapshot.with_phone("5551234567")] == ["E001"]
+        assert [emp.id for emp in staffed.find_employees_by_department("ENG")] == ["E001", "E002"]
+        assert [emp.id for emp in staffed.find_employees_by_phone("5551234567")] == ["E001", "E002"]
+
+        staffed.employees, staffed.find_employees_by_last_name("Doe")
+        assert [emp.id for emp in staffed.list_employees(1, 1)] == ["M001"]
+        assert not staffed._employee_roster._shared
+
+    def test_threads(self, staffed):
+        """Test that readers never see a half-applied edit while writers run."""
+        stop = threading.Event()
+        problems = []
+
+        def write(worker):
+            for n in range(300):
+                staffed.update_employee("M001", fname=f"Jane{'x' * (n % 5)}", lname=f"Smith{'x' * (n % 5)}")
+                staffed.add_employee(Employee(f"W{worker}{n:03d}", "New", "Hire", "OPS", "5550000000"))
+                staffed.remove_employee(f"W{worker}{n:03d}")
+
+        def read():
+            while not stop.is_set():
+                try:
+                    for employee in staffed.iter_employees():
+                        if employee.id == "M001" and len(employee.fname) - 4 != len(employee.lname) - 5:
+                            problems.append((employee.fname, employee.lname))
+                    staffed.find_employees_by_department("OPS")
+                except Exception as e:
+                    problems.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        writers = [threading.Thread(target=write, args=(worker,)) for worker in range(2)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert problems == []
+        assert [emp.id for emp in staffed.employees] == ["E001", "M001"]
@@ -0,0 +1,60 @@
+"""
+Pytest unit tests for the EmployeeBatch script runner.
+
+Run with: pytest test_employee_batch.py -v
+"""
+
+import io
+import json
+import pytest
+from employee import Employee
+from EmployeeApp import EmployeeController
+from EmployeeBatch import read_operations, run_batch
+from EmployeeData import save_employees_to_csv
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Controller loaded from a one-employee CSV file."""
+    path = str(tmp_path / "employees.csv")
+    save_employees_to_csv([Employee("E001", "John", "Doe", "ENG", "5551234567")], path)
+    controller = EmployeeController(path)
+    controller.load_employees()
+    return controller
+
+
+class TestBatchScript:
+    """Test cases for running JSON Lines batch scripts."""
+
+    def test_results_written_per_operation(self, controller):
+        """Test that each operation gets a JSON result line and comments are skipped."""
+        script = io.StringIO(
+            '# nightly HR changes\n'
+            '{"op": "edit", "id": "E001", "lname": "Smith"}\n'
+            '\n'
+            '{"op": "create", "id": "E002", "fname": "Sam", "lname": "Lee", '
+            '"department": "FIN", "ph_number": "5550001111"}\n'
+        )
+        output = io.StringIO()
+
+        summary = run_batch(controller, script, output)
+
+        assert summary == {'ok': 2, 'error': 0, 'rolled_back': 0}
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert results == [
+            {'op': 'edit', 'id': 'E001', 'status': 'ok'},
+            {'op': 'create', 'id': 'E002', 'status': 'ok'},
+        ]
+
+    def test_invalid_json_applies_nothing(self, controller):
+        """Test that a malformed line rejects the whole script."""
+        script = ['{"op": "delete", "id": "E001"}\n', '{"op": "delete", \n']
+
+        with pytest.raises(ValueError, match="line 2"):
+            run_batch(controller, script, io.StringIO())
+
+        assert controller.find_employee_by_id("E001") is not None
+
+    def test_non_object_operation(self):
+        """Test that lines parse to whatever JSON they hold, for apply_batch to check."""
+        assert list(read_operations(['[1, 2]\n'])) == [[1, 2]]
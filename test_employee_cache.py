@@ -0,0 +1,101 @@
+"""
+Pytest unit tests for the EmployeeCache module.
+
+Run with: pytest test_employee_cache.py -v
+"""
+
+import os
+import pytest
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeCache import cache_filename, load_csv_cached, valid_cache
+from EmployeeData import save_employees_to_csv
+from EmployeeLazy import LazyEmployees
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """CSV file of an employee and a manager, with no cache yet."""
+    filename = str(tmp_path / "employees.csv")
+    save_employees_to_csv([
+        Employee("E001", "John", "Doe", "ENG", "5551234567"),
+        Manager("M001", "Jane", "Smith", "ENG", "5559876543", 5, "A-201"),
+    ], filename)
+    return filename
+
+
+def no_parse(monkeypatch):
+    """Make parsing the CSV fail, so only the cache can satisfy a load."""
+    def parse(filename):
+        raise AssertionError("CSV parsed")
+    monkeypatch.setattr("EmployeeCache.load_employees_from_csv", parse)
+
+
+class TestLoadCached:
+    """Test cases for loading through the cache."""
+
+    def test_second_load_uses_cache(self, filename, monkeypatch):
+        """Test that the first load writes the cache and the next one skips parsing."""
+        first = load_csv_cached(filename)
+        assert valid_cache(filename)
+
+        no_parse(monkeypatch)
+        second = load_csv_cached(filename)
+        assert [str(emp) for emp in second] == [str(emp) for emp in first]
+        assert second[1].office_number == "A-201"
+
+    def test_changed_file_is_parsed(self, filename):
+        """Test that an edit is seen even when size and modification time are kept."""
+        load_csv_cached(filename)
+        stat = os.stat(filename)
+        with open(filename, 'r+b') as csvfile:
+            data = csvfile.read().replace(b"John", b"Jack")
+            csvfile.seek(0)
+            csvfile.write(data)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert not valid_cache(filename)
+        assert load_csv_cached(filename)[0].fname == "Jack"
+        assert valid_cache(filename)
+
+    def test_bad_cache_and_bad_csv(self, filename):
+        """Test that a corrupt cache is replaced and an invalid CSV writes no cache."""
+        load_csv_cached(filename)
+        with open(cache_filename(filename), 'r+b') as cachefile:
+            cachefile.write(b'junk')
+        assert len(load_csv_cached(filename)) == 2
+        assert valid_cache(filename)
+
+        os.remove(cache_filename(filename))
+        with open(filename, 'a') as csvfile:
+            csvfile.write("E002,Sam,Lee,bad,5550001111,E,,\n")
+        with pytest.raises(ValueError):
+            load_csv_cached(filename)
+        assert not os.path.exists(cache_filename(filename))
+        with pytest.raises(FileNotFoundError):
+            load_csv_cached(filename + ".missing")
+
+
+class TestCachedStartup:
+    """Test cases for the controller and lazy index using the cache."""
+
+    def test_controller_and_lazy_use_cache(self, filename, monkeypatch):
+        """Test that eager and lazy loads of an unchanged file skip the CSV, with the journal on top."""
+        controller = EmployeeController(filename)
+        controller.load_employees()
+        controller.update_employee("E001", department="FIN")
+        controller.save_employees()
+        controller.close()
+
+        no_parse(monkeypatch)
+        fresh = EmployeeController(filename)
+        assert fresh.load_employees()
+        assert fresh.find_employee_by_id("E001").department == "FIN"
+
+        lazy = LazyEmployees(filename)
+        assert lazy._data == b''
+        assert len(lazy) == 2
+        assert lazy.get("E001").department == "FIN"
+        assert lazy.get("M001").team_size == 5
+        assert lazy.get("X999") is None
+        lazy.close()
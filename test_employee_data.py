@@ -0,0 +1,247 @@
+"""
+Pytest unit tests for the EmployeeData persistence layer.
+
+Run with: pytest test_employee_data.py -v
+"""
+
+import pytest
+import EmployeeData
+from employee import Employee, Manager
+from EmployeeData import (
+    iter_employees_from_csv, load_employees_from_csv, load_employees_parallel,
+    save_employees_to_csv
+)
+from EmployeeSnapshot import (
+    HEADERS, MAGIC, RECORD, SnapshotReader, csv_to_snapshot, load_snapshot,
+    read_header, save_snapshot, snapshot_to_csv
+)
+
+HEADER = "id,fname,lname,department,phNumber,employee_type,team_size,office_number\n"
+
+
+@pytest.fixture
+def mixed_csv(tmp_path):
+    """CSV file with two valid rows and two invalid rows."""
+    path = tmp_path / "employees.csv"
+    path.write_text(
+        HEADER
+        + "E001,John,Doe,ENG,5551234567,E,,\n"
+        + "E002,Bob123,Smith,ENG,5551234568,E,,\n"
+        + "M001,Jane,Smith,ITM,5559876543,M,5,A-201\n"
+        + "M002,Mike,Lead,ITM,5559876544,M,five,B-101\n"
+    )
+    return str(path)
+
+
+class TestCsvRoundTrip:
+    """Test cases for saving and loading CSV files."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that saved employees load back with the same type and data."""
+        path = str(tmp_path / "employees.csv")
+        save_employees_to_csv([
+            Employee("E001", "John", "Doe", "ENG", "(555) 123-4567"),
+            Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"),
+        ], path)
+
+        loaded = load_employees_from_csv(path)
+
+        assert [type(emp).__name__ for emp in loaded] == ["Employee", "Manager"]
+        assert loaded[0].getphNumber() == "5551234567"
+        assert loaded[1].team_size == 5
+        assert loaded[1].office_number == "A-201"
+
+    def test_failed_save_keeps_old_file(self, tmp_path):
+        """Test that an error part-way through a save leaves the previous file intact."""
+        path = str(tmp_path / "employees.csv")
+        save_employees_to_csv([Employee("E001", "John", "Doe", "ENG", "5551234567")], path)
+
+        with pytest.raises(AttributeError):
+            save_employees_to_csv([Employee("E002", "Sam", "Lee", "FIN", "5550001111"), None], path)
+
+        assert [emp.id for emp in load_employees_from_csv(path)] == ["E001"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["employees.csv"]
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_employees_from_csv(str(tmp_path / "missing.csv"))
+
+
+class TestIterEmployees:
+    """Test cases for the streaming CSV loader."""
+
+    def test_raise_policy(self, mixed_csv):
+        """Test that the default policy stops at the first invalid row."""
+        records = iter_employees_from_csv(mixed_csv)
+
+        assert next(records).id == "E001"
+        with pytest.raises(ValueError, match="line 3: First name cannot contain digits"):
+            next(records)
+
+    def test_skip_policy(self, mixed_csv):
+        """Test that invalid rows are dropped with the skip policy."""
+        ids = [emp.id for emp in iter_employees_from_csv(mixed_csv, errors="skip")]
+        assert ids == ["E001", "M001"]
+
+    def test_collect_policy(self, mixed_csv):
+        """Test that invalid rows are reported with the collect policy."""
+        rejects = []
+        ids = [emp.id for emp in iter_employees_from_csv(mixed_csv, errors="collect", rejects=rejects)]
+
+        assert ids == ["E001", "M001"]
+        assert [(line, row['id']) for line, row, _ in rejects] == [(3, "E002"), (5, "M002")]
+
+    def test_invalid_policy(self, mixed_csv):
+        """Test that unknown policies and a missing rejects list are rejected up front."""
+        with pytest.raises(ValueError, match="errors must be one of"):
+            iter_employees_from_csv(mixed_csv, errors="ignore")
+        with pytest.raises(ValueError, match="rejects list is required"):
+            iter_employees_from_csv(mixed_csv, errors="collect")
+
+    def test_missing_column(self, tmp_path):
+        """Test that a header without a required column fails once, whatever the policy."""
+        path = tmp_path / "no_phone.csv"
+        path.write_text("id,fname,lname,department\nE001,John,Doe,ENG\nE002,Sam,Lee,FIN\n")
+
+        for errors in ("raise", "skip", "collect"):
+            rejects = []
+            with pytest.raises(ValueError, match="Missing required column in CSV: 'phNumber'"):
+                list(iter_employees_from_csv(str(path), errors=errors, rejects=rejects))
+            assert rejects == []
+
+    def test_rows_across_batches(self, mixed_csv, monkeypatch):
+        """Test that batching does not change order or reported line numbers."""
+        monkeypatch.setattr(EmployeeData, "BATCH_SIZE", 3)
+        rejects = []
+        ids = [emp.id for emp in iter_employees_from_csv(mixed_csv, errors="collect", rejects=rejects)]
+
+        assert ids == ["E001", "M001"]
+        assert [line for line, _, _ in rejects] == [3, 5]
+
+
+class TestParallelLoad:
+    """Test cases for the multi-process CSV loader."""
+
+    @pytest.fixture
+    def large_csv(self, tmp_path):
+        """CSV file with 200 rows, every 50th one invalid."""
+        path = tmp_path / "large.csv"
+        lines = [HEADER]
+        for i in range(200):
+            fname = "Bad1" if i % 50 == 49 else "Test"
+            if i % 3 == 0:
+                lines.append(f"M{i:03d},{fname},User,ENG,555000{i:04d},M,{i},A-{i}\n")
+            else:
+                lines.append(f"E{i:03d},{fname},User,FIN,555000{i:04d},E,,\n")
+        path.write_text("".join(lines))
+        return str(path)
+
+    def test_matches_serial_load(self, large_csv):
+        """Test that records come back in file order with absolute line numbers."""
+        serial_rejects, parallel_rejects = [], []
+        serial = list(iter_employees_from_csv(large_csv, errors="collect", rejects=serial_rejects))
+        parallel = load_employees_parallel(large_csv, workers=2, chunk_size=512,
+                                           errors="collect", rejects=parallel_rejects)
+
+        assert [repr(emp) for emp in parallel] == [repr(emp) for emp in serial]
+        assert [line for line, _, _ in parallel_rejects] == [51, 101, 151, 201]
+        assert parallel_rejects == serial_rejects
+
+    def test_raise_reports_first_error(self, large_csv):
+        """Test that the raise policy reports the first invalid row in the file."""
+        with pytest.raises(ValueError, match="line 51: First name cannot contain digits"):
+            load_employees_parallel(large_csv, workers=2, chunk_size=512)
+
+
+class TestSnapshot:
+    """Test cases for the binary snapshot format."""
+
+    @pytest.fixture
+    def roster(self):
+        """A small mixed roster, including a non-ASCII name."""
+        return [
+            Employee("E001", "John", "Doe", "ENG", "0551234567"),
+            Employee("E002", "Zoë", "Doe", "ENG", "5551234568"),
+            Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201"),
+        ]
+
+    def test_round_trip(self, tmp_path, roster):
+        """Test that a snapshot loads back identical records."""
+        path = str(tmp_path / "employees.snap")
+        save_snapshot(roster, path)
+
+        loaded = load_snapshot(path)
+
+        assert [repr(emp) for emp in loaded] == [repr(emp) for emp in roster]
+        assert isinstance(loaded[2], Manager)
+        with pytest.raises(AttributeError, match="read-only"):
+            loaded[0]._id = "MODIFIED"
+
+    def test_not_a_snapshot(self, mixed_csv):
+        """Test that loading a non-snapshot file raises ValueError."""
+        with pytest.raises(ValueError, match="not an employee snapshot"):
+            load_snapshot(mixed_csv)
+
+    def test_csv_import_export(self, tmp_path, roster):
+        """Test converting between CSV and snapshot files."""
+        csv_path = str(tmp_path / "employees.csv")
+        snap_path = str(tmp_path / "employees.snap")
+        save_employees_to_csv(roster, csv_path)
+
+        assert csv_to_snapshot(csv_path, snap_path) == 3
+        assert snapshot_to_csv(snap_path, csv_path) == 3
+        assert [repr(emp) for emp in load_employees_from_csv(csv_path)] == [repr(emp) for emp in roster]
+
+
+class TestSnapshotReader:
+    """Test cases for memory-mapped snapshot access."""
+
+    @pytest.fixture
+    def roster(self):
+        """Roster whose IDs are not in sorted order."""
+        return [
+            Employee(f"E{n:03d}", "Test", "User", "ENG", f"555000{n:04d}")
+            for n in (7, 3, 11, 1, 5)
+        ] + [Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201")]
+
+    @pytest.fixture
+    def snapshot(self, tmp_path, roster):
+        """Snapshot file holding the roster."""
+        path = str(tmp_path / "employees.snap")
+        save_snapshot(roster, path)
+        return path
+
+    def test_access_by_position(self, snapshot, roster):
+        """Test reading records by position."""
+        with SnapshotReader(snapshot) as reader:
+            assert len(reader) == 6
+            assert repr(reader[1]) == repr(roster[1])
+            assert repr(reader[-1]) == repr(roster[-1])
+            assert [emp.id for emp in reader] == [emp.id for emp in roster]
+            with pytest.raises(IndexError):
+                reader[6]
+
+    def test_access_by_id(self, snapshot, roster):
+        """Test looking records up by ID through the sorted index."""
+        with SnapshotReader(snapshot) as reader:
+            for position, emp in enumerate(roster):
+                assert reader.position_of(emp.id) == position
+            assert reader.find("M001").office_number == "A-201"
+            assert reader.find("E002") is None
+            assert reader.find("Z999") is None
+
+    def test_version_1_file(self, snapshot, tmp_path, roster):
+        """Test that version 1 files without an ID index can still be read."""
+        with open(snapshot, 'rb') as snapfile:
+            data = snapfile.read()
+        header_size, count, strings_offset, string_count, index_offset = read_header(data)
+        records = data[header_size:index_offset]
+        old_header = HEADERS[1].pack(MAGIC, 1, RECORD.size, count, HEADERS[1].size + len(records), string_count)
+        old_path = str(tmp_path / "old.snap")
+        with open(old_path, 'wb') as snapfile:
+            snapfile.write(old_header + records + data[strings_offset:])
+
+        assert [repr(emp) for emp in load_snapshot(old_path)] == [repr(emp) for emp in roster]
+        with SnapshotReader(old_path) as reader:
+            assert reader.find("E005").getphNumber() == "5550000005"
@@ -0,0 +1,205 @@
+"""
+Pytest unit tests for lazy loading.
+
+Run with: pytest test_employee_lazy.py -v
+"""
+
+import subprocess
+import sys
+import pytest
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeData import save_employees_to_csv
+from EmployeeLazy import LazyEmployees
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """CSV file of ten employees, every fifth one a manager, with a journal."""
+    filename = str(tmp_path / "employees.csv")
+    save_employees_to_csv([
+        Manager(f"M{i:03d}", "Test", "User", "ENG", f"555000{i:04d}", i, f"A-{i}") if i % 5 == 0
+        else Employee(f"E{i:03d}", "Test", "User", "ENG", f"555000{i:04d}")
+        for i in range(10)
+    ], filename)
+
+    controller = EmployeeController(filename)
+    controller.load_employees()
+    controller.remove_employee("E001")
+    controller.update_employee("E002", fname="Changed")
+    controller.add_employee(Employee("N001", "New", "Hire", "OPS", "5559990000"))
+    controller.save_employees()
+    controller.close()
+    return filename
+
+
+def open_lazy(filename, **options):
+    """Lazily load a controller from a file."""
+    controller = EmployeeController(filename, lazy=True, **options)
+    assert controller.load_employees()
+    return controller
+
+
+class TestLazyEmployees:
+    """Test cases for the ID index and on-demand building."""
+
+    def test_lookups_follow_journal(self, filename):
+        """Test that lookups build from the file and the journal takes precedence."""
+        lazy = LazyEmployees(filename)
+
+        assert len(lazy) == 10
+        assert lazy.get("M005").team_size == 5
+        assert lazy.get("E002").fname == "Changed"
+        assert lazy.get("E001") is None
+        assert lazy.get("N001").department == "OPS"
+        assert lazy.get("X999") is None
+        assert lazy.journal_entries == 3
+        lazy.close()
+
+    def test_lru_cache(self, filename):
+        """Test that at most cache_size employees stay built, most recently used first."""
+        lazy = LazyEmployees(filename, cache_size=2)
+        first = lazy.get("E003")
+        lazy.get("E004")
+        assert lazy.get("E003") is first
+        lazy.get("E006")
+
+        assert set(lazy.cached()) == {"E003", "E006"}
+        assert lazy.get("E004") is not None
+        lazy.close()
+
+    def test_scan_variants(self, tmp_path):
+        """Test quoted IDs, an id column that is not first, empty files and duplicates."""
+        quoted = tmp_path / "quoted.csv"
+        quoted.write_text('fname,lname,department,phNumber,employee_type,team_size,office_number,id\n'
+                          'Ann,Lee,ENG,5551234567,E,,,"E,1"\n')
+        assert LazyEmployees(str(quoted)).get("E,1").fname == "Ann"
+
+        empty = tmp_path / "empty.csv"
+        empty.write_text("")
+        assert len(LazyEmployees(str(empty))) == 0
+
+        duplicate = tmp_path / "duplicate.csv"
+        duplicate.write_text("id,fname,lname,department,phNumber,employee_type,team_size,office_number\n"
+                             "E1,Ann,Lee,ENG,5551234567,E,,\nE1,Bo,Kim,ENG,5551234568,E,,\n")
+        with pytest.raises(ValueError, match="Duplicate employee ID 'E1'"):
+            LazyEmployees(str(duplicate))
+
+    def test_invalid_row_reported_on_access(self, tmp_path):
+        """Test that an invalid row only fails when it is built."""
+        path = tmp_path / "invalid.csv"
+        path.write_text("id,fname,lname,department,phNumber,employee_type,team_size,office_number\n"
+                        "E1,Ann,Lee,ENG,5551234567,E,,\nE2,Bo,Kim,bad,5551234568,E,,\n")
+        lazy = LazyEmployees(str(path))
+
+        assert lazy.get("E1").fname == "Ann"
+        with pytest.raises(ValueError, match="Invalid employee data"):
+            lazy.get("E2")
+
+
+class TestLazyController:
+    """Test cases for a controller with lazy=True."""
+
+    def test_find_without_full_load(self, filename):
+        """Test that finds are served lazily and the roster is left unloaded."""
+        controller = open_lazy(filename)
+
+        assert controller.find_employee_by_id("E002").fname == "Changed"
+        assert controller.find_employee_by_id("E001") is None
+        controller.save_employees()
+        assert controller._lazy is not None
+        assert len(controller._employee_roster) == 0
+
+    def test_full_load_on_demand(self, filename):
+        """Test that listings load everything, in order, keeping objects already built."""
+        controller = open_lazy(filename)
+        found = controller.find_employee_by_id("E003")
+
+        assert [emp.id for emp in controller.employees] == \
+            ["M000", "E002", "E003", "E004", "M005", "E006", "E007", "E008", "E009", "N001"]
+        assert controller.find_employee_by_id("E003") is found
+        assert controller._lazy is None
+
+    def test_in_place_edits_survive_full_load(self, filename):
+        """Test that edits to a journaled and an evicted employee are kept when everything loads."""
+        controller = open_lazy(filename, cache_size=1)
+        lazy = controller._lazy
+        journaled = controller.find_employee_by_id("E002")
+        evicted = controller.find_employee_by_id("E003")
+        controller.find_employee_by_id("E004")
+        assert set(lazy.cached()) == {"E004"}
+        assert controller.find_employee_by_id("E003") is evicted
+
+        journaled.lname = "Edited"
+        evicted.lname = "Edited"
+        controller.mark_employee_changed("E002")
+        controller.mark_employee_changed("E003")
+        assert lazy.closed and controller._lazy is None
+        controller.save_employees()
+        controller.close()
+
+        fresh = EmployeeController(filename)
+        fresh.load_employees()
+        assert fresh.find_employee_by_id("E002").lname == "Edited"
+        assert fresh.find_employee_by_id("E003").lname == "Edited"
+
+    def test_reload_closes_lazy_index(self, filename):
+        """Test that loading again closes the lazy index it replaces."""
+        controller = open_lazy(filename)
+        lazy = controller._lazy
+        controller.load_employees()
+
+        assert lazy.closed
+        assert controller._lazy is not lazy
+        assert controller.find_employee_by_id("E003").id == "E003"
+
+    def test_invalid_row_when_load_completes(self, tmp_path, monkeypatch, capsys):
+        """Test that an invalid row found when everything loads is reported, not raised, in the menu."""
+        path = tmp_path / "invalid.csv"
+        path.write_text("id,fname,lname,department,phNumber,employee_type,team_size,office_number\n"
+                        "E1,Ann,Lee,ENG,5551234567,E,,\nE2,Bo,Kim,bad,5551234568,E,,\n")
+        monkeypatch.setattr("builtins.input", lambda prompt="": "")
+        controller = open_lazy(str(path))
+        lazy = controller._lazy
+        assert controller.find_employee_by_id("E1").fname == "Ann"
+
+        controller.display_employees()
+        controller.edit_existing_employee()
+        controller.delete_existing_employee()
+
+        output = capsys.readouterr().out
+        assert output.count("Error loading employees:") == 1
+        assert "No employees found" in output
+        assert lazy.closed and controller._lazy is None
+        assert controller.employees == []
+
+    def test_changes_are_saved(self, filename):
+        """Test that a change made in lazy mode loads everything and is saved as usual."""
+        controller = open_lazy(filename)
+        controller.update_employee("E004", department="FIN")
+        controller.save_employees()
+        controller.close()
+
+        fresh = EmployeeController(filename)
+        fresh.load_employees()
+        assert len(fresh.employees) == 10
+        assert fresh.find_employee_by_id("E004").department == "FIN"
+
+    def test_not_imported_until_used(self):
+        """Test that importing the controller does not import the lazy loading module."""
+        imported = subprocess.run(
+            [sys.executable, "-c", "import sys, EmployeeApp; print('EmployeeLazy' in sys.modules)"],
+            capture_output=True, text=True, check=True)
+        assert imported.stdout.strip() == "False"
+
+    def test_other_storage_loads_eagerly(self, tmp_path):
+        """Test that lazy=True falls back to a full load where lazy loading is not supported."""
+        controller = EmployeeController(str(tmp_path / "employees.db"))
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.save_employees()
+        controller.close()
+
+        controller = open_lazy(str(tmp_path / "employees.db"))
+        assert controller._lazy is None
+        assert controller.find_employee_by_id("E001").fname == "John"
+        controller.close()
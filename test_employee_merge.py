@@ -0,0 +1,88 @@
+"""
+Pytest unit tests for the partitioned CSV merge.
+
+Run with: pytest test_employee_merge.py -v
+"""
+
+import os
+import pytest
+from employee import Employee, Manager
+from EmployeeData import load_employees_from_csv, save_employees_to_csv
+from EmployeeJournal import journal_filename
+from EmployeeMerge import merge_csv_files
+
+HEADER = "id,fname,lname,department,phNumber,employee_type,team_size,office_number\n"
+
+
+@pytest.fixture
+def current(tmp_path):
+    """Data CSV with twenty employees and one manager."""
+    path = str(tmp_path / "employees.csv")
+    save_employees_to_csv(
+        [Employee(f"E{i:03d}", "Test", "User", "ENG", f"555000{i:04d}") for i in range(20)]
+        + [Manager("M001", "Jane", "Smith", "ITM", "5559876543", 5, "A-201")],
+        path,
+    )
+    return path
+
+
+@pytest.fixture
+def incoming(tmp_path):
+    """Incoming CSV with an unchanged row, two updates, two inserts and an invalid row."""
+    path = tmp_path / "incoming.csv"
+    path.write_text(
+        HEADER
+        + "E005,Test,User,ENG,5550000005,E,,\n"
+        + "E010,Test,Jones,ENG,5550000010,E,,\n"
+        + "X001,New,Hire,FIN,5551110000,E,,\n"
+        + "M001,Jane,Smith,ITM,5559876543,M,6,A-201\n"
+        + "X002,Bad1,Hire,FIN,5551110001,E,,\n"
+        + "X003,Other,Hire,OPS,(555) 111-0002,E,,\n"
+    )
+    return str(path)
+
+
+class TestMergeCsvFiles:
+    """Test cases for merging files without loading them."""
+
+    @pytest.mark.parametrize("partitions", [1, 4])
+    def test_upsert(self, current, incoming, partitions):
+        """Test counts, order and values for any number of partitions."""
+        rejects = []
+        counts = merge_csv_files(current, incoming, rejects, partitions=partitions)
+
+        assert counts == {'inserted': 2, 'updated': 2, 'unchanged': 1, 'rejected': 1}
+        assert [line for line, _, _ in rejects] == [6]
+        merged = load_employees_from_csv(current)
+        assert [emp.id for emp in merged] == [f"E{i:03d}" for i in range(20)] + ["M001", "X001", "X003"]
+        assert merged[10].lname == "Jones"
+        assert merged[20].team_size == 6
+        assert merged[22].getphNumber() == "5551110002"
+
+    def test_unchanged_file_not_rewritten(self, current, tmp_path):
+        """Test that a merge with nothing new leaves the data file alone."""
+        path = tmp_path / "same.csv"
+        path.write_text(HEADER + "E001,Test,User,ENG,5550000001,E,,\n")
+        before = os.stat(current)
+
+        counts = merge_csv_files(current, str(path))
+
+        assert counts == {'inserted': 0, 'updated': 0, 'unchanged': 1, 'rejected': 0}
+        assert os.stat(current).st_ino == before.st_ino
+        assert sorted(os.listdir(tmp_path)) == ["employees.csv", "same.csv"]
+
+    def test_new_data_file(self, tmp_path, incoming):
+        """Test merging into a data file that does not exist yet."""
+        path = str(tmp_path / "new.csv")
+
+        counts = merge_csv_files(path, incoming, partitions=2)
+
+        assert counts['inserted'] == 5
+        assert [emp.id for emp in load_employees_from_csv(path)] == ["E005", "E010", "X001", "M001", "X003"]
+
+    def test_journal_must_be_compacted(self, current, incoming):
+        """Test that a data file with pending journal entries is refused."""
+        open(journal_filename(current), 'w').close()
+
+        with pytest.raises(ValueError, match="uncompacted journal"):
+            merge_csv_files(current, incoming)
@@ -0,0 +1,108 @@
+"""
+Pytest unit tests for the EmployeeQuery module and controller queries.
+
+Run with: pytest test_employee_query.py -v
+"""
+
+import pytest
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeQuery import query
+from EmployeeView import get_query_options
+
+
+@pytest.fixture
+def employees():
+    """Mixed roster across two departments."""
+    return [
+        Employee("E003", "John", "Doe", "ENG", "5551234567"),
+        Manager("M002", "Jane", "Smith", "ENG", "5559876543", 5, "A-201"),
+        Employee("E001", "Sam", "Dover", "FIN", "5550001111"),
+        Manager("M001", "Ann", "Kim", "ENG", "5550002222", 9, "B-12"),
+        Employee("E002", "Bo", "Park", "ENG", "5550003333"),
+    ]
+
+
+@pytest.fixture
+def controller(tmp_path, employees):
+    """Controller holding the mixed roster."""
+    controller = EmployeeController(str(tmp_path / "employees.csv"))
+    controller.employees = employees
+    return controller
+
+
+class TestQuery:
+    """Test cases for filtering, ordering and projection."""
+
+    def test_filters_keep_input_order(self, employees):
+        """Test department and type filters without a sort."""
+        results = query(employees, department="ENG", employee_type="M")
+        assert [emp.id for emp in results] == ["M002", "M001"]
+        assert [emp.id for emp in query(employees, last_name="DO")] == ["E003", "E001"]
+
+    def test_sort_and_limit(self, employees):
+        """Test that a limited sort matches sorting everything and slicing."""
+        assert [emp.id for emp in query(employees, sort="lname", limit=2)] == ["E003", "E001"]
+        assert [emp.id for emp in query(employees, sort="lname", descending=True, limit=2)] == ["M002", "E002"]
+        assert [emp.id for emp in query(employees, sort="id")] == ["E001", "E002", "E003", "M001", "M002"]
+
+    def test_missing_fields_sort_last(self, employees):
+        """Test that employees without team_size come last in either direction."""
+        ascending = [emp.id for emp in query(employees, sort="team_size")]
+        descending = [emp.id for emp in query(employees, sort="team_size", descending=True)]
+        assert ascending[:2] == ["M002", "M001"]
+        assert descending[:2] == ["M001", "M002"]
+        assert ascending[2:] == descending[2:] == ["E003", "E001", "E002"]
+
+    def test_projection(self, employees):
+        """Test that fields yields dicts, with None where a field doesn't apply."""
+        results = list(query(employees, department="FIN", fields=["id", "employee_type", "team_size"]))
+        assert results == [{"id": "E001", "employee_type": "E", "team_size": None}]
+
+    def test_lazy_and_validated(self):
+        """Test that options are checked at once but the input is only read when consumed."""
+        def source():
+            raise AssertionError("read too early")
+            yield
+
+        results = query(source(), sort="lname")
+        with pytest.raises(AssertionError):
+            next(results)
+        with pytest.raises(ValueError, match="Cannot sort"):
+            query([], sort="salary")
+        with pytest.raises(ValueError, match="Unknown fields"):
+            query([], fields=["id", "salary"])
+        with pytest.raises(ValueError, match="employee_type"):
+            query([], employee_type="X")
+
+
+class TestControllerQuery:
+    """Test cases for queries through the controller's indexes."""
+
+    def test_index_results_match_scan(self, controller, employees):
+        """Test that index lookups return the same employees as a full scan."""
+        for criteria in ({"department": "ENG", "employee_type": "E"}, {"last_name": "d", "department": "ENG"},
+                         {"department": "OPS"}, {"last_name": "k", "sort": "fname"}):
+            found = {emp.id for emp in controller.query(**criteria)}
+            assert found == {emp.id for emp in query(employees, **criteria)}
+
+    def test_index_order(self, controller):
+        """Test that unsorted department results come in ID order."""
+        assert [emp.id for emp in controller.query(department="ENG")] == ["E002", "E003", "M001", "M002"]
+
+    def test_snapshot(self, controller):
+        """Test that changes made while reading results are not seen."""
+        results = controller.query(department="ENG", fields=["id"])
+        controller.remove_employee("E002")
+        controller.add_employee(Employee("E004", "Al", "Roe", "ENG", "5550004444"))
+        assert [row["id"] for row in results] == ["E002", "E003", "M001", "M002"]
+
+    def test_query_options_prompt(self, monkeypatch):
+        """Test that the display prompts build query criteria."""
+        answers = iter(["y", "eng", "m", "-team_size"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+        assert get_query_options() == {"department": "ENG", "employee_type": "M",
+                                       "sort": "team_size", "descending": True}
+
+        monkeypatch.setattr("builtins.input", lambda prompt: "n")
+        assert get_query_options() == {}
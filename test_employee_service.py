@@ -0,0 +1,178 @@
+"""
+Pytest unit tests for the asyncio JSON Lines service.
+
+Run with: pytest test_employee_service.py -v
+"""
+
+import asyncio
+import json
+import threading
+import pytest
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeData import save_employees_to_csv
+from EmployeeService import EmployeeService
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Async-saving controller loaded from a two-employee CSV file."""
+    controller = EmployeeController(str(tmp_path / "employees.csv"), async_saves=True)
+    save_employees_to_csv([
+        Employee("E001", "John", "Doe", "ENG", "5551234567"),
+        Manager("M001", "Jane", "Smith", "ENG", "5559876543", 5, "A-201"),
+    ], controller.filename)
+    controller.load_employees()
+    yield controller
+    controller.close()
+
+
+def reload(controller):
+    """Load a fresh controller from the same file."""
+    fresh = EmployeeController(controller.filename)
+    fresh.load_employees()
+    return fresh
+
+
+async def request(port, *requests):
+    """Send requests on one connection and return the responses."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write("".join(json.dumps(req) + "\n" for req in requests).encode('utf-8'))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def run_with_service(controller, client):
+    """Start a service on a free port, run client(port) against it and stop it."""
+    async def main():
+        service = EmployeeService(controller)
+        server = await service.start(port=0)
+        try:
+            return await client(server.sockets[0].getsockname()[1])
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+
+class TestService:
+    """Test cases for requests over a TCP connection."""
+
+    def test_reads(self, controller):
+        """Test find and list, including a department filter and paging."""
+        responses = run_with_service(controller, lambda port: request(
+            port,
+            {"op": "find", "id": "M001", "req": 1},
+            {"op": "find", "id": "X999"},
+            {"op": "list", "department": "ENG", "offset": 1},
+            {"op": "list", "limit": 0},
+        ))
+
+        assert responses[0] == {"ok": True, "req": 1, "employee": {
+            "id": "M001", "employee_type": "M", "fname": "Jane", "lname": "Smith", "department": "ENG",
+            "ph_number": "5559876543", "team_size": 5, "office_number": "A-201"}}
+        assert responses[1]["ok"] is False and "not found" in responses[1]["error"]
+        assert [record["id"] for record in responses[2]["employees"]] == ["M001"]
+        assert "limit" in responses[3]["error"]
+
+    def test_writes_are_saved(self, controller):
+        """Test create, update and delete responses and that they are on disk once answered."""
+        responses = run_with_service(controller, lambda port: request(
+            port,
+            {"op": "create", "id": "E002", "fname": "Sam", "lname": "Lee", "department": "FIN",
+             "ph_number": "555-000-1111"},
+            {"op": "update", "id": "E002", "department": "OPS"},
+            {"op": "update", "id": "E001", "department": "bad"},
+            {"op": "delete", "id": "M001"},
+        ))
+
+        assert responses[0]["employee"]["ph_number"] == "5550001111"
+        assert responses[1]["employee"]["department"] == "OPS"
+        assert responses[2]["ok"] is False
+        assert responses[3] == {"ok": True}
+        fresh = reload(controller)
+        assert [emp.id for emp in fresh.employees] == ["E001", "E002"]
+        assert fresh.find_employee_by_id("E001").department == "ENG"
+
+    def test_bad_requests(self, controller):
+        """Test that invalid JSON and unknown ops are answered without closing the connection."""
+        async def client(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'not json\n["find"]\n{"op": "drop"}\n{"op": "find", "id": "E001"}\n')
+            responses = [json.loads(await reader.readline()) for _ in range(4)]
+            writer.close()
+            return responses
+
+        responses = run_with_service(controller, client)
+
+        assert [response["ok"] for response in responses] == [False, False, False, True]
+        assert "op must be one of" in responses[2]["error"]
+
+    def test_id_must_be_a_string(self, controller):
+        """Test that a find with a list or object ID is rejected and the connection still answers."""
+        async def client(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'{"op": "find", "id": ["x"]}\n{"op": "find", "id": {"a": 1}}\n'
+                         b'{"op": "find", "id": "E001"}\n')
+            responses = [json.loads(await reader.readline()) for _ in range(3)]
+            writer.close()
+            return responses
+
+        responses = run_with_service(controller, client)
+
+        assert [response.get("error") for response in responses[:2]] == ["id is required", "id is required"]
+        assert responses[2]["employee"]["id"] == "E001"
+
+    def test_department_must_be_a_string(self, controller):
+        """Test that a list with a list department is rejected and the connection still answers."""
+        async def client(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'{"op": "list", "department": ["ENG"]}\n{"op": "list", "department": "ENG"}\n')
+            responses = [json.loads(await reader.readline()) for _ in range(2)]
+            writer.close()
+            return responses
+
+        responses = run_with_service(controller, client)
+
+        assert responses[0] == {"ok": False, "error": "department must be a string"}
+        assert responses[1]["ok"]
+
+    def test_slow_write_does_not_block_reads(self, controller, monkeypatch):
+        """Test that a write is applied off the event loop, so reads are answered meanwhile."""
+        started, release = threading.Event(), threading.Event()
+        apply_operation = controller.apply_operation
+
+        def slow_apply(operation):
+            started.set()
+            release.wait(5)
+            apply_operation(operation)
+        monkeypatch.setattr(controller, "apply_operation", slow_apply)
+
+        async def client(port):
+            write = asyncio.ensure_future(request(port, {"op": "delete", "id": "M001"}))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            read = await request(port, {"op": "find", "id": "M001"})
+            release.set()
+            return read, await write
+
+        (read,), (write,) = run_with_service(controller, client)
+        assert read["employee"]["id"] == "M001"
+        assert write == {"ok": True}
+
+    def test_concurrent_clients(self, controller):
+        """Test many clients writing at once, including to the same ID."""
+        async def client(port):
+            creates = [request(port, {"op": "create", "id": f"C{n:03d}", "fname": "Ann", "lname": "Kim",
+                                      "department": "OPS", "ph_number": f"555{n:07d}"}) for n in range(200)]
+            updates = [request(port, {"op": "update", "id": "M001", "team_size": n}) for n in range(50)]
+            reads = [request(port, {"op": "find", "id": "E001"}) for _ in range(50)]
+            return await asyncio.gather(*creates, *updates, *reads)
+
+        responses = run_with_service(controller, client)
+
+        assert all(response["ok"] for response, in responses)
+        fresh = reload(controller)
+        assert len(fresh.employees) == 202
+        assert fresh.find_employee_by_id("M001").team_size == controller.find_employee_by_id("M001").team_size
@@ -0,0 +1,84 @@
+"""
+Pytest unit tests for the EmployeeStats instrumentation layer.
+
+Run with: pytest test_employee_stats.py -v
+"""
+
+import json
+import logging
+import pytest
+import EmployeeStats
+from employee import Employee
+from EmployeeApp import EmployeeController
+from EmployeeData import load_employees_from_csv, save_employees_to_csv
+
+
+@pytest.fixture
+def stats():
+    """Enable stats for one test, starting from zero."""
+    EmployeeStats.reset()
+    EmployeeStats.enable()
+    yield EmployeeStats
+    EmployeeStats.disable()
+    EmployeeStats.reset()
+
+
+class TestStats:
+    """Test cases for recording and exporting stats."""
+
+    def test_controller_operations(self, stats, tmp_path):
+        """Test that controller operations and journal writes are counted."""
+        controller = EmployeeController(str(tmp_path / "employees.csv"))
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.save_employees()
+        controller.update_employee("E001", lname="Smith")
+        controller.find_employee_by_id("E001")
+        controller.find_employee_by_id("X999")
+        controller.remove_employee("E001")
+        controller.save_employees()
+        controller.close()
+
+        recorded = stats.get_stats()
+        assert {name: recorded[name]['count'] for name in (
+            'controller.create', 'controller.edit', 'controller.find', 'controller.save',
+            'controller.delete', 'data.save_csv', 'journal.append')} == {
+            'controller.create': 1, 'controller.edit': 1, 'controller.find': 2, 'controller.save': 2,
+            'controller.delete': 1, 'data.save_csv': 1, 'journal.append': 1}
+        assert sum(recorded['controller.find']['histogram'].values()) == 2
+        assert recorded['journal.append']['bytes_written'] > 0
+
+    def test_csv_bytes(self, stats, tmp_path):
+        """Test that CSV saves and loads count the bytes of the file."""
+        path = tmp_path / "employees.csv"
+        save_employees_to_csv([Employee("E001", "John", "Doe", "ENG", "5551234567")], str(path))
+        load_employees_from_csv(str(path))
+
+        recorded = stats.get_stats()
+        assert recorded['data.save_csv']['bytes_written'] == path.stat().st_size
+        assert recorded['data.read_csv']['bytes_read'] == path.stat().st_size
+        assert recorded['data.load_csv']['count'] == 1
+
+    def test_disabled_records_nothing(self, tmp_path):
+        """Test that nothing is recorded and methods are unwrapped while disabled."""
+        EmployeeStats.reset()
+        controller = EmployeeController(str(tmp_path / "employees.csv"))
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+
+        assert EmployeeStats.get_stats() == {}
+        assert not hasattr(EmployeeController.find_employee_by_id, '_stats_original')
+
+    def test_json_and_logging(self, stats, tmp_path, caplog):
+        """Test dumping stats as JSON and logging them."""
+        stats.record_call('test.op', 0.002)
+        stats.add_bytes('test.op', read=10)
+        path = tmp_path / "stats.json"
+        stats.dump(str(path))
+
+        data = json.loads(path.read_text())
+        assert data['test.op']['histogram']['<=10ms'] == 1
+        assert data['test.op']['bytes_read'] == 10
+
+        with caplog.at_level(logging.INFO):
+            stats.log_stats(logging.getLogger("employee"))
+        assert caplog.records[0].stats['test.op']['count'] == 1
+        assert caplog.records[0].getMessage().startswith("test.op: 1 calls")
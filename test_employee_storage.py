@@ -0,0 +1,118 @@
+"""
+Pytest unit tests for the storage back ends.
+
+Run with: pytest test_employee_storage.py -v
+"""
+
+import os
+import sqlite3
+import pytest
+from employee import Employee, Manager
+from EmployeeApp import EmployeeController
+from EmployeeJournal import journal_filename
+from EmployeeSQLite import SQLiteStorage
+from EmployeeStorage import FileStorage, open_storage, storage_kind
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Controller on an SQLite database holding two saved employees."""
+    controller = EmployeeController(str(tmp_path / "employees.db"))
+    controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+    controller.add_employee(Manager("M001", "Jane", "Smith", "ENG", "5559876543", 5, "A-201"))
+    controller.save_employees()
+    yield controller
+    controller.close()
+
+
+def reload(controller, **options):
+    """Load a fresh controller from the same file."""
+    fresh = EmployeeController(controller.filename, **options)
+    assert fresh.load_employees()
+    return fresh
+
+
+def table(filename):
+    """Read (seq, id, department) of every row, bypassing the controller."""
+    with sqlite3.connect(filename) as connection:
+        return connection.execute("SELECT seq, id, department FROM employees ORDER BY seq").fetchall()
+
+
+class TestStorageSelection:
+    """Test cases for choosing a back end."""
+
+    def test_by_extension_or_name(self, tmp_path):
+        """Test that the extension picks the back end unless one is named."""
+        assert [storage_kind(name) for name in ("a.csv", "a.snap", "a.db", "a.SQLITE", "a.sqlite3")] == \
+            ["csv", "snapshot", "sqlite", "sqlite", "sqlite"]
+        assert isinstance(open_storage(str(tmp_path / "a.db")), SQLiteStorage)
+        assert isinstance(open_storage(str(tmp_path / "a.csv"), "sqlite"), SQLiteStorage)
+        assert open_storage(str(tmp_path / "a.dat"), "snapshot").snapshot
+        assert isinstance(open_storage(str(tmp_path / "a.dat")), FileStorage)
+        with pytest.raises(ValueError, match="storage must be one of"):
+            EmployeeController(str(tmp_path / "a.csv"), storage="xml")
+
+
+class TestSQLiteStorage:
+    """Test cases for saving and loading through SQLite."""
+
+    def test_round_trip(self, controller):
+        """Test that creates, edits and deletes are saved in place with no journal."""
+        controller.update_employee("E001", department="FIN")
+        controller.add_employee(Employee("E002", "Sam", "Lee", "OPS", "5550001111"))
+        controller.remove_employee("M001")
+        controller.save_employees()
+
+        fresh = reload(controller)
+        assert [(emp.id, emp.department) for emp in fresh.employees] == [("E001", "FIN"), ("E002", "OPS")]
+        assert not os.path.exists(journal_filename(controller.filename))
+
+        fresh.update_employee("E002", fname="Samuel")
+        fresh.save_employees()
+        assert reload(controller).find_employee_by_id("E002").fname == "Samuel"
+        fresh.close()
+
+    def test_changes_update_rows(self, controller):
+        """Test that an edit updates its row without rewriting the others."""
+        before = table(controller.filename)
+        controller.update_employee("E001", department="FIN")
+        controller.save_employees()
+
+        after = table(controller.filename)
+        assert [seq for seq, _, _ in after] == [seq for seq, _, _ in before]
+        assert after[0][2] == "FIN" and after[1] == before[1]
+
+    def test_wal_and_indexes(self, controller):
+        """Test that the database is in WAL mode with ID and department indexes."""
+        with sqlite3.connect(controller.filename) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM employees WHERE department = 'ENG'").fetchall()
+            assert "employees_department" in str(plan)
+            plan = connection.execute("EXPLAIN QUERY PLAN SELECT * FROM employees WHERE id = 'E001'").fetchall()
+            assert "INDEX" in str(plan)
+
+    def test_async_saves(self, controller):
+        """Test that the writer thread can save to the database."""
+        fresh = reload(controller, async_saves=True)
+        for n in range(20):
+            fresh.add_employee(Employee(f"C{n:03d}", "Ann", "Kim", "OPS", f"555{n:07d}"))
+            fresh.save_employees()
+        fresh.close()
+
+        assert len(reload(controller).employees) == 22
+
+    def test_missing_and_failed_writes(self, tmp_path, monkeypatch):
+        """Test that a missing database loads as empty and a failed save leaves the table unchanged."""
+        controller = EmployeeController(str(tmp_path / "new.db"))
+        assert controller.load_employees()
+        assert not os.path.exists(controller.filename)
+
+        controller.add_employee(Employee("E001", "John", "Doe", "ENG", "5551234567"))
+        controller.save_employees()
+        controller.add_employee(Employee("E002", "Sam", "Lee", "OPS", "5550001111"))
+        monkeypatch.setattr("EmployeeSQLite._UPSERT", "INSERT INTO nowhere VALUES (?)")
+        with pytest.raises(IOError, match="Unable to write to database"):
+            controller._persist()
+        controller.close()
+        assert [row[1] for row in table(controller.filename)] == ["E001"]
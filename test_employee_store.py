@@ -0,0 +1,75 @@
+"""
+Pytest unit tests for the columnar EmployeeStore.
+
+Run with: pytest test_employee_store.py -v
+"""
+
+import pytest
+from employee import Employee, Manager
+from EmployeeData import load_employees_from_csv, save_employees_to_csv
+from EmployeeStore import EmployeeStore
+
+
+@pytest.fixture
+def roster():
+    """A small mixed roster of employees and managers."""
+    return [
+        Employee("E001", "John", "Doe", "ENG", "5551234567"),
+        Employee("E002", "Sarah", "Johnson", "MKT", "0552345678"),
+        Manager("M001", "Jennifer", "Smith", "ENG", "5556789012", 8, "A-201"),
+        Manager("M002", "Robert", "Garcia", "ENG", "5557890123", 4, "B-105"),
+        Manager("M003", "Lisa", "Miller", "MKT", "5558901234", 6, "C-302"),
+    ]
+
+
+@pytest.fixture
+def store(roster):
+    """Store built from the roster."""
+    return EmployeeStore.from_employees(roster)
+
+
+class TestEmployeeStore:
+    """Test cases for the columnar store."""
+
+    def test_columns(self, store):
+        """Test that departments are interned and phones packed as integers."""
+        assert len(store) == 5
+        assert store.departments == ["ENG", "MKT"]
+        assert list(store.department_codes) == [0, 1, 0, 0, 1]
+        assert store.phones[1] == 552345678
+        assert list(store.team_sizes) == [-1, -1, 8, 4, 6]
+
+    def test_select(self, store):
+        """Test filtering by department and employee type."""
+        assert store.select(department="ENG") == [0, 2, 3]
+        assert store.select(employee_type="M") == [2, 3, 4]
+        assert store.select(department="ENG", employee_type="E") == [0]
+        assert store.select(department="HRM") == []
+        assert store.select() == [0, 1, 2, 3, 4]
+
+    def test_aggregates(self, store):
+        """Test phone lookup and per-department aggregates."""
+        assert store.phones_in("MKT") == ["0552345678", "5558901234"]
+        assert store.count_by_department() == {"ENG": 3, "MKT": 2}
+        assert store.average_team_size_by_department() == {"ENG": 6.0, "MKT": 6.0}
+
+    def test_materialize(self, store, roster):
+        """Test that records come back as equivalent Employee/Manager objects."""
+        assert [repr(emp) for emp in store] == [repr(emp) for emp in roster]
+        assert isinstance(store.find("M002"), Manager)
+        assert store.find("X999") is None
+
+    def test_duplicate_id_rejected(self, store):
+        """Test that appending a duplicate ID raises ValueError."""
+        with pytest.raises(ValueError, match="already exists"):
+            store.append(Employee("E001", "Jim", "Doe", "ENG", "5551234567"))
+
+    def test_load_from_csv(self, tmp_path, roster):
+        """Test that load_employees_from_csv can populate a store directly."""
+        path = str(tmp_path / "employees.csv")
+        save_employees_to_csv(roster, path)
+
+        store = load_employees_from_csv(path, store=EmployeeStore())
+
+        assert isinstance(store, EmployeeStore)
+        assert store.ids == ["E001", "E002", "M001", "M002", "M003"]
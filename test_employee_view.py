@@ -0,0 +1,157 @@
+"""
+Pytest unit tests for the EmployeeView display functions.
+
+Run with: pytest test_employee_view.py -v
+"""
+
+import io
+import pytest
+import EmployeeView
+from employee import Employee, Manager
+from EmployeeStore import EmployeeStore
+from EmployeeView import (
+    EmployeePages, browse_employees, display_employee_details, display_employee_page,
+    display_employees, format_employee_row, output_to, show_message
+)
+
+
+@pytest.fixture
+def roster():
+    """Roster of 25 employees, every fifth one a manager."""
+    return [
+        Manager(f"M{i:03d}", "Test", "User", "ENG", f"555000{i:04d}", i, f"A-{i}") if i % 5 == 0
+        else Employee(f"E{i:03d}", "Test", "User", "ENG", f"555000{i:04d}")
+        for i in range(25)
+    ]
+
+
+class TestEmployeePages:
+    """Test cases for splitting employees into pages."""
+
+    def test_sequence_pages(self, roster):
+        """Test that lists and stores are paged by position with a known total."""
+        for employees in (roster, EmployeeStore.from_employees(roster)):
+            pages = EmployeePages(employees, page_size=10)
+
+            assert pages.page_count == 3
+            assert [emp.id for emp in pages.page(2)] == [emp.id for emp in roster[20:]]
+            with pytest.raises(IndexError):
+                pages.page(3)
+
+    def test_iterator_is_read_lazily(self, roster):
+        """Test that an iterator is consumed only as far as the requested page."""
+        consumed = []
+
+        def generate():
+            for emp in roster:
+                consumed.append(emp.id)
+                yield emp
+
+        pages = EmployeePages(generate(), page_size=10)
+
+        assert [emp.id for emp in pages.page(0)] == [emp.id for emp in roster[:10]]
+        assert len(consumed) == 11
+        assert pages.total is None
+        assert len(pages.page(2)) == 5
+        assert pages.total == 25
+        assert [emp.id for emp in pages.page(1)] == [emp.id for emp in roster[10:20]]
+
+    def test_invalid_page_size(self, roster):
+        """Test that page sizes below 1 are rejected."""
+        with pytest.raises(ValueError, match="page_size"):
+            EmployeePages(roster, page_size=0)
+
+
+class TestBrowseEmployees:
+    """Test cases for the interactive pager."""
+
+    def test_page_layout(self, roster, capsys):
+        """Test that a page keeps the table columns and numbers rows from the page start."""
+        display_employee_page(EmployeePages(roster, page_size=10), 1, "Roster")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[3].split() == ["#", "ID", "Name", "Dept", "Phone", "Type", "Details"]
+        assert lines[5].split()[:2] == ["11", "M010"]
+        assert lines[-1] == "Page 2 of 3 - Total: 25 employees"
+
+    def test_navigation(self, roster, capsys, monkeypatch):
+        """Test next, previous, jump and quit commands."""
+        commands = iter(["n", "3", "9", "p", "q"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(commands))
+
+        browse_employees(iter(roster), "Roster", page_size=10)
+
+        footers = [line for line in capsys.readouterr().out.splitlines() if line.startswith("Page")]
+        assert footers == [
+            "Page 1 (more employees follow)",
+            "Page 2 (more employees follow)",
+            "Page 3 of 3 - Total: 25 employees",
+            "Page 2 of 3 - Total: 25 employees",
+        ]
+
+
+class TestOutputSink:
+    """Test cases for redirecting and batching view output."""
+
+    def test_table_written_once(self, roster, capsys):
+        """Test that a whole table reaches the target in a single write."""
+        writes = []
+
+        class Recorder(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        with output_to(Recorder()) as target:
+            display_employees(roster, "Roster")
+
+        assert len(writes) == 1
+        assert target.getvalue().splitlines()[-1] == "Total: 25 employees"
+        assert capsys.readouterr().out == ""
+
+    def test_file_target_and_restore(self, roster, tmp_path, capsys):
+        """Test writing reports to a file, then going back to stdout."""
+        path = tmp_path / "report.txt"
+        with open(path, "w") as report, output_to(report):
+            display_employee_details(roster[5])
+        show_message("Done", "success")
+
+        assert "Team Size: 5" in path.read_text()
+        assert capsys.readouterr().out == "\n✓ Done\n"
+
+
+class TestTableRows:
+    """Test cases for formatting table rows."""
+
+    def test_rows_are_cached_until_changed(self, roster, monkeypatch):
+        """Test that a row is formatted once, keeps its own number, and follows edits."""
+        built = []
+        table_row = EmployeeView._table_row
+        monkeypatch.setattr(EmployeeView, "_table_row", lambda emp: built.append(emp.id) or table_row(emp))
+        manager = roster[5]
+
+        first, second = format_employee_row(1, manager), format_employee_row(2, manager)
+        assert first.split() == ["1", "M005", "Test", "User", "ENG", "(555)000-0005", "Manager", "Team:5,", "Office:A-5"]
+        assert second.startswith("2 ") and second[1:] == first[1:]
+        assert built == ["M005"]
+
+        manager.team_size = 7
+        assert "Team:7," in format_employee_row(1, manager)
+        assert built == ["M005", "M005"]
+
+    def test_large_table_reuses_rows(self, monkeypatch):
+        """Test that re-rendering a table of thousands of employees formats each row only once."""
+        built = []
+        table_row = EmployeeView._table_row
+        monkeypatch.setattr(EmployeeView, "_table_row", lambda emp: built.append(emp.id) or table_row(emp))
+        employees = [Employee(f"E{n:05d}", "Test", "User", "ENG", f"555{n:07d}") for n in range(5000)]
+
+        for _ in range(2):
+            with output_to(io.StringIO()) as target:
+                display_employees(employees, "Roster")
+        employees[0].fname = "Changed"
+        with output_to(io.StringIO()) as target:
+            display_employees(employees, "Roster")
+
+        assert len(built) == 5001
+        assert "Changed User" in target.getvalue()